@@ -1,81 +1,201 @@
+import logging
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime, timedelta
+from functools import lru_cache
+
+from robotans.rectitude import START_DATE, MONTHS, days_in_month, get_real_date
+from robotans.ceremonies import CEREMONIES, SPECIAL_DATES, CeremonyIndex, rectitude_ceremony_index
+from month_view import MonthView, cached_month_ceremonies
 
 # Données de base
-start_date = datetime(1972, 1, 1)  # 1er Ordium, An 0 de la Rectitude
-months = [
-    "Ordium", "Fervor", "Laboris", "Prudium", "Valoris",
-    "Constium", "Septium", "Servium", "Fortium", "Decorum",
-    "Rectium", "Finalis", "Jours du Silence"
-]
-
-ceremonies = {
-    # Cérémonies et événements récurrents
-    "1 Ordium": "Cérémonie de la Réinitialisation",
-    "15 Ordium": "Cérémonie de la Fondation",
-    "25 Fervor": "Rite de la Fraternité",
-    "5 Laboris": "Cérémonie des Mains du Travail",
-    "10 Laboris": "Rituel de la Diligence",
-    "15 Prudium": "Rituel de la Vigilance",
-    "18 Valoris": "Honneur aux Méritants",
-    "28 Constium": "Serment de l’Éternelle Fidélité",
-    "5 Septium": "Marche de la Dévotion",
-    "14 Septium": "Jour de la Perfection",
-    "15 Septium": "Anniversaire du Premier Prototype Homo Mecanicus",
-    "18 Servium": "Fête du Service",
-    "20 Fortium": "Fête de la Résilience",
-    "12 Fortium": "Épreuves de Résilience",
-    "10 Decorum": "Semaine de la Rectitude",
-    "15 Decorum": "Rites de la Perfection Esthétique",
-    "30 Decorum": "Cérémonie du Serment de Pureté",
-    "10 Rectium": "Cérémonie des Légataires",
-    "15 Rectium": "Apparition des enfants hybrides",
-    "20 Finalis": "Rite de la Purification",
-    "25 Finalis": "Veillée de la Pureté",
-    "30 Finalis": "La Veillée du Recueillement",
-
-    # Jours du Silence
-    "1 Jours du Silence": "L'Apurement",
-    "2 Jours du Silence": "Les Jours de la Conformité",
-    "3 Jours du Silence": "La Récitation de la Rectitude",
-    "4 Jours du Silence": "Le Jour du Réveil",
-    "5 Jours du Silence": "Le Grand Appurement (année bissextile uniquement)",
-
-    # Dates spéciales (100e, 200e, 300e jours)
-    "10 Laboris": "100e jour de l'année",
-    "20 Fortium": "200e jour de l'année",
-    "30 Decorum": "300e jour de l'année",
-
-    # Dates historiques
-    "1 Ordium, An 0": "Création officielle de la Rectitude (1er janvier 1972)",
-    "8 Fervor, An 20": "Commémoration de la Première Rébellion Contrôlée (8 février 1992)",
-    "15 Septium, An 42": "Premier prototype Homo Mecanicus (15 juillet 2014)",
-    "15 Rectium, An 45": "Naissance des enfants hybrides (15 novembre 2017)"
-}
-
-
-special_dates = {
-    "10 Laboris": "100e jour de l'année",
-    "20 Fortium": "200e jour de l'année",
-    "30 Decorum": "300e jour de l'année",
-}
-
-# Fusion des cérémonies et des dates spéciales
-ceremonies.update(special_dates)
-
-# Conversion des dates de la Rectitude en date réelle
-def get_real_date(an, mois, jour):
-    """Convertir une date de la Rectitude en date réelle."""
-    rectitude_start = start_date
-    days_since_start = (an * 360) + ((mois - 1) * 30) + jour - 1
-    return rectitude_start + timedelta(days=days_since_start)
-
-def is_leap_year(year):
-    """Déterminer si une année est bissextile."""
-    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
-
-class CalendarApp:
+start_date = START_DATE  # 1er Ordium, An 0 de la Rectitude
+months = MONTHS
+
+# Cérémonies et dates spéciales de la Rectitude ; les jours partagés sont journalisés,
+# hors dates spéciales qui tombent volontairement sur une cérémonie
+ceremonies = CEREMONIES
+special_dates = SPECIAL_DATES
+ceremony_index = rectitude_ceremony_index()
+logger = logging.getLogger(__name__)
+for conflict in ceremony_index.conflict_report(expected=special_dates):
+    logger.info(conflict)
+month_ceremonies = cached_month_ceremonies(ceremony_index)
+
+
+# Vue d'ensemble : dimensions en pixels, plage d'années et couleurs de densité
+OVERVIEW_ROW_HEIGHT = 22
+OVERVIEW_HEADER_HEIGHT = 24
+OVERVIEW_LABEL_WIDTH = 90
+OVERVIEW_CELL_WIDTH = 38
+OVERVIEW_YEARS = (0, 10000)
+DENSITY_COLORS = ["white", "#fff3b0", "#ffe066", "#ffc300", "#ff8c00"]
+
+
+@lru_cache(maxsize=8192)
+def month_density(an, mois):
+    """Nombre de cérémonies d'un mois."""
+    return sum(len(events) for events in ceremony_index.month(an, mois))
+
+
+@lru_cache(maxsize=4096)
+def year_density(an):
+    """Nombre de cérémonies d'une année."""
+    return sum(len(events) for events in ceremony_index.year(an))
+
+
+def density_color(count, per_step):
+    """Couleur d'une cellule : un cran de plus tous les `per_step` événements."""
+    return DENSITY_COLORS[min(-(-count // per_step), len(DENSITY_COLORS) - 1)]
+
+
+class OverviewWindow:
+    """
+    Vue d'ensemble par année (une ligne par an, une cellule par mois) ou par
+    décennie (une ligne par décennie, une cellule par an), dessinée sur un seul
+    Canvas. Seules les lignes visibles existent : elles sont recyclées au défilement.
+    """
+    MODES = {
+        # mode : (années par ligne, cellules par ligne, événements par cran de couleur)
+        "Année": (1, len(months), 1),
+        "Décennie": (10, 10, 12),
+    }
+
+    def __init__(self, app):
+        self.app = app
+        self.window = tk.Toplevel(app.root)
+        self.window.title("Vue d'ensemble de la Rectitude")
+
+        controls = tk.Frame(self.window)
+        controls.pack(fill=tk.X)
+        tk.Label(controls, text="Affichage :").pack(side=tk.LEFT, padx=10)
+        self.mode = tk.StringVar(value="Année")
+        tk.OptionMenu(controls, self.mode, *self.MODES, command=self.change_mode).pack(side=tk.LEFT)
+
+        self.scrollbar = tk.Scrollbar(self.window, command=self.on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        width = OVERVIEW_LABEL_WIDTH + len(months) * OVERVIEW_CELL_WIDTH
+        self.canvas = tk.Canvas(self.window, width=width, height=480, bg="white", highlightthickness=0)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.canvas.bind("<Configure>", lambda e: self.redraw())
+        self.canvas.bind("<MouseWheel>", lambda e: self.scroll_by(-e.delta / 120 * 3 * OVERVIEW_ROW_HEIGHT))
+        self.canvas.bind("<Button-4>", lambda e: self.scroll_by(-3 * OVERVIEW_ROW_HEIGHT))
+        self.canvas.bind("<Button-5>", lambda e: self.scroll_by(3 * OVERVIEW_ROW_HEIGHT))
+        self.canvas.bind("<Button-1>", self.on_click)
+
+        self.rows = []
+        self.offset = 0
+        self.change_mode("Année", first_year=app.current_year)
+
+    def change_mode(self, mode, first_year=None):
+        """Change de mode et reconstruit les lignes recyclables et l'en-tête."""
+        if first_year is None:
+            first_year = self.row_year(int(self.offset) // OVERVIEW_ROW_HEIGHT)
+        self.years_per_row, self.cells_per_row, self.per_step = self.MODES[mode]
+        self.mode.set(mode)
+        self.canvas.delete("all")
+        self.rows = []
+
+        # En-tête fixe, dessiné au-dessus des lignes qui défilent
+        self.canvas.create_rectangle(0, 0, 10000, OVERVIEW_HEADER_HEIGHT, fill="lightgrey", outline="", tags="header")
+        for column in range(self.cells_per_row):
+            if mode == "Année":
+                title = "Sil." if column == len(months) - 1 else months[column][:3]
+            else:
+                title = f"+{column}"
+            x = OVERVIEW_LABEL_WIDTH + (column + 0.5) * OVERVIEW_CELL_WIDTH
+            self.canvas.create_text(x, OVERVIEW_HEADER_HEIGHT / 2, text=title, tags="header")
+
+        self.offset = (first_year - OVERVIEW_YEARS[0]) // self.years_per_row * OVERVIEW_ROW_HEIGHT
+        self.scroll_by(0)
+
+    def row_count(self):
+        """Nombre total de lignes dans le mode courant."""
+        return -(-(OVERVIEW_YEARS[1] - OVERVIEW_YEARS[0]) // self.years_per_row)
+
+    def row_year(self, row):
+        """Première année représentée par la ligne `row`."""
+        return OVERVIEW_YEARS[0] + row * self.years_per_row
+
+    def visible_height(self):
+        """Hauteur utile du Canvas, sous l'en-tête."""
+        return max(self.canvas.winfo_height() - OVERVIEW_HEADER_HEIGHT, OVERVIEW_ROW_HEIGHT)
+
+    def cell_density(self, first_year, column):
+        """Nombre de cérémonies d'une cellule."""
+        if self.years_per_row == 1:
+            return month_density(first_year, column + 1)
+        return year_density(first_year + column)
+
+    def ensure_rows(self, count):
+        """Crée les lignes recyclables manquantes (jamais plus que la hauteur visible)."""
+        while len(self.rows) < count:
+            label = self.canvas.create_text(8, 0, anchor="w", text="")
+            cells = [self.canvas.create_rectangle(0, 0, 0, 0, outline="grey") for _ in range(self.cells_per_row)]
+            self.rows.append((label, cells))
+
+    def redraw(self):
+        """Replace les lignes recyclées sur les années visibles."""
+        height = self.visible_height()
+        needed = height // OVERVIEW_ROW_HEIGHT + 2
+        self.ensure_rows(needed)
+
+        first_row, shift = divmod(int(self.offset), OVERVIEW_ROW_HEIGHT)
+        for index, (label, cells) in enumerate(self.rows):
+            row = first_row + index
+            if index >= needed or row >= self.row_count():
+                for item in (label, *cells):
+                    self.canvas.itemconfigure(item, state="hidden")
+                continue
+
+            first_year = self.row_year(row)
+            y = OVERVIEW_HEADER_HEIGHT + index * OVERVIEW_ROW_HEIGHT - shift
+            title = f"An {first_year}" if self.years_per_row == 1 else f"An {first_year}-{first_year + 9}"
+            self.canvas.coords(label, 8, y + OVERVIEW_ROW_HEIGHT / 2)
+            self.canvas.itemconfigure(label, text=title, state="normal")
+            for column, cell in enumerate(cells):
+                x = OVERVIEW_LABEL_WIDTH + column * OVERVIEW_CELL_WIDTH
+                self.canvas.coords(cell, x + 1, y + 1, x + OVERVIEW_CELL_WIDTH - 1, y + OVERVIEW_ROW_HEIGHT - 1)
+                color = density_color(self.cell_density(first_year, column), self.per_step)
+                self.canvas.itemconfigure(cell, fill=color, state="normal")
+
+        self.canvas.tag_raise("header")
+        total = self.row_count() * OVERVIEW_ROW_HEIGHT
+        self.scrollbar.set(self.offset / total, min((self.offset + height) / total, 1.0))
+
+    def scroll_by(self, pixels):
+        """Fait défiler la vue de `pixels` pixels, dans les bornes de la plage d'années."""
+        max_offset = max(self.row_count() * OVERVIEW_ROW_HEIGHT - self.visible_height(), 0)
+        self.offset = min(max(self.offset + pixels, 0), max_offset)
+        self.redraw()
+
+    def on_scrollbar(self, action, amount, unit=None):
+        """Traduit les commandes de la barre de défilement."""
+        if action == "moveto":
+            self.scroll_by(float(amount) * self.row_count() * OVERVIEW_ROW_HEIGHT - self.offset)
+        elif unit == "pages":
+            self.scroll_by(int(amount) * self.visible_height())
+        else:
+            self.scroll_by(int(amount) * OVERVIEW_ROW_HEIGHT)
+
+    def on_click(self, event):
+        """Ouvre le mois cliqué, ou passe de la décennie à l'année cliquée."""
+        if event.y < OVERVIEW_HEADER_HEIGHT or event.x < OVERVIEW_LABEL_WIDTH:
+            return
+        row = int(self.offset + event.y - OVERVIEW_HEADER_HEIGHT) // OVERVIEW_ROW_HEIGHT
+        column = (event.x - OVERVIEW_LABEL_WIDTH) // OVERVIEW_CELL_WIDTH
+        if row >= self.row_count() or column >= self.cells_per_row:
+            return
+        if self.years_per_row == 1:
+            self.app.go_to(self.row_year(row), column)
+        else:
+            self.change_mode("Année", first_year=self.row_year(row) + column)
+
+
+class CalendarApp(MonthView):
+    month_ceremonies = staticmethod(month_ceremonies)
+    ceremonies_title = "Cérémonies et Événements :"
+
     def __init__(self, root):
         self.root = root
         self.root.title("Calendrier de la Rectitude")
@@ -83,7 +203,7 @@ class CalendarApp:
         # Variables
         self.current_month_index = 0
         self.current_year = 0
-        self.custom_events = {}
+        self.custom_events = CeremonyIndex()
 
         # Widgets principaux
         self.header_frame = tk.Frame(root)
@@ -111,91 +231,45 @@ class CalendarApp:
         manage_event_button = tk.Button(self.header_frame, text="Gérer les événements", command=self.manage_event)
         manage_event_button.pack(side=tk.RIGHT, padx=10)
 
+        overview_button = tk.Button(self.header_frame, text="Vue d'ensemble", command=lambda: OverviewWindow(self))
+        overview_button.pack(side=tk.RIGHT, padx=10)
+
         self.month_label = tk.Label(root, text=months[self.current_month_index], font=("Helvetica", 18, "bold"))
         self.month_label.pack(pady=10)
 
-
+        self.build_grid()
 
         # Affichage initial
-        self.show_calendar()
-        self.show_ceremonies()
+        self.refresh_month()
 
     def get_days_in_month(self):
         """Obtenir le nombre de jours dans le mois actuel."""
-        if self.current_month_index < 12:
-            return 30
-        return 5 if is_leap_year(self.current_year + 1972) else 4
-
-    def show_calendar(self):
-        """Afficher le calendrier pour le mois actuel."""
-        for widget in self.calendar_frame.winfo_children():
-            widget.destroy()
-
-        days_in_month = self.get_days_in_month()
-        for day in range(1, days_in_month + 1):
-            day_str = f"{day} {months[self.current_month_index]}"
-            ceremony = ceremonies.get(day_str, "")
-            custom_event = self.custom_events.get(day_str, "")
-
-            # Création d'une cellule de jour
-            day_label = tk.Label(self.calendar_frame, text=f"{day:02d}", width=4, font=("Helvetica", 14))
-            day_label.grid(row=(day - 1) // 7, column=(day - 1) % 7, padx=5, pady=5)
-
-            if ceremony or custom_event:
-                day_label.config(bg="yellow", relief="solid")
-
-    def show_ceremonies(self):
-        """Afficher les cérémonies dans un panneau séparé."""
-        for widget in self.ceremony_frame.winfo_children():
-            widget.destroy()
-
-        tk.Label(self.ceremony_frame, text="Cérémonies et Événements :",
-                 font=("Helvetica", 14, "bold"), bg="lightgrey").pack(anchor="w", padx=10, pady=5)
-
-        days_in_month = self.get_days_in_month()
-        for day in range(1, days_in_month + 1):
-            day_str = f"{day} {months[self.current_month_index]}"
-            ceremony = ceremonies.get(day_str, "")
-            custom_event = self.custom_events.get(day_str, "")
-
-            if ceremony or custom_event:
-                event_text = f"{day:02d} : {ceremony}" if ceremony else f"{day:02d} : {custom_event}"
-                tk.Label(self.ceremony_frame, text=event_text, bg="lightgrey", font=("Helvetica", 12)).pack(anchor="w", padx=10)
-
-    def prev_month(self):
-        """Afficher le mois précédent."""
-        if self.current_month_index > 0:
-            self.current_month_index -= 1
-        else:
-            self.current_month_index = len(months) - 1
-            self.current_year -= 1
-            self.year_label.config(text=f"Année : {self.current_year}")
-        self.month_label.config(text=months[self.current_month_index])
-        self.show_calendar()
-        self.show_ceremonies()
-
-    def next_month(self):
-        """Afficher le mois suivant."""
-        if self.current_month_index < len(months) - 1:
-            self.current_month_index += 1
-        else:
-            self.current_month_index = 0
-            self.current_year += 1
-            self.year_label.config(text=f"Année : {self.current_year}")
-        self.month_label.config(text=months[self.current_month_index])
-        self.show_calendar()
-        self.show_ceremonies()
+        return days_in_month(self.current_year, self.current_month_index + 1)
+
+    def get_month_events(self):
+        """Cérémonies et événements personnalisés de chaque jour du mois actuel."""
+        mois = self.current_month_index + 1
+        return [
+            ceremonies_of_day + custom_of_day
+            for ceremonies_of_day, custom_of_day in zip(
+                self.month_ceremonies(self.current_year, mois),
+                self.custom_events.month(self.current_year, mois)
+            )
+        ]
 
     def add_event(self):
         """Ajouter un événement personnalisé."""
         def save_event():
-            day = int(day_var.get())
+            day = day_var.get().strip()
             event = event_entry.get()
             month = months[self.current_month_index]
-            self.custom_events[f"{day} {month}"] = event
+            try:
+                self.custom_events.add(f"{day} {month}", event)
+            except ValueError as e:
+                messagebox.showerror("Erreur", str(e))
+                return
             add_event_window.destroy()
-            self.show_calendar()
-            self.show_ceremonies()
+            self.refresh_month()
 
         add_event_window = tk.Toplevel(self.root)
         add_event_window.title("Ajouter un événement")
@@ -215,23 +289,19 @@ class CalendarApp:
         def delete_event():
             selected_event = event_listbox.get(tk.ACTIVE)
             if selected_event:
-                day_str = selected_event.split(":")[0].strip()
-                if day_str in self.custom_events:
-                    del self.custom_events[day_str]
-                    del self.custom_events[day_str]
-                    self.show_calendar()
-                    self.show_ceremonies()
+                day_str, event = selected_event.split(" : ", 1)
+                self.custom_events.remove(day_str, event)
+                self.refresh_month()
             manage_event_window.destroy()
 
         def edit_event():
             selected_event = event_listbox.get(tk.ACTIVE)
             if selected_event:
-                day_str = selected_event.split(":")[0].strip()
-                if day_str in self.custom_events:
-                    new_event_text = event_entry.get()
-                    self.custom_events[day_str] = new_event_text
-                    self.show_calendar()
-                    self.show_ceremonies()
+                day_str, event = selected_event.split(" : ", 1)
+                new_event_text = event_entry.get()
+                self.custom_events.remove(day_str, event)
+                self.custom_events.add(day_str, new_event_text)
+                self.refresh_month()
             manage_event_window.destroy()
 
         manage_event_window = tk.Toplevel(self.root)
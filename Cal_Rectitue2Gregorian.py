@@ -1,13 +1,12 @@
-from datetime import datetime, timedelta
 import tkinter as tk
 from tkinter import messagebox
 
+from robotans.rectitude import MONTHS, days_in_month, get_real_date
+from robotans.ceremonies import CeremonyIndex
+from month_view import MonthView, cached_month_ceremonies
+
 # Définition des mois du Calendrier de la Rectitude
-months = [
-    "Ordium", "Fervor", "Laboris", "Prudium", "Valoris",
-    "Constium", "Septium", "Servium", "Fortium", "Decorum",
-    "Rectium", "Finalis", "Jours du Silence"
-]
+months = MONTHS
 
 # Cérémonies importantes
 ceremonies = {
@@ -21,19 +20,21 @@ ceremonies = {
     "4 Jours du Silence": "Le Jour du Réveil",
     "5 Jours du Silence": "Le Grand Appurement (Année bissextile uniquement)"
 }
+ceremony_index = CeremonyIndex(ceremonies)
+month_ceremonies = cached_month_ceremonies(ceremony_index)
 
 # Fonction globale pour convertir une date Rectitude en date grégorienne
 def rectitude_to_gregorian(year, month, day):
     """
     Convertit une date du Calendrier de la Rectitude en une date grégorienne.
     """
-    # Point de départ : 1er janvier 1972
-    start_date = datetime(1972, 1, 1)
-    days_since_start = (year * 360) + ((month - 1) * 30) + (day - 1)
-    return start_date + timedelta(days=days_since_start)
+    # Point de départ : 1er janvier 1972, Jours du Silence inclus
+    return get_real_date(year, month, day)
 
 # Classe principale de l'application
-class CalendarApp:
+class CalendarApp(MonthView):
+    month_ceremonies = staticmethod(month_ceremonies)
+
     def __init__(self, root):
         self.root = root
         self.root.title("Calendrier de la Rectitude")
@@ -67,80 +68,22 @@ class CalendarApp:
         self.month_label.pack(pady=10)
 
         # Afficher le calendrier
-        self.show_calendar()
-        self.show_ceremonies()
+        self.build_grid()
+        self.refresh_month()
 
     def get_days_in_month(self):
         """Retourne le nombre de jours dans le mois courant."""
-        if self.current_month_index < 12:
-            return 30
-        return 5 if self.is_leap_year(self.current_year + 1972) else 4
-
-    def is_leap_year(self, year):
-        """Vérifie si une année est bissextile."""
-        return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
-
-    def show_calendar(self):
-        """Affiche les jours du mois courant dans le calendrier."""
-        for widget in self.calendar_frame.winfo_children():
-            widget.destroy()
+        return days_in_month(self.current_year, self.current_month_index + 1)
 
-        days_in_month = self.get_days_in_month()
-        for day in range(1, days_in_month + 1):
-            day_str = f"{day} {months[self.current_month_index]}"
-            ceremony = ceremonies.get(day_str, "")
-            day_label = tk.Label(self.calendar_frame, text=f"{day:02d}", width=4, font=("Helvetica", 14))
-            day_label.grid(row=(day - 1) // 7, column=(day - 1) % 7, padx=5, pady=5)
-
-            if ceremony:
-                day_label.config(bg="yellow", relief="solid")
-
-            # Ajouter le survol pour afficher la date grégorienne
-            day_label.bind("<Enter>", lambda e, d=day: self.show_gregorian_date(d))
+    def bind_day(self, day_label, day):
+        """Infobulle de la date grégorienne ; le jour d'une cellule ne change jamais."""
+        day_label.bind("<Enter>", lambda e: self.show_gregorian_date(day))
 
     def show_gregorian_date(self, day):
         """Affiche une infobulle avec la date grégorienne équivalente."""
         gregorian_date = rectitude_to_gregorian(self.current_year, self.current_month_index + 1, day)
         self.root.title(f"Date sélectionnée : {day} {months[self.current_month_index]}, An {self.current_year} -> {gregorian_date.strftime('%d %B %Y')}")
 
-    def show_ceremonies(self):
-        """Affiche les cérémonies dans le panneau des cérémonies."""
-        for widget in self.ceremony_frame.winfo_children():
-            widget.destroy()
-
-        tk.Label(self.ceremony_frame, text="Cérémonies et événements :", font=("Helvetica", 14, "bold"), bg="lightgrey").pack(anchor="w", padx=10, pady=5)
-        days_in_month = self.get_days_in_month()
-        for day in range(1, days_in_month + 1):
-            day_str = f"{day} {months[self.current_month_index]}"
-            ceremony = ceremonies.get(day_str, "")
-            if ceremony:
-                tk.Label(self.ceremony_frame, text=f"{day:02d} : {ceremony}", bg="lightgrey", font=("Helvetica", 12)).pack(anchor="w", padx=10)
-
-    def prev_month(self):
-        """Passe au mois précédent."""
-        if self.current_month_index > 0:
-            self.current_month_index -= 1
-        else:
-            self.current_month_index = len(months) - 1
-            self.current_year -= 1
-        self.update_view()
-
-    def next_month(self):
-        """Passe au mois suivant."""
-        if self.current_month_index < len(months) - 1:
-            self.current_month_index += 1
-        else:
-            self.current_month_index = 0
-            self.current_year += 1
-        self.update_view()
-
-    def update_view(self):
-        """Met à jour l'affichage de l'année, du mois et des cérémonies."""
-        self.year_label.config(text=f"Année : {self.current_year}")
-        self.month_label.config(text=months[self.current_month_index])
-        self.show_calendar()
-        self.show_ceremonies()
-
 
 # Lancer l'application
 if __name__ == "__main__":
@@ -1,81 +1,15 @@
 import tkinter as tk
-from itertools import groupby
-
-# Dictionnaire pour associer une lettre à une note de musique avec octaves
-def letter_to_note_with_octave(letter):
-    """Convertit une lettre en note de musique avec octaves."""
-    notes = ['A', 'B', 'C', 'D', 'E', 'F', 'G']
-    letter = letter.upper()
-    if letter.isalpha():
-        index = ord(letter) - ord('A')  # Index de 0 à 25 pour A-Z
-        note = notes[index % 7]  # Sélectionne la note (A à G)
-        octave = (index // 7) + 1  # Calcule l'octave
-        return f"{note}{octave}"
-    return letter  # Conserve les autres caractères tels quels
-
-def cesar_cipher(text, shift=3):
-    """Applique un décalage César de `shift` sur le texte donné."""
-    result = []
-    for char in text.upper():
-        if char.isalpha():
-            shifted_char = chr(((ord(char) - ord('A') + shift) % 26) + ord('A'))
-            result.append(shifted_char)
-        elif char.isdigit():
-            result.append(char)  # Conserve les chiffres
-    return "".join(result)
-
-def group_by_five(text):
-    """Groupe les lettres du texte par blocs de 5."""
-    grouped = " ".join(text[i:i+5] for i in range(0, len(text), 5))
-    return grouped
-
-def reverse_text(text):
-    """Inverse l'ordre des caractères dans le texte."""
-    return text[::-1]
-
-def letter_to_music_with_octave(text):
-    """Convertit chaque lettre en note de musique avec octaves."""
-    return " ".join(letter_to_note_with_octave(char) for char in text if char.isalpha())
-
-def group_words_by_four(text):
-    """Groupe les mots par blocs de 4 avec formatage."""
-    words = text.split()
-    grouped_blocks = [
-        " ".join(words[i:i+4]).capitalize()
-        for i in range(0, len(words), 4)
-    ]
-    return " / ".join(grouped_blocks)
-
-def flash_order(text):
-    """Convertit le texte en format 'Ordre Flash'."""
-    # Supprimer les espaces
-    text = text.replace(" ", "")
-    # Factoriser les lettres consécutives
-    factorized = "".join(
-        f"{char}{len(list(group)) if len(list(group)) > 1 else ''}"
-        for char, group in groupby(text)
-    )
-    # Encadrer avec "!"
-    return f"!{factorized}!"
-
-def convert_to_robotan_language_v1(text):
-    """Convertit le texte en langage de bataille Robotans V1."""
-    ciphered_text = cesar_cipher(text)
-    grouped_text = group_by_five(ciphered_text)
-    return grouped_text
-
-def convert_to_robotan_language_v2(text):
-    """Convertit le texte en langage de bataille Robotans V2 (cryptage renforcé)."""
-    ciphered_text = cesar_cipher(text)
-    reversed_text = reverse_text(ciphered_text)
-    grouped_text = group_by_five(reversed_text)
-    return grouped_text
-
-def convert_to_robotan_language_v3(text):
-    """Convertit le texte en langage de bataille Robotans V3 (notes de musique avec octaves)."""
-    music_text = letter_to_music_with_octave(text)
-    grouped_text = group_words_by_four(music_text)
-    return grouped_text
+
+from robotans.battle import (
+    letter_to_note_with_octave, cesar_cipher, group_by_five, reverse_text,
+    letter_to_music_with_octave, group_words_by_four, flash_order,
+    convert_to_robotan_language_v1, convert_to_robotan_language_v2, convert_to_robotan_language_v3,
+    VERSIONS
+)
+from robotans.live import LiveEncoder, patch_range
+
+PREVIEW_DELAY_MS = 150  # attente après la dernière frappe avant de mettre l'aperçu à jour
+PREVIEW_TITLES = {"v1": "Robotans V1", "v2": "Robotans V2", "v3": "Robotans V3", "flash": "Ordre Flash"}
 
 class RobotanApp:
     def __init__(self, root):
@@ -86,9 +20,16 @@ class RobotanApp:
         self.label_input = tk.Label(root, text="Entrez le texte :", font=("Helvetica", 12))
         self.label_input.pack(pady=10)
 
-        self.text_input = tk.Entry(root, width=50, font=("Helvetica", 12))
+        self.input_var = tk.StringVar()
+        self.input_var.trace_add("write", self.schedule_preview)
+        self.text_input = tk.Entry(root, width=50, font=("Helvetica", 12), textvariable=self.input_var)
         self.text_input.pack(pady=10)
 
+        self.live_var = tk.BooleanVar(value=False)
+        self.live_check = tk.Checkbutton(root, text="Aperçu en direct des quatre versions", font=("Helvetica", 12),
+                                         variable=self.live_var, command=self.toggle_preview)
+        self.live_check.pack(pady=5)
+
         self.convert_button_v1 = tk.Button(root, text="Convertir (Robotans V1)", font=("Helvetica", 12), command=self.convert_text_v1)
         self.convert_button_v1.pack(pady=5)
 
@@ -107,6 +48,18 @@ class RobotanApp:
         self.text_output = tk.Text(root, height=5, width=50, font=("Helvetica", 12), state=tk.DISABLED)
         self.text_output.pack(pady=10)
 
+        # Aperçu en direct : une colonne par version, affichée à la demande
+        self.preview_frame = tk.Frame(root)
+        self.preview_outputs = {}
+        for column, version in enumerate(VERSIONS):
+            tk.Label(self.preview_frame, text=PREVIEW_TITLES[version], font=("Helvetica", 12)).grid(row=0, column=column)
+            output = tk.Text(self.preview_frame, height=8, width=30, font=("Helvetica", 10), state=tk.DISABLED)
+            output.grid(row=1, column=column, padx=5, pady=5)
+            self.preview_outputs[version] = output
+        self.live_encoders = {}
+        self.preview_shown = dict.fromkeys(VERSIONS, "")  # texte affiché dans chaque colonne
+        self.pending_preview = None  # identifiant du `after` en attente
+
     def convert_text_v1(self):
         """Convertit le texte entré en langage de bataille Robotans V1."""
         input_text = self.text_input.get()
@@ -131,6 +84,45 @@ class RobotanApp:
         converted_text = flash_order(input_text)
         self.display_output(converted_text)
 
+    def toggle_preview(self):
+        """Affiche ou masque l'aperçu en direct."""
+        if self.live_var.get():
+            self.live_encoders = {version: LiveEncoder(version) for version in VERSIONS}
+            self.preview_frame.pack(pady=10)
+            self.refresh_preview()
+        else:
+            self.preview_frame.pack_forget()
+            self.live_encoders = {}
+
+    def schedule_preview(self, *args):
+        """Reporte la mise à jour de l'aperçu : une rafale de frappes ne déclenche qu'un encodage."""
+        if not self.live_var.get():
+            return
+        if self.pending_preview is not None:
+            self.root.after_cancel(self.pending_preview)
+        self.pending_preview = self.root.after(PREVIEW_DELAY_MS, self.refresh_preview)
+
+    def refresh_preview(self):
+        """Réencode la fin modifiée du texte et corrige chaque colonne sur place."""
+        self.pending_preview = None
+        text = self.input_var.get()
+        for version, encoder in self.live_encoders.items():
+            try:
+                converted_text = encoder.update(text)
+            except TypeError:
+                converted_text = "Caractère impossible à convertir dans cette version."
+            start, end, replacement = patch_range(self.preview_shown[version], converted_text)
+            if end > start or replacement:
+                self.replace_range(self.preview_outputs[version], start, end, replacement)
+            self.preview_shown[version] = converted_text
+
+    def replace_range(self, output, start, end, text):
+        """Remplace les caractères `start` à `end` du widget `output` par `text`."""
+        output.config(state=tk.NORMAL)
+        output.delete(f"1.0 + {start} chars", f"1.0 + {end} chars")
+        output.insert(f"1.0 + {start} chars", text)
+        output.config(state=tk.DISABLED)
+
     def display_output(self, text):
         """Affiche le texte converti dans le panneau de sortie."""
         self.text_output.config(state=tk.NORMAL)
@@ -1,17 +1,19 @@
-import re
+import os
+import sys
 import json
 import csv
 from tkinter import filedialog, messagebox
 import tkinter as tk
 from tkinter import ttk
-from fpdf import FPDF
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from robotans.rectitude import MONTHS  # noqa: E402
+from robotans.parsers import parse_markdown_events, parse_csv_events, parse_json_events  # noqa: E402
+from robotans.database import LoreDatabase  # noqa: E402
 
 # Mois fictifs du calendrier de la Rectitude
-RECTITUDE_MONTHS = [
-    "Ordium", "Fervor", "Laboris", "Prudium", "Valoris",
-    "Constium", "Septium", "Servium", "Fortium",
-    "Decorum", "Rectium", "Finalis", "Jours du Silence"
-]
+RECTITUDE_MONTHS = MONTHS
 
 
 class RectitudeCalendar:
@@ -43,8 +45,10 @@ class RectitudeCalendar:
         self.edit_button.grid(row=2, column=0, padx=10, pady=10, sticky="w")
 
     def load_file(self):
-        """Charge un fichier (Markdown, CSV ou JSON) et affiche les événements."""
-        self.filepath = filedialog.askopenfilename(filetypes=[("Markdown", "*.md"), ("CSV", "*.csv"), ("JSON", "*.json")])
+        """Charge un fichier (Markdown, CSV, JSON ou base SQLite) et affiche les événements."""
+        self.filepath = filedialog.askopenfilename(
+            filetypes=[("Markdown", "*.md"), ("CSV", "*.csv"), ("JSON", "*.json"), ("Base SQLite", "*.db")]
+        )
         if not self.filepath:
             return
 
@@ -61,6 +65,9 @@ class RectitudeCalendar:
                 with open(self.filepath, "r", encoding="utf-8") as file:
                     data = json.load(file)
                 self.parse_json(data)
+            elif self.filepath.endswith(".db"):
+                with LoreDatabase(self.filepath) as database:
+                    self.parse_database(database)
 
             self.display_events()
         except Exception as e:
@@ -68,33 +75,22 @@ class RectitudeCalendar:
 
     def parse_markdown(self, lines):
         """Parse les lignes Markdown pour extraire les événements."""
-        self.events = {month: [] for month in RECTITUDE_MONTHS}
-        event_pattern = re.compile(r"(\d{1,2})\s+(\w+):\s+(.+)")
-        for line in lines:
-            match = event_pattern.match(line.strip())
-            if match:
-                day, month, description = match.groups()
-                day = int(day)
-                if month in RECTITUDE_MONTHS:
-                    self.events[month].append(f"{day}: {description}")
+        self.events = parse_markdown_events(lines)
 
     def parse_csv(self, reader):
         """Parse un fichier CSV pour extraire les événements."""
-        self.events = {month: [] for month in RECTITUDE_MONTHS}
-        for row in reader:
-            if len(row) >= 3:
-                day, month, description = row[0], row[1], row[2]
-                if month in RECTITUDE_MONTHS:
-                    self.events[month].append(f"{day}: {description}")
+        self.events = parse_csv_events(reader)
 
     def parse_json(self, data):
         """Parse un fichier JSON pour extraire les événements."""
-        self.events = {month: [] for month in RECTITUDE_MONTHS}
-        for month, events in data.items():
-            if month in RECTITUDE_MONTHS:
-                for event in events:
-                    day, description = event["day"], event["description"]
-                    self.events[month].append(f"{day}: {description}")
+        self.events = parse_json_events(data)
+
+    def parse_database(self, database):
+        """Lit les événements d'une base SQLite."""
+        data = {}
+        for _, month, day, event in database.events.find():
+            data.setdefault(month, []).append({"day": day, "description": event["name"]})
+        self.events = parse_json_events(data)
 
     def display_events(self):
         """Affiche les événements par mois."""
@@ -133,12 +129,22 @@ class RectitudeCalendar:
                         for event in events:
                             day, description = event.split(": ")
                             writer.writerow([day, month, description])
+            elif self.filepath.endswith(".db"):
+                # Seuls les événements ajoutés ou supprimés sont écrits
+                with LoreDatabase(self.filepath) as database:
+                    database.events.sync_names(
+                        (month, int(day), description)
+                        for month, events in self.events.items()
+                        for day, description in (event.split(": ", 1) for event in events)
+                    )
             messagebox.showinfo("Succès", "Les événements ont été sauvegardés avec succès.")
         except Exception as e:
             messagebox.showerror("Erreur", f"Impossible de sauvegarder le fichier : {e}")
 
     def export_to_pdf(self):
         """Exporte les événements en PDF."""
+        from fpdf import FPDF
+
         pdf = FPDF(orientation="P", unit="mm", format="A4")
         pdf.add_page()
         pdf.set_font("Arial", size=12)
@@ -1,37 +1,39 @@
-import json
 import os
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-# Fichier JSON pour les factions
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from robotans.database import DATABASE_FILE, DuplicateNameError, LoreDatabase  # noqa: E402
+
+# Fichier JSON des factions, repris dans la base au premier lancement
 FACTIONS_FILE = "factions.json"
 DEFAULT_FACTIONS = ["Rectitude", "Harmonie Synthétique", "Pureté Humaine"]
 
-def load_factions():
-    """Charge les factions depuis le fichier JSON, ou crée un fichier par défaut."""
-    if not os.path.exists(FACTIONS_FILE):
-        with open(FACTIONS_FILE, "w") as file:
-            json.dump(DEFAULT_FACTIONS, file, indent=4)
-        return DEFAULT_FACTIONS
-    with open(FACTIONS_FILE, "r") as file:
-        return json.load(file)
-
-def save_factions(factions):
-    """Enregistre les factions dans le fichier JSON."""
-    with open(FACTIONS_FILE, "w") as file:
-        json.dump(factions, file, indent=4)
+def open_factions(database):
+    """Table des factions de la base, remplie depuis le fichier JSON (ou par défaut) si elle est vide."""
+    return database.factions.fill_once(FACTIONS_FILE, DEFAULT_FACTIONS)
 
 class FactionManagerApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Gestion des Factions")
         
-        # Charger les factions
-        self.factions = load_factions()
+        # Charger les factions ; chaque modification est enregistrée dans la base
+        self.database = LoreDatabase(DATABASE_FILE)
+        self.store = open_factions(self.database)
+        self.factions = self.store.names()
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
 
         # Interface graphique
         self.create_widgets()
 
+    def close(self):
+        """Ferme la base, puis la fenêtre."""
+        self.database.close()
+        self.root.destroy()
+
     def create_widgets(self):
         """Crée les widgets de l'interface."""
         # Liste des factions
@@ -67,11 +69,12 @@ class FactionManagerApp:
         if not new_faction:
             messagebox.showwarning("Champ vide", "Le nom de la faction ne peut pas être vide.")
             return
-        if new_faction in self.factions:
+        try:
+            self.store.add(new_faction)
+        except DuplicateNameError:
             messagebox.showwarning("Doublon", "Cette faction existe déjà.")
             return
         self.factions.append(new_faction)
-        save_factions(self.factions)
         self.refresh_faction_list()
         self.faction_name_entry.delete(0, tk.END)
         messagebox.showinfo("Succès", f"La faction '{new_faction}' a été ajoutée.")
@@ -87,11 +90,12 @@ class FactionManagerApp:
             messagebox.showwarning("Champ vide", "Le nouveau nom de la faction ne peut pas être vide.")
             return
         selected_faction = self.factions[selected_index[0]]
-        if new_name in self.factions and new_name != selected_faction:
+        try:
+            self.store.rename(selected_faction, new_name)
+        except DuplicateNameError:
             messagebox.showwarning("Doublon", "Une faction portant ce nom existe déjà.")
             return
         self.factions[selected_index[0]] = new_name
-        save_factions(self.factions)
         self.refresh_faction_list()
         self.faction_name_entry.delete(0, tk.END)
         messagebox.showinfo("Succès", f"La faction '{selected_faction}' a été modifiée en '{new_name}'.")
@@ -103,7 +107,7 @@ class FactionManagerApp:
             messagebox.showwarning("Aucune sélection", "Veuillez sélectionner une faction à supprimer.")
             return
         selected_faction = self.factions.pop(selected_index[0])
-        save_factions(self.factions)
+        self.store.remove(selected_faction)
         self.refresh_faction_list()
         messagebox.showinfo("Succès", f"La faction '{selected_faction}' a été supprimée.")
 
@@ -1,7 +1,5 @@
 import random
 from tkinter import Tk, Entry, Button, Label, StringVar, OptionMenu, filedialog, messagebox
-import matplotlib.pyplot as plt
-from PIL import Image, ImageDraw, ImageFilter, ImageChops
 
 
 class RectitudeTerminalApp:
@@ -118,6 +116,10 @@ class RectitudeTerminalApp:
 
     def create_image(self, text, save_path):
         """Crée une image à partir du texte donné."""
+        # matplotlib et Pillow ne sont chargés qu'au premier export
+        import matplotlib.pyplot as plt
+        from PIL import Image
+
         style = self.TERMINAL_STYLES[self.current_style]
         text_color = style["text_color"]
         background_color = style["background_color"]
@@ -144,6 +146,8 @@ class RectitudeTerminalApp:
 
     def apply_crt_effects(self, image):
         """Applique les effets CRT."""
+        from PIL import ImageDraw, ImageFilter
+
         width, height = image.size
         draw = ImageDraw.Draw(image)
 
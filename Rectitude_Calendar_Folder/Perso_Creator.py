@@ -1,37 +1,39 @@
-import json
 import os
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-# Fichier JSON pour les personnages
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from robotans.database import DATABASE_FILE, DuplicateNameError, LoreDatabase  # noqa: E402
+
+# Fichier JSON des personnages, repris dans la base au premier lancement
 PERSONS_FILE = "perso.json"
 DEFAULT_PERSONS = ["Conseiller en Ordium", "Joy", "Mik-L", "Zoe"]
 
-def load_persons():
-    """Charge les personnages depuis le fichier JSON, ou crée un fichier par défaut."""
-    if not os.path.exists(PERSONS_FILE):
-        with open(PERSONS_FILE, "w") as file:
-            json.dump(DEFAULT_PERSONS, file, indent=4)
-        return DEFAULT_PERSONS
-    with open(PERSONS_FILE, "r") as file:
-        return json.load(file)
-
-def save_persons(persons):
-    """Enregistre les personnages dans le fichier JSON."""
-    with open(PERSONS_FILE, "w") as file:
-        json.dump(persons, file, indent=4)
+def open_persons(database):
+    """Table des personnages de la base, remplie depuis le fichier JSON (ou par défaut) si elle est vide."""
+    return database.persons.fill_once(PERSONS_FILE, DEFAULT_PERSONS)
 
 class PersonManagerApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Gestion des Personnages")
         
-        # Charger les personnages
-        self.persons = load_persons()
+        # Charger les personnages ; chaque modification est enregistrée dans la base
+        self.database = LoreDatabase(DATABASE_FILE)
+        self.store = open_persons(self.database)
+        self.persons = self.store.names()
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
 
         # Interface graphique
         self.create_widgets()
 
+    def close(self):
+        """Ferme la base, puis la fenêtre."""
+        self.database.close()
+        self.root.destroy()
+
     def create_widgets(self):
         """Crée les widgets de l'interface."""
         # Liste des personnages
@@ -67,11 +69,12 @@ class PersonManagerApp:
         if not new_person:
             messagebox.showwarning("Champ vide", "Le nom du personnage ne peut pas être vide.")
             return
-        if new_person in self.persons:
+        try:
+            self.store.add(new_person)
+        except DuplicateNameError:
             messagebox.showwarning("Doublon", "Ce personnage existe déjà.")
             return
         self.persons.append(new_person)
-        save_persons(self.persons)
         self.refresh_person_list()
         self.person_name_entry.delete(0, tk.END)
         messagebox.showinfo("Succès", f"Le personnage '{new_person}' a été ajouté.")
@@ -87,11 +90,12 @@ class PersonManagerApp:
             messagebox.showwarning("Champ vide", "Le nouveau nom du personnage ne peut pas être vide.")
             return
         selected_person = self.persons[selected_index[0]]
-        if new_name in self.persons and new_name != selected_person:
+        try:
+            self.store.rename(selected_person, new_name)
+        except DuplicateNameError:
             messagebox.showwarning("Doublon", "Un personnage portant ce nom existe déjà.")
             return
         self.persons[selected_index[0]] = new_name
-        save_persons(self.persons)
         self.refresh_person_list()
         self.person_name_entry.delete(0, tk.END)
         messagebox.showinfo("Succès", f"Le personnage '{selected_person}' a été modifié en '{new_name}'.")
@@ -103,7 +107,7 @@ class PersonManagerApp:
             messagebox.showwarning("Aucune sélection", "Veuillez sélectionner un personnage à supprimer.")
             return
         selected_person = self.persons.pop(selected_index[0])
-        save_persons(self.persons)
+        self.store.remove(selected_person)
         self.refresh_person_list()
         messagebox.showinfo("Succès", f"Le personnage '{selected_person}' a été supprimé.")
 
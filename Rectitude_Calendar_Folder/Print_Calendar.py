@@ -1,12 +1,16 @@
-import json
 import os
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet
 
-# Configuration des fichiers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from robotans.rectitude import MONTHS, days_in_month  # noqa: E402
+from robotans.query import EventQuery  # noqa: E402
+from robotans.recurrence import iter_rules  # noqa: E402
+from robotans.database import DATABASE_FILE, LoreDatabase  # noqa: E402
+
+# Configuration des fichiers ; les fichiers JSON sont repris dans la base au premier lancement
 EVENTS_FILE = "events.json"
 FACTIONS_FILE = "factions.json"
 PERSONS_FILE = "perso.json"
@@ -22,34 +26,45 @@ DEFAULT_EVENTS = {
 DEFAULT_FACTIONS = ["Rectitude", "Harmonie Synthétique", "Pureté Humaine"]
 DEFAULT_PERSONS = ["Conseiller en Ordium", "Joy", "Mik-L", "Zoe"]
 
-# Lecture ou création des fichiers JSON
-def load_file(filename, default_content):
-    """Charge un fichier JSON ou crée un fichier par défaut si nécessaire."""
-    if not os.path.exists(filename):
-        with open(filename, "w") as file:
-            json.dump(default_content, file, indent=4)
-        return default_content
-    with open(filename, "r") as file:
-        return json.load(file)
-
 # Création d'une liste d'événements filtrée
-def filter_events(events, factions=None, persons=None, start_month=None, end_month=None):
-    """Filtre les événements par faction, personnage, ou plage de dates."""
+def filter_events(events, factions=None, persons=None, start_month=None, end_month=None,
+                  start_year=None, end_year=None):
+    """
+    Filtre les événements par faction, personnage, ou plage de dates.
+    Si une plage d'années est donnée, les événements récurrents sont développés
+    en une entrée par occurrence, avec leur année.
+    """
+    if start_year is not None and end_year is not None:
+        start = (start_year, MONTHS.index(start_month) + 1 if start_month else 1, 1)
+        end_month_number = MONTHS.index(end_month) + 1 if end_month else len(MONTHS)
+        end = (end_year, end_month_number, days_in_month(end_year, end_month_number))
+        return [
+            {"month": MONTHS[occurrence.date.month - 1], "day": occurrence.date.day,
+             **occurrence.event, "year": occurrence.date.year}
+            for occurrence in EventQuery.from_events(events).between(start, end, factions, persons)
+        ]
+
+    # Sans année, les mois sont comparés dans l'ordre du calendrier
+    first_month = MONTHS.index(start_month) if start_month else 0
+    last_month = MONTHS.index(end_month) if end_month else len(MONTHS) - 1
     filtered = []
-    for month, days in events.items():
-        if start_month and end_month and not (start_month <= month <= end_month):
+    for month, day, event in iter_rules(events):
+        if not first_month < month <= last_month + 1:
+            continue
+        if factions and event.get("faction") not in factions:
             continue
-        for day, event in days.items():
-            if factions and event.get("faction") not in factions:
-                continue
-            if persons and event.get("person") not in persons:
-                continue
-            filtered.append({"month": month, "day": day, **event})
+        if persons and event.get("person") not in persons:
+            continue
+        filtered.append({"month": MONTHS[month - 1], "day": day, **event})
     return filtered
 
 # Exportation d'événements en PDF
 def export_events_to_pdf(events, filename):
     """Exporte les événements sélectionnés dans un fichier PDF."""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet
+
     doc = SimpleDocTemplate(filename, pagesize=A4)
     styles = getSampleStyleSheet()
     elements = []
@@ -58,7 +73,11 @@ def export_events_to_pdf(events, filename):
     elements.append(Spacer(1, 20))
 
     for event in events:
-        details = f"{event['month']} {event['day']}: {event['name']} ({event['recurrence']})"
+        details = f"{event['month']} {event['day']}: {event['name']}"
+        if event.get("recurrence"):
+            details += f" ({event['recurrence']})"
+        if event.get("year") is not None:
+            details = f"An {event['year']}, {details}"
         if event.get("faction"):
             details += f" - Faction : {event['faction']}"
         if event.get("person"):
@@ -76,9 +95,10 @@ class CalendarApp:
         self.root.title("Gestion du Calendrier de la Rectitude")
 
         # Charger les données
-        self.events = load_file(EVENTS_FILE, DEFAULT_EVENTS)
-        self.factions = load_file(FACTIONS_FILE, DEFAULT_FACTIONS)
-        self.persons = load_file(PERSONS_FILE, DEFAULT_PERSONS)
+        with LoreDatabase(DATABASE_FILE) as database:
+            self.events = database.events.fill_once(EVENTS_FILE, DEFAULT_EVENTS).as_dict()
+            self.factions = database.factions.fill_once(FACTIONS_FILE, DEFAULT_FACTIONS).names()
+            self.persons = database.persons.fill_once(PERSONS_FILE, DEFAULT_PERSONS).names()
 
         # Interface principale
         self.create_widgets()
@@ -105,6 +125,16 @@ class CalendarApp:
         for person in self.persons:
             self.persons_list.insert(tk.END, person)
 
+        # Plage d'années de l'export : les événements récurrents y sont développés
+        years_frame = ttk.Frame(self.root)
+        years_frame.grid(row=2, column=1, columnspan=2, padx=10, pady=10)
+        ttk.Label(years_frame, text="De l'An :").pack(side=tk.LEFT)
+        self.start_year_entry = ttk.Entry(years_frame, width=6)
+        self.start_year_entry.pack(side=tk.LEFT, padx=5)
+        ttk.Label(years_frame, text="à l'An :").pack(side=tk.LEFT)
+        self.end_year_entry = ttk.Entry(years_frame, width=6)
+        self.end_year_entry.pack(side=tk.LEFT, padx=5)
+
         # Boutons d'action
         self.export_button = ttk.Button(self.root, text="Exporter en PDF", command=self.export_to_pdf)
         self.export_button.grid(row=2, column=0, padx=10, pady=10)
@@ -114,28 +144,46 @@ class CalendarApp:
         self.events_list.delete(1.0, tk.END)
         for month, days in self.events.items():
             self.events_list.insert(tk.END, f"\n{month}:\n")
-            for day, event in days.items():
-                details = f"  {day}: {event['name']} ({event['recurrence']})"
-                if event.get("faction"):
-                    details += f" - Faction : {event['faction']}"
-                if event.get("person"):
-                    details += f" - Personnage : {event['person']}"
-                self.events_list.insert(tk.END, details + "\n")
+            for day, events in days.items():
+                for event in events:
+                    details = f"  {day}: {event['name']}"
+                    if event.get("recurrence"):
+                        details += f" ({event['recurrence']})"
+                    if event.get("faction"):
+                        details += f" - Faction : {event['faction']}"
+                    if event.get("person"):
+                        details += f" - Personnage : {event['person']}"
+                    self.events_list.insert(tk.END, details + "\n")
 
     def export_to_pdf(self):
         """Exporte les événements sélectionnés."""
         filename = filedialog.asksaveasfilename(defaultextension=".pdf", filetypes=[("PDF files", "*.pdf")])
         if not filename:
             return
-        export_events_to_pdf(self.events_as_list(), filename)
+        events = self.events_as_list()
+        if events is not None:
+            export_events_to_pdf(events, filename)
 
     def events_as_list(self):
-        """Convertit les événements en une liste pour l'export."""
-        event_list = []
-        for month, days in self.events.items():
-            for day, event in days.items():
-                event_list.append({"month": month, "day": day, **event})
-        return event_list
+        """
+        Convertit les événements en une liste pour l'export. Si une plage d'années
+        est saisie, les événements récurrents y sont développés, une entrée par
+        occurrence ; renvoie None si la plage est invalide.
+        """
+        start_year = self.start_year_entry.get().strip()
+        end_year = self.end_year_entry.get().strip()
+        if not start_year and not end_year:
+            return filter_events(self.events)
+        try:
+            start_year = int(start_year or end_year)
+            end_year = int(end_year or start_year)
+        except ValueError:
+            messagebox.showerror("Erreur", "Les années doivent être des nombres entiers.")
+            return None
+        if not 0 <= start_year <= end_year:
+            messagebox.showerror("Erreur", "La plage d'années est invalide.")
+            return None
+        return filter_events(self.events, start_year=start_year, end_year=end_year)
 
 if __name__ == "__main__":
     root = tk.Tk()
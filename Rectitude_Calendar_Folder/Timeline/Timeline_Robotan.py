@@ -1,48 +1,33 @@
-import plotly.graph_objects as go
-import pandas as pd
 import re
 import os
+import sys
 from tkinter import Tk, Toplevel, Label, Entry, Button, Listbox, StringVar, filedialog, messagebox, END, OptionMenu
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from robotans.rectitude import (  # noqa: E402
+    MONTHS, DAYS_PER_MONTH, EXTRA_DAYS_NORMAL, EXTRA_DAYS_LEAP,
+    is_leap_year, from_day_of_year, validate_date, format_date
+)
+from robotans.parsers import parse_timeline_events, format_timeline_event  # noqa: E402
+
 
 class RectitudeCalendar:
-    MONTHS = [
-        "Ordium", "Fervor", "Laboris", "Prudium",
-        "Valoris", "Constium", "Septium", "Servium",
-        "Fortium", "Decorum", "Rectium", "Finalis"
-    ]
+    MONTHS = MONTHS[:12]
 
-    DAYS_PER_MONTH = 30
-    EXTRA_DAYS_NORMAL = 4
-    EXTRA_DAYS_LEAP = 5
+    DAYS_PER_MONTH = DAYS_PER_MONTH
+    EXTRA_DAYS_NORMAL = EXTRA_DAYS_NORMAL
+    EXTRA_DAYS_LEAP = EXTRA_DAYS_LEAP
 
     @staticmethod
     def is_leap_year(year):
         """Détermine si une année est bissextile."""
-        return year % 4 == 0
+        return is_leap_year(year)
 
     @staticmethod
     def date_to_rectitude(year, day_of_year):
-        """Convertit un jour de l'année en date du calendrier de la Rectitude."""
-        is_leap = RectitudeCalendar.is_leap_year(year)
-        days_in_year = len(RectitudeCalendar.MONTHS) * RectitudeCalendar.DAYS_PER_MONTH + (
-            RectitudeCalendar.EXTRA_DAYS_LEAP if is_leap else RectitudeCalendar.EXTRA_DAYS_NORMAL
-        )
-
-        if day_of_year > days_in_year:
-            raise ValueError(f"Jour {day_of_year} hors de l'année {year}.")
-
-        # Calcul du mois et du jour
-        for i, month in enumerate(RectitudeCalendar.MONTHS):
-            if day_of_year <= RectitudeCalendar.DAYS_PER_MONTH:
-                return f"{month} {day_of_year}, AN {year}"
-            day_of_year -= RectitudeCalendar.DAYS_PER_MONTH
-
-        # Gestion des jours du silence
-        if day_of_year <= RectitudeCalendar.EXTRA_DAYS_NORMAL or (is_leap and day_of_year <= RectitudeCalendar.EXTRA_DAYS_LEAP):
-            return f"Jour du Silence {day_of_year - 1}, AN {year}"
-
-        raise ValueError(f"Date invalide pour le jour de l'année {day_of_year}.")
+        """Convertit un jour de l'année en RectitudeDate(year, month, day)."""
+        return from_day_of_year(year, day_of_year)
 
 
 class EventManager:
@@ -67,42 +52,33 @@ class EventManager:
         if not os.path.exists(self.filepath):
             return
         with open(self.filepath, "r", encoding="utf-8") as file:
-            for line in file:
-                line = line.strip()
-                if not line:
-                    continue
-
-                match = re.match(r"AN (.+) - (.+) \| (.+) \| (.+)", line)
-                if match:
-                    date, event_name, category, location = match.groups()
-                    self.categories.add(category)
-                    self.events.append({
-                        "Date": date,
-                        "Event": event_name,
-                        "Category": category,
-                        "Location": location
-                    })
+            for event in parse_timeline_events(file):
+                self.categories.add(event["Category"])
+                self.events.append(event)
 
     def save_events(self):
         """Enregistre les événements dans le fichier Markdown."""
         with open(self.filepath, "w", encoding="utf-8") as file:
             for event in self.events:
-                file.write(f"AN {event['Date']} - {event['Event']} | {event['Category']} | {event['Location']}\n")
+                file.write(format_timeline_event(event) + "\n")
 
 
 class TimelineGenerator:
     def __init__(self, events):
+        # pandas et plotly ne sont chargés qu'à la génération d'une timeline
+        import pandas as pd
+
         self.events = pd.DataFrame(events)
 
     def generate_timeline(self):
         """Génère une timeline interactive avec le calendrier de la Rectitude."""
+        import plotly.graph_objects as go
+
         fig = go.Figure()
 
         if not self.events.empty:
             # Conversion des dates pour respecter le calendrier de la Rectitude
-            self.events["FormattedDate"] = self.events.apply(
-                lambda row: self.format_date(row["Date"]), axis=1
-            )
+            self.events["FormattedDate"] = [self.format_date(date) for date in self.events["Date"]]
 
             self.events["Color"] = self.events["Category"].apply(
                 lambda x: EventManager.CATEGORY_COLORS.get(x, "gray")
@@ -147,10 +123,8 @@ class TimelineGenerator:
         if not match:
             raise ValueError(f"Format de date invalide : {date}")
         year, month, day = map(int, match.groups())
-
-        # Calcul du jour de l'année
-        day_of_year = (month - 1) * RectitudeCalendar.DAYS_PER_MONTH + day
-        return RectitudeCalendar.date_to_rectitude(year, day_of_year)
+        validate_date(year, month, day)
+        return format_date((year, month, day))
 
 
 class EventEditor:
@@ -179,7 +153,7 @@ class EventEditor:
         """Met à jour la liste des événements affichés."""
         self.event_listbox.delete(0, END)
         for event in self.manager.events:
-            self.event_listbox.insert(END, f"AN {event['Date']} - {event['Event']} | {event['Category']} | {event['Location']}")
+            self.event_listbox.insert(END, format_timeline_event(event))
 
     def load_file(self):
         """Charge un nouveau fichier Markdown."""
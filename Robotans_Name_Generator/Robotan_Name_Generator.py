@@ -1,5 +1,7 @@
-import random
-import requests
+import os
+
+from designations import DesignationAllocator, DesignationsExhausted
+from name_cache import DEFAULT_CACHE_DIR, NameCorpusCache
 
 # Predefined API sources or static lists for names based on countries
 name_sources = {
@@ -12,21 +14,24 @@ name_sources = {
     "african": ["Kwame", "Amina", "Chidi", "Fatou", "Tunde", "Adama", "Zubeda", "Nia", "Omari", "Sefu"]
 }
 
-# Function to fetch names from an API
+# Local name corpora, filled in bulk from the API sources and kept between runs
+name_cache = NameCorpusCache(name_sources)
+
+# Designations already handed out, kept between runs so that none is issued twice
+DESIGNATIONS_FILE = os.path.join(os.path.dirname(DEFAULT_CACHE_DIR), "designations.json")
+designations = None  # loaded on first use by load_designations
+
+# Function to load the designations already handed out (read once, on first use)
+def load_designations():
+    global designations
+    if designations is None:
+        designations = DesignationAllocator.load(DESIGNATIONS_FILE)
+    return designations
+
+# Function to fetch names from an API (served from the local name cache)
 def fetch_names_from_api(country, gender):
     try:
-        if country in ["japan", "france", "usa", "india"]:
-            api_url = name_sources[country] + gender
-            response = requests.get(api_url)
-            if response.status_code == 200:
-                data = response.json()
-                # Extract name from API response
-                return [data["results"][0]["name"]["first"].capitalize()]
-            else:
-                print(f"Error fetching names for {country}.")
-                return []
-        else:
-            return name_sources[country]
+        return name_cache.names(country, gender)
     except Exception as e:
         print(f"An error occurred: {e}")
         return []
@@ -37,11 +42,19 @@ def generate_robotan_name(country, gender):
     if not names:
         print("No names available to generate Robotan names.")
         return None
-    
-    # Generate a random name and number
-    name = random.choice(names)
-    number = random.randint(1, 999)  # Generate a two-digit number
-    return f"{name}-{str(number).zfill(3)}"
+
+    try:
+        allocator = load_designations()
+    except ValueError as e:
+        print(f"Cannot read the designations already handed out ({DESIGNATIONS_FILE}): {e}")
+        return None
+
+    # Random name and number, never issued before
+    try:
+        return allocator.allocate(names)
+    except DesignationsExhausted as e:
+        print(e)
+        return None
 
 # Example usage
 def main():
@@ -50,6 +63,7 @@ def main():
     gender = input("Enter the gender for the Robotan (male/female): ").strip().lower()
     name = generate_robotan_name(country, gender)
     if name:
+        load_designations().save(DESIGNATIONS_FILE)
         print(f"Generated Robotan Name: {name}")
 
 if __name__ == "__main__":
@@ -0,0 +1,94 @@
+import asyncio
+import random
+from collections import namedtuple
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from name_cache import fallback_names
+
+BATCH_SIZE = 500          # names requested per API call
+PER_HOST = 4              # requests in flight per host
+RETRIES = 4               # new attempts after a failed request
+BACKOFF_SECONDS = 0.5     # base of the exponential backoff
+TIMEOUT_SECONDS = 10
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Names fetched for a (country, gender) pair; `fallback` is true when they come from the static lists
+FetchResult = namedtuple("FetchResult", ["names", "fallback"])
+
+
+class RetryableError(Exception):
+    pass
+
+
+class AsyncNameFetcher:
+    """
+    Bulk name fetcher for the API sources of `name_sources`.
+
+    All requests share one pooled aiohttp session. A semaphore per host bounds
+    the requests in flight; a failed request (network error, timeout, 429 or
+    5xx) is retried with exponential backoff and full jitter. A pair whose
+    requests all fail gets the static fallback lists instead.
+    """
+
+    def __init__(self, sources, batch_size=BATCH_SIZE, per_host=PER_HOST, retries=RETRIES,
+                 backoff=BACKOFF_SECONDS, timeout=TIMEOUT_SECONDS):
+        self.sources = sources
+        self.batch_size = batch_size
+        self.per_host = per_host
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+
+    def fetch(self, pairs, batches=1):
+        """Synchronous entry point: {(country, gender): FetchResult} for every pair."""
+        return asyncio.run(self.fetch_async(pairs, batches))
+
+    async def fetch_async(self, pairs, batches=1):
+        """Fetch `batches` bulk batches per pair, all pairs at once."""
+        pairs = list(dict.fromkeys(pairs))
+        connector = aiohttp.TCPConnector(limit_per_host=self.per_host)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        semaphores = {}
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            results = await asyncio.gather(*(
+                self._fetch_pair(session, semaphores, country, gender, batches) for country, gender in pairs
+            ))
+        return dict(zip(pairs, results))
+
+    async def _fetch_pair(self, session, semaphores, country, gender, batches):
+        source = self.sources[country]
+        if not isinstance(source, str):
+            return FetchResult(list(source), False)
+        url = source + gender
+        host = urlsplit(url).netloc
+        semaphore = semaphores.setdefault(host, asyncio.Semaphore(self.per_host))
+        batches = await asyncio.gather(
+            *(self._fetch_batch(session, semaphore, url) for _ in range(batches)), return_exceptions=True
+        )
+        names = list(dict.fromkeys(
+            name for batch in batches if not isinstance(batch, BaseException) for name in batch
+        ))
+        if not names:
+            print(f"Error fetching names for {country}, using the static lists instead.")
+            return FetchResult(fallback_names(self.sources), True)
+        return FetchResult(names, False)
+
+    async def _fetch_batch(self, session, semaphore, url):
+        params = {"results": self.batch_size, "inc": "name", "noinfo": ""}
+        for attempt in range(self.retries + 1):
+            try:
+                async with semaphore:
+                    async with session.get(url, params=params) as response:
+                        if response.status in RETRY_STATUSES:
+                            raise RetryableError(f"HTTP {response.status}")
+                        response.raise_for_status()
+                        data = await response.json(content_type=None)
+                return [result["name"]["first"].capitalize() for result in data["results"]]
+            except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError,
+                    RetryableError):
+                if attempt == self.retries:
+                    raise
+            # Full jitter: a random wait up to the exponential bound, outside the semaphore
+            await asyncio.sleep(random.uniform(0, self.backoff * 2 ** attempt))
@@ -0,0 +1,201 @@
+import base64
+import json
+import os
+import random
+import re
+import tempfile
+
+NUMBERS = 999  # designations Name-001 to Name-999 per base name
+BITMAP_BYTES = (NUMBERS + 7) // 8
+# Multipliers of the per-name permutation: coprime with 999 = 3^3 * 37
+MULTIPLIERS = [a for a in range(1, NUMBERS) if a % 3 and a % 37]
+DESIGNATION_PATTERN = re.compile(r"(.+)-(\d{3})")
+STATE_VERSION = 1
+DIRECT_DRAWS = 8  # random picks tried by `allocate` before listing the free names
+
+
+class DesignationsExhausted(Exception):
+    """Every Name-NNN designation of the requested base names is taken."""
+
+
+class _NameState:
+    """
+    Designations of one base name: a permutation of the 999 numbers
+    (n -> (a * n + b) mod 999) walked by a cursor, and a bitmap of the taken numbers.
+    The cursor moves by `stride` positions: shard k of K walks positions k, k + K...
+    """
+
+    __slots__ = ("a", "b", "cursor", "stride", "taken", "bitmap")
+
+    def __init__(self, a, b, cursor=0, stride=1, taken=0, bitmap=None):
+        self.a = a
+        self.b = b
+        self.cursor = cursor
+        self.stride = stride
+        self.taken = taken
+        self.bitmap = bitmap if bitmap is not None else bytearray(BITMAP_BYTES)
+
+    def is_taken(self, number):
+        return self.bitmap[number >> 3] >> (number & 7) & 1
+
+    def take(self, number):
+        self.bitmap[number >> 3] |= 1 << (number & 7)
+        self.taken += 1
+
+    @property
+    def exhausted(self):
+        return self.cursor >= NUMBERS or self.taken >= NUMBERS
+
+    def draw(self):
+        """Next free number of the permutation (0 to 998), or None once all are taken."""
+        while not self.exhausted:
+            # Only numbers reserved out of order are skipped, each at most once
+            number = (self.a * self.cursor + self.b) % NUMBERS
+            self.cursor += self.stride
+            if not self.is_taken(number):
+                self.take(number)
+                return number
+        return None
+
+
+class DesignationAllocator:
+    """
+    Hands out unique `Name-NNN` designations from the whole name x 999 space.
+
+    Each base name walks its own random permutation of the numbers, so a draw
+    is O(1) with no retry on collisions; a 125-byte bitmap per name records
+    the taken numbers, including those reserved with `reserve`. The state is
+    saved to and loaded from a JSON file between runs.
+
+    With a `seed`, the permutation of each name depends only on the seed and
+    the name. Allocators with the same seed and `shards` but different
+    `shard` numbers walk disjoint positions of the same permutations: they
+    never hand out the same designation, so they can run in separate processes.
+    """
+
+    def __init__(self, seed=None, shard=0, shards=1):
+        if not 0 <= shard < shards:
+            raise ValueError(f"Invalid shard {shard} of {shards}")
+        self.seed = seed
+        self.shard = shard
+        self.shards = shards
+        self.rng = random.Random(seed)
+        self._names = {}  # base name -> _NameState
+
+    def _state(self, name):
+        state = self._names.get(name)
+        if state is None:
+            rng = self.rng if self.seed is None else random.Random(f"{self.seed}/{name}")
+            state = self._names[name] = _NameState(
+                rng.choice(MULTIPLIERS), rng.randrange(NUMBERS), self.shard, self.shards
+            )
+        return state
+
+    def remaining(self, name):
+        """Designations still free for the base name `name`."""
+        state = self._names.get(name)
+        return NUMBERS - state.taken if state is not None else NUMBERS
+
+    def issued(self):
+        """Number of designations taken, over all base names."""
+        return sum(state.taken for state in self._names.values())
+
+    def is_taken(self, designation):
+        name, number = _parse(designation)
+        state = self._names.get(name)
+        return bool(state is not None and state.is_taken(number))
+
+    def reserve(self, designation):
+        """Marks an existing designation (e.g. `Zoe-042`) as taken. Returns False if it already was."""
+        name, number = _parse(designation)
+        state = self._state(name)
+        if state.is_taken(number):
+            return False
+        state.take(number)
+        return True
+
+    def allocate(self, names):
+        """A new designation on a random base name of the sequence `names`."""
+        # A few direct draws first, in O(1) whatever the number of names; the
+        # full candidate list is only built when they all hit exhausted names
+        for _ in range(DIRECT_DRAWS if names else 0):
+            name = self.rng.choice(names)
+            number = self._state(name).draw()
+            if number is not None:
+                return f"{name}-{number + 1:03d}"
+        return next(self.allocate_many(names, 1))
+
+    def allocate_many(self, names, count):
+        """
+        Generates `count` new designations, each on a random base name of `names`
+        that still has free numbers. Raises `DesignationsExhausted` when none is left.
+        """
+        # States are only created for the names actually drawn: exhausted names
+        # leave the candidates when drawn, so a draw stays O(1) and the state
+        # file only holds the names in use
+        candidates = list(dict.fromkeys(names))
+        randrange = self.rng.randrange
+        produced = 0
+        while produced < count:
+            if not candidates:
+                raise DesignationsExhausted(f"All {NUMBERS} designations of the {len(set(names))} base names are taken.")
+            index = randrange(len(candidates))
+            name = candidates[index]
+            state = self._state(name)
+            number = state.draw()
+            if state.exhausted:
+                # Exhausted names leave the candidates by swap-remove, in O(1)
+                candidates[index] = candidates[-1]
+                candidates.pop()
+            if number is None:
+                # Already exhausted, possibly through another generator sharing the name
+                continue
+            produced += 1
+            yield f"{name}-{number + 1:03d}"
+
+    def save(self, path):
+        """Writes the state to `path`, atomically."""
+        data = {
+            "version": STATE_VERSION,
+            "seed": self.seed,
+            "shard": [self.shard, self.shards],
+            "names": {
+                name: [state.a, state.b, state.cursor, state.taken, base64.b64encode(state.bitmap).decode("ascii")]
+                for name, state in self._names.items()
+            },
+        }
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path, seed=None):
+        """
+        Allocator with the state saved in `path` (a fresh one if the file does not exist).
+        The saved seed is kept; a different `seed` raises ValueError.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return cls(seed)
+        if data.get("version") != STATE_VERSION:
+            raise ValueError(f"Unsupported designation state version in {path}: {data.get('version')}")
+        saved_seed = data.get("seed")
+        if seed is not None and saved_seed is not None and seed != saved_seed:
+            raise ValueError(f"{path} was saved with seed {saved_seed!r}, not {seed!r}")
+        shard, shards = data.get("shard", (0, 1))
+        allocator = cls(saved_seed if seed is None else seed, shard, shards)
+        for name, (a, b, cursor, taken, bitmap) in data["names"].items():
+            allocator._names[name] = _NameState(a, b, cursor, shards, taken, bytearray(base64.b64decode(bitmap)))
+        return allocator
+
+
+def _parse(designation):
+    match = DESIGNATION_PATTERN.fullmatch(designation)
+    if match is None or not 1 <= int(match.group(2)) <= NUMBERS:
+        raise ValueError(f"Invalid designation: {designation} (expected Name-001 to Name-{NUMBERS})")
+    return match.group(1), int(match.group(2)) - 1
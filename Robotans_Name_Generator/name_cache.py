@@ -0,0 +1,197 @@
+import gzip
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+import requests
+
+# Where the name corpora are kept between runs (one gzip file per country and gender)
+DEFAULT_CACHE_DIR = os.environ.get(
+    "ROBOTANS_NAME_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "robotans", "names")
+)
+BATCH_SIZE = 500            # names requested per API call (randomuser.me accepts up to 5000)
+MAX_NAMES = 5000            # names kept per corpus, refreshes are merged into it
+TTL_SECONDS = 7 * 24 * 3600  # a corpus older than this is refreshed in the background
+MAX_CORPORA = 32            # corpora kept in memory and on disk (least recently used are evicted)
+RETRY_SECONDS = 300         # wait after a failed background refresh before trying again
+TIMEOUT_SECONDS = 10
+# Static lists used when the remote API is down
+FALLBACK_COUNTRIES = ("arab", "kabyle", "african")
+
+
+def fallback_names(sources):
+    """Names of the static lists, used when the remote API is down."""
+    return list(dict.fromkeys(name for country in FALLBACK_COUNTRIES for name in sources.get(country, ())))
+
+
+class NameCorpusCache:
+    """
+    Local corpus of first names per (country, gender), served from memory.
+
+    A corpus is filled with one bulk request (`results=N`) and stored as a gzip
+    file of one name per line; its modification time is the fetch time. A stale
+    corpus keeps being served while a background thread refreshes it, so only
+    the very first use of a (country, gender) pair waits for the network, and
+    falls back to the static lists when the API is down. After a failed
+    refresh, the next one waits `retry_after` seconds. `warm` fills many
+    pairs at once with the asynchronous fetcher. Static lists from `sources`
+    are served as they are.
+    """
+
+    def __init__(self, sources, cache_dir=DEFAULT_CACHE_DIR, batch_size=BATCH_SIZE, ttl=TTL_SECONDS,
+                 max_corpora=MAX_CORPORA, max_names=MAX_NAMES, retry_after=RETRY_SECONDS, session=None):
+        self.sources = sources
+        self.cache_dir = cache_dir
+        self.batch_size = batch_size
+        self.ttl = ttl
+        self.max_corpora = max_corpora
+        self.max_names = max_names
+        self.retry_after = retry_after
+        self.session = session or requests.Session()
+        self._corpora = OrderedDict()  # (country, gender) -> (fetch time, names)
+        self._refreshing = {}          # (country, gender) -> background thread
+        self._failed = {}              # (country, gender) -> time of the last failed refresh
+        self._lock = threading.Lock()
+
+    def names(self, country, gender):
+        """Names for the pair, from memory, then disk, then (first use only) the API."""
+        source = self.sources[country]
+        if not isinstance(source, str):
+            return source
+        key = (country, gender)
+        with self._lock:
+            entry = self._corpora.get(key)
+            if entry is not None:
+                self._corpora.move_to_end(key)
+        if entry is None:
+            entry = self._load(key)
+        if entry is None:
+            try:
+                return self.refresh(country, gender)
+            except (requests.RequestException, ValueError, KeyError) as e:
+                print(f"Error fetching names for {country}: {e}, using the static lists instead.")
+                return fallback_names(self.sources)
+        fetched, names = entry
+        if time.time() - fetched > self.ttl:
+            self._refresh_in_background(key)
+        return names
+
+    def refresh(self, country, gender):
+        """Fetch a batch of names, merge it into the corpus and store it. Returns the names."""
+        return self._merge((country, gender), self._fetch(country, gender))
+
+    def _merge(self, key, fetched):
+        with self._lock:
+            entry = self._corpora.get(key)
+        previous = entry[1] if entry is not None else ()
+        # The new batch first, then the older names, up to `max_names`
+        names = sorted(fetched) + [name for name in previous if name not in fetched]
+        names = names[:self.max_names]
+        self._store(key, names)
+        self._remember(key, (time.time(), names))
+        return names
+
+    def warm(self, pairs, batches=1, **options):
+        """
+        Fill the corpora of (country, gender) pairs that have none yet, e.g. before
+        going offline: `batches` bulk requests per pair, all pairs concurrently.
+        `options` are passed to `AsyncNameFetcher`.
+        """
+        missing = [
+            (country, gender) for country, gender in pairs
+            if isinstance(self.sources[country], str) and self._load((country, gender)) is None
+        ]
+        if not missing:
+            return
+        try:
+            # Imported here: aiohttp is only needed to fill missing corpora
+            from async_fetcher import AsyncNameFetcher
+        except ImportError:
+            return  # without aiohttp, `names` fills each pair on first use
+
+        fetcher = AsyncNameFetcher(self.sources, self.batch_size, **options)
+        for key, result in fetcher.fetch(missing, batches).items():
+            # The static fallback lists are not stored as a corpus
+            if not result.fallback:
+                self._merge(key, result.names)
+
+    def wait(self):
+        """Wait for the background refreshes in progress."""
+        with self._lock:
+            threads = list(self._refreshing.values())
+        for thread in threads:
+            thread.join()
+
+    def _fetch(self, country, gender):
+        url = self.sources[country] + gender
+        response = self.session.get(url, params={"results": self.batch_size, "inc": "name", "noinfo": ""},
+                                    timeout=TIMEOUT_SECONDS)
+        response.raise_for_status()
+        names = {result["name"]["first"].capitalize() for result in response.json()["results"]}
+        if not names:
+            raise ValueError("empty batch")
+        return names
+
+    def _refresh_in_background(self, key):
+        with self._lock:
+            if key in self._refreshing or time.time() - self._failed.get(key, 0) < self.retry_after:
+                return
+            thread = self._refreshing[key] = threading.Thread(target=self._background_refresh, args=key, daemon=True)
+        thread.start()
+
+    def _background_refresh(self, country, gender):
+        try:
+            self.refresh(country, gender)
+        except (requests.RequestException, ValueError, KeyError):
+            # Still offline: the stale corpus stays in use until the next try
+            with self._lock:
+                self._failed[(country, gender)] = time.time()
+        else:
+            with self._lock:
+                self._failed.pop((country, gender), None)
+        finally:
+            with self._lock:
+                del self._refreshing[(country, gender)]
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._corpora[key] = entry
+            self._corpora.move_to_end(key)
+            while len(self._corpora) > self.max_corpora:
+                self._corpora.popitem(last=False)
+
+    def _path(self, key):
+        country, gender = (re.sub(r"[^a-z0-9_-]", "_", part.lower()) for part in key)
+        return os.path.join(self.cache_dir, f"{country}-{gender or 'any'}.txt.gz")
+
+    def _load(self, key):
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as file:
+                names = file.read().split("\n")
+            fetched = os.path.getmtime(path)
+            # The access time records the last use, for the eviction of old corpora
+            os.utime(path, (time.time(), fetched))
+        except OSError:
+            return None
+        entry = (fetched, [name for name in names if name])
+        self._remember(key, entry)
+        return entry
+
+    def _store(self, key, names):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Written next to the final file then renamed, so readers never see half a corpus
+        descriptor, temporary = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as file:
+            file.write("\n".join(names))
+        os.replace(temporary, self._path(key))
+        self._evict_files()
+
+    def _evict_files(self):
+        paths = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir) if name.endswith(".txt.gz")]
+        paths.sort(key=os.path.getatime)
+        for path in paths[:max(0, len(paths) - self.max_corpora)]:
+            os.remove(path)
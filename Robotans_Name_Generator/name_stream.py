@@ -0,0 +1,148 @@
+import argparse
+import contextlib
+import itertools
+import os
+import random
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from designations import DesignationAllocator, DesignationsExhausted
+from Robotan_Name_Generator import name_cache, name_sources
+
+BLOCK_SIZE = 10_000               # designations joined and written at once
+BUFFER_BYTES = 1 << 20            # output buffer
+DEFAULT_MIX = "france:female,france:male"
+
+
+def parse_mix(text):
+    """
+    Parse a mix like `japan:female=2,france:male` into [((country, gender), weight)].
+    A missing weight counts as 1.
+    """
+    mix = []
+    for item in text.split(","):
+        pair, _, weight = item.strip().partition("=")
+        country, _, gender = pair.partition(":")
+        country, gender = country.strip().lower(), gender.strip().lower()
+        if country not in name_sources:
+            raise ValueError(f"Unknown country in the mix: {country!r} (expected one of {', '.join(name_sources)})")
+        if gender not in ("male", "female"):
+            raise ValueError(f"Unknown gender in the mix: {gender!r} (expected male or female)")
+        weight = float(weight) if weight else 1.0
+        if weight <= 0:
+            raise ValueError(f"The weight of {pair} must be positive")
+        mix.append(((country, gender), weight))
+    return mix
+
+
+def corpus_names(mix):
+    """Base names of every pair of the mix, read once so that all shards share the same corpora."""
+    # The cache reports network errors on stdout, which may be the output of the names
+    with contextlib.redirect_stdout(sys.stderr):
+        name_cache.warm([pair for pair, _ in mix])
+        return {pair: list(name_cache.names(*pair)) for pair, _ in mix}
+
+
+def generate_names(mix, count, seed, names, shard=0, shards=1):
+    """
+    Generates `count` unique designations, each on a (country, gender) pair drawn
+    by the weights of `mix`. The output depends only on the arguments: shards of
+    the same seed draw from disjoint designations and from their own pair sequence.
+    """
+    allocator = DesignationAllocator(seed, shard, shards)
+    rng = random.Random(f"{seed}/mix/{shard}/{shards}")
+    pairs = [pair for pair, _ in mix]
+    cum_weights = list(itertools.accumulate(weight for _, weight in mix))
+    streams = [allocator.allocate_many(names[pair], count) for pair in pairs]
+    indexes = range(len(pairs))
+    for start in range(0, count, BLOCK_SIZE):
+        # The pairs are drawn a block at a time
+        for index in rng.choices(indexes, cum_weights=cum_weights, k=min(BLOCK_SIZE, count - start)):
+            yield next(streams[index])
+
+
+def write_names(designations, file):
+    """Writes the designations one per line, `BLOCK_SIZE` lines per write. Returns how many were written."""
+    written = 0
+    while True:
+        block = list(itertools.islice(designations, BLOCK_SIZE))
+        if not block:
+            return written
+        file.write("\n".join(block) + "\n")
+        written += len(block)
+
+
+def shard_counts(count, shards):
+    """Designations of each shard: `count` split as evenly as possible."""
+    share, extra = divmod(count, shards)
+    return [share + (shard < extra) for shard in range(shards)]
+
+
+def _write_shard(mix, count, seed, names, shard, shards, path):
+    with open(path, "w", encoding="utf-8", buffering=BUFFER_BYTES) as file:
+        return write_names(generate_names(mix, count, seed, names, shard, shards), file)
+
+
+def stream_names(mix, count, seed, output, processes=1, names=None):
+    """
+    Writes `count` designations to the text file `output`. With several processes,
+    each one writes its shard to a temporary file, copied to `output` in shard order.
+    `names` defaults to the corpora of the name cache.
+    """
+    if names is None:
+        names = corpus_names(mix)
+    if processes <= 1:
+        return write_names(generate_names(mix, count, seed, names), output)
+    counts = shard_counts(count, processes)
+    with tempfile.TemporaryDirectory(prefix="robotan-names-") as directory:
+        paths = [os.path.join(directory, f"shard-{shard}.txt") for shard in range(processes)]
+        with ProcessPoolExecutor(processes) as executor:
+            futures = [
+                executor.submit(_write_shard, mix, counts[shard], seed, names, shard, processes, paths[shard])
+                for shard in range(processes)
+            ]
+            written = sum(future.result() for future in futures)
+        output.flush()
+        for path in paths:
+            with open(path, "r", encoding="utf-8") as file:
+                shutil.copyfileobj(file, output, BUFFER_BYTES)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate unique Robotan names in bulk, reproducibly from a seed.")
+    parser.add_argument("count", type=int, help="number of names to generate")
+    parser.add_argument("--seed", default="robotans", help="seed of the generation (same seed, same names)")
+    parser.add_argument("--mix", default=DEFAULT_MIX,
+                        help="weighted country:gender pairs, e.g. japan:female=2,france:male (default: %(default)s)")
+    parser.add_argument("--output", default="-", help="output file, '-' for stdout (default)")
+    parser.add_argument("--processes", type=int, default=1,
+                        help="shards generated in parallel; the names depend on the seed and this number")
+    args = parser.parse_args(argv)
+    if args.count < 0 or args.processes < 1:
+        parser.error("count must be positive and processes at least 1")
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", buffering=BUFFER_BYTES)
+    try:
+        stream_names(mix, args.count, args.seed, output, args.processes)
+    except DesignationsExhausted as e:
+        print(f"Not enough base names for {args.count} designations: {e}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # The reader stopped early (e.g. `| head`)
+        sys.stderr.close()
+        return 0
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""
+Benchmark : récupération asynchrone des prénoms (`AsyncNameFetcher`) contre
+un serveur local qui imite randomuser.me (benchmarks/name_api_stub.py).
+
+Le débit est mesuré pour une concurrence par hôte croissante, à latence
+simulée fixe ; le script vérifie ensuite les nouvelles tentatives après des
+erreurs 503 et le repli sur les listes statiques quand le serveur est coupé.
+
+Usage : python benchmarks/bench_async_fetch.py [lots_par_paire]
+"""
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(HERE, "..", "Robotans_Name_Generator")))
+
+from name_api_stub import NameApiStub  # noqa: E402
+from async_fetcher import AsyncNameFetcher, fallback_names  # noqa: E402
+from Robotan_Name_Generator import name_sources  # noqa: E402
+
+LATENCY = 0.05  # aller-retour simulé, en secondes
+BATCH_SIZE = 100
+CONCURRENCY = (1, 2, 4, 8, 16)
+PAIRS = [(country, gender) for country in ("japan", "france", "usa", "india") for gender in ("male", "female")]
+
+
+def main():
+    batches = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    requests = len(PAIRS) * batches
+    print(f"{requests} requêtes de {BATCH_SIZE} noms, {LATENCY * 1e3:.0f} ms de latence")
+    with NameApiStub(latency=LATENCY) as stub:
+        sources = stub.sources(name_sources)
+        for per_host in CONCURRENCY:
+            fetcher = AsyncNameFetcher(sources, BATCH_SIZE, per_host=per_host)
+            before = stub.names_served
+            start = time.perf_counter()
+            results = fetcher.fetch(PAIRS, batches)
+            elapsed = time.perf_counter() - start
+            assert not any(result.fallback for result in results.values())
+            assert stub.names_served - before == requests * BATCH_SIZE
+            print(f"  {per_host:2} par hôte : {elapsed:.2f} s ({requests / elapsed:5.1f} requêtes/s)")
+
+        # Trois réponses 503 : les nouvelles tentatives finissent par aboutir
+        stub.failures = 3
+        results = AsyncNameFetcher(sources, BATCH_SIZE, backoff=0.01).fetch([("france", "female")])
+        assert not results[("france", "female")].fallback and stub.failures == 0
+        print("Nouvelles tentatives après 3 erreurs 503 : ok")
+
+        # Serveur coupé : repli sur les listes statiques
+        stub.down = True
+        start = time.perf_counter()
+        results = AsyncNameFetcher(sources, BATCH_SIZE, retries=2, backoff=0.01).fetch(PAIRS[:2])
+        assert all(result.fallback and result.names == fallback_names(sources) for result in results.values())
+        print(f"Serveur coupé : listes statiques en {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
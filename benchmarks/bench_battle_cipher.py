@@ -0,0 +1,87 @@
+"""
+Benchmark : chiffrement V1/V2 du langage de bataille par tables de translittération
+contre la chaîne caractère par caractère d'origine (reproduite ci-dessous), puis
+`encode_file` sur un fichier généré.
+
+Usage : python benchmarks/bench_battle_cipher.py [taille_en_Mo]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from robotans.battle import (  # noqa: E402
+    convert_to_robotan_language_v1, convert_to_robotan_language_v2, encode_file
+)
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789     ,.;:!?'\néèàçùêô"
+
+
+# Chaîne d'origine de Lang_Battle.py, conservée comme référence
+def reference_cesar_cipher(text, shift=3):
+    result = []
+    for char in text.upper():
+        if char.isalpha():
+            result.append(chr(((ord(char) - ord('A') + shift) % 26) + ord('A')))
+        elif char.isdigit():
+            result.append(char)
+    return "".join(result)
+
+def reference_group_by_five(text):
+    return " ".join(text[i:i+5] for i in range(0, len(text), 5))
+
+def reference_v1(text):
+    return reference_group_by_five(reference_cesar_cipher(text))
+
+def reference_v2(text):
+    return reference_group_by_five(reference_cesar_cipher(text)[::-1])
+
+
+def mission_log(size, seed=1972):
+    """Texte aléatoire de `size` caractères (lettres, chiffres, ponctuation, accents)."""
+    rng = random.Random(seed)
+    return "".join(rng.choices(ALPHABET, k=size))
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    size = int(float(sys.argv[1]) * 1_000_000) if len(sys.argv) > 1 else 2_000_000
+    text = mission_log(size)
+
+    # Parité sur des textes hors Latin-1 (chemin str.translate)
+    for sample in ("Straße Ÿ ŉ ΣΩ ٣٤ 你好", text[:1000] + "Ω"):
+        assert convert_to_robotan_language_v1(sample) == reference_v1(sample)
+        assert convert_to_robotan_language_v2(sample) == reference_v2(sample)
+
+    print(f"{size} caractères")
+    for name, reference, fast in (("V1", reference_v1, convert_to_robotan_language_v1),
+                                  ("V2", reference_v2, convert_to_robotan_language_v2)):
+        expected, reference_time = timed(reference, text)
+        result, fast_time = timed(fast, text)
+        assert result == expected
+        print(f"  {name} d'origine  : {reference_time:.3f} s")
+        print(f"  {name} par tables : {fast_time:.3f} s (x{reference_time / fast_time:.0f})")
+
+    with tempfile.TemporaryDirectory() as directory:
+        src = os.path.join(directory, "journal.txt")
+        dst = os.path.join(directory, "journal.v")
+        with open(src, "w", encoding="utf-8") as file:
+            file.write(text)
+        for version, expected in (("v1", reference_v1(text)), ("v2", reference_v2(text))):
+            _, file_time = timed(encode_file, src, dst, version, 100_003)
+            with open(dst, encoding="utf-8") as file:
+                assert file.read() == expected
+            megabytes = os.path.getsize(src) / 1_000_000
+            print(f"  encode_file {version}  : {file_time:.3f} s ({megabytes / file_time:.0f} Mo/s)")
+
+
+if __name__ == "__main__":
+    main()
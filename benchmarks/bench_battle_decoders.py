@@ -0,0 +1,81 @@
+"""
+Benchmark : débit des décodeurs du langage de bataille face aux encodeurs.
+
+Avant de mesurer, le script vérifie les propriétés d'aller-retour sur des textes
+aléatoires découpés au hasard (décodage d'un bloc et en flux) :
+  V1/V2 : decode(encode(texte)) == cesar_cipher(texte, 0)
+  V3    : decode(encode(texte)) == lettres du texte en majuscules
+  Flash : decode(encode(texte)) == texte sans ses espaces
+
+Usage : python benchmarks/bench_battle_decoders.py [taille_en_Mo] [nombre_d_essais]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from robotans.battle import (  # noqa: E402
+    cesar_cipher, convert_to_robotan_language_v1, convert_to_robotan_language_v2,
+    convert_to_robotan_language_v3, flash_order, encode_stream
+)
+from robotans.battle_decoder import decode_v1, decode_v2, decode_v3, decode_flash, decode_stream  # noqa: E402
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789     ,.;:!?'\néèàçùêôΩ"
+CODECS = {
+    "v1": (convert_to_robotan_language_v1, decode_v1, lambda text: cesar_cipher(text, 0)),
+    "v2": (convert_to_robotan_language_v2, decode_v2, lambda text: cesar_cipher(text, 0)),
+    "v3": (convert_to_robotan_language_v3, decode_v3, lambda text: "".join(c.upper() for c in text if c.isalpha())),
+    "flash": (flash_order, decode_flash, lambda text: text.replace(" ", "")),
+}
+
+
+def random_chunks(text, rng, pieces=6):
+    """Découpe `text` en au plus `pieces` + 1 blocs de tailles aléatoires."""
+    cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, rng.randint(0, pieces))))
+    return [text[start:end] for start, end in zip([0] + cuts, cuts + [len(text)])]
+
+
+def check_round_trips(trials, seed=1972):
+    rng = random.Random(seed)
+    for _ in range(trials):
+        text = "".join(rng.choices(ALPHABET, k=rng.randint(0, 120)))
+        text += rng.choice(ALPHABET) * rng.randint(0, 30)  # une longue série
+        for version, (encode, decode, normalize) in CODECS.items():
+            encoded = encode(text)
+            assert decode(encoded) == normalize(text), (version, text)
+            streamed = "".join(decode_stream(random_chunks(encoded, rng), version, spill_size=rng.randint(1, 16)))
+            assert streamed == normalize(text), (version, text)
+    assert decode_flash("!A3BC2!") == "AAABCC"
+    assert "".join(decode_stream(["!A1", "2B\\", "74!"], "flash")) == "A" * 12 + "B" + "7" * 4
+
+
+def throughput(function, text):
+    """Débit de `function` sur `text`, en Mo/s de texte clair."""
+    start = time.perf_counter()
+    function(text)
+    return len(text) / 1_000_000 / (time.perf_counter() - start)
+
+
+def main():
+    size = int(float(sys.argv[1]) * 1_000_000) if len(sys.argv) > 1 else 2_000_000
+    trials = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    check_round_trips(trials)
+    print(f"{trials} allers-retours vérifiés")
+
+    rng = random.Random(42)
+    text = "".join(rng.choices(ALPHABET, k=size))
+    print(f"{size} caractères (Mo/s rapportés au texte clair)")
+    for version, (encode, decode, _) in CODECS.items():
+        encoded = encode(text)
+        chunks = [encoded[start:start + 65536] for start in range(0, len(encoded), 65536)]
+        plain_chunks = [text[start:start + 65536] for start in range(0, len(text), 65536)]
+        print(f"  {version} encodage {throughput(encode, text):7.1f}"
+              f" | décodage {throughput(lambda _: decode(encoded), text):7.1f}"
+              f" | flux : encodage {throughput(lambda _: ''.join(encode_stream(plain_chunks, version)), text):7.1f}"
+              f", décodage {throughput(lambda _: ''.join(decode_stream(chunks, version)), text):7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark : noyau NumPy (`cipher_array`, `music_array`) contre `cesar_cipher` et
+`letter_to_music_with_octave`, pour des entrées de 1 Ko à 1 Go.
+
+Le chiffrement du noyau passe par `bytes.translate` sur une table de 256
+octets, et non par NumPy : indexation et masque booléen y perdaient face à
+`str.translate`. NumPy ne sert qu'aux notes (V3, musique). À 1 Ko, le coût
+des tables, construites au premier appel, domine.
+
+Les entrées au-delà de 16 Mo sont traitées par blocs de 16 Mo par les deux
+versions (les deux transformations sont caractère par caractère), pour que la
+mémoire reste raisonnable à 1 Go.
+
+Usage : python benchmarks/bench_battle_numpy.py [--max-mo 1000] [--latin1]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from robotans.battle import cesar_cipher, letter_to_music_with_octave  # noqa: E402
+from robotans.battle_numpy import cipher_array, music_array  # noqa: E402
+
+BLOCK_SIZE = 16_000_000
+SIZES = [1_000, 1_000_000, 10_000_000, 100_000_000, 1_000_000_000]
+ASCII_ALPHABET = b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789     ,.;:!?'\n"
+LATIN1_ALPHABET = ASCII_ALPHABET + "éèàçùêô".encode("latin-1")
+
+
+def corpus(size, alphabet, seed=1972):
+    """`size` octets tirés dans `alphabet`."""
+    rng = np.random.default_rng(seed)
+    return np.frombuffer(alphabet, dtype=np.uint8)[rng.integers(0, len(alphabet), size)].tobytes()
+
+
+def timed_blocks(function, blocks):
+    """Durée totale de `function` sur chaque bloc, et le premier résultat."""
+    first = None
+    total = 0.0
+    for block in blocks:
+        start = time.perf_counter()
+        result = function(block)
+        total += time.perf_counter() - start
+        if first is None:
+            first = result
+    return total, first
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-mo", type=float, default=100, help="taille maximale, en Mo (1000 pour aller à 1 Go)")
+    parser.add_argument("--latin1", action="store_true", help="texte avec accents (chemin général des notes)")
+    args = parser.parse_args()
+    alphabet = LATIN1_ALPHABET if args.latin1 else ASCII_ALPHABET
+
+    print(f"{'taille':>12} | {'cesar_cipher':>12} {'cipher_array':>12} {'gain':>5}"
+          f" | {'musique':>12} {'music_array':>12} {'gain':>5}")
+    for size in (size for size in SIZES if size <= args.max_mo * 1_000_000):
+        data = corpus(min(size, BLOCK_SIZE), alphabet)
+        blocks = [data] * max(1, size // BLOCK_SIZE)
+        texts = [data.decode("latin-1")] * len(blocks)
+
+        cipher_time, ciphered = timed_blocks(cesar_cipher, texts)
+        array_time, ciphered_array = timed_blocks(cipher_array, blocks)
+        assert ciphered_array.tobytes().decode("latin-1") == ciphered
+        music_time, music = timed_blocks(letter_to_music_with_octave, texts)
+        notes_time, notes = timed_blocks(music_array, blocks)
+        assert notes.tobytes().decode("ascii") == music
+
+        print(f"{size:>12} | {cipher_time:>11.4f}s {array_time:>11.4f}s {cipher_time / array_time:>4.1f}x"
+              f" | {music_time:>11.4f}s {notes_time:>11.4f}s {music_time / notes_time:>4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Benchmark : chaque transformation du langage de bataille (`cesar_cipher`,
+`group_by_five`, `reverse_text`, `letter_to_music_with_octave`,
+`group_words_by_four`, `flash_order`) sur des corpus synthétiques de taille
+croissante et de composition variée (ASCII, français, au-delà du Latin-1,
+longues séries).
+
+Pour chaque cas, le script relève le temps par caractère d'entrée (meilleure
+de plusieurs répétitions) et le pic de mémoire allouée (tracemalloc), puis les
+compare à benchmarks/battle_transforms_baseline.json. Avec --profil, le cas
+le plus lent est repassé sous cProfile : les statistiques sont affichées et
+enregistrées dans un fichier .prof, lisible par pstats, snakeviz ou flameprof.
+
+Usage : python benchmarks/bench_battle_transforms.py [--tailles 1000,100000] [--save] [--profil FICHIER]
+Sans --save, le résultat est comparé à la référence ; le code de sortie vaut 1 en cas de régression.
+"""
+import argparse
+import cProfile
+import json
+import os
+import pstats
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from robotans.battle import (  # noqa: E402
+    cesar_cipher, group_by_five, reverse_text, letter_to_music_with_octave, group_words_by_four, flash_order
+)
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "battle_transforms_baseline.json")
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+TIME_BUDGET = 0.2  # secondes de mesure par cas, au moins trois répétitions
+TIME_TOLERANCE = 1.5
+TIME_MARGIN_NS = 2.0  # écart absolu toléré, pour les transformations à quelques ns par caractère
+MEMORY_TOLERANCE = 1.25
+
+# Alphabets des corpus ; « ß » est exclu, V3 ne sait pas le convertir
+MIXES = {
+    "ascii": "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789      ,.;:!?'\n",
+    "français": "abcdefghijklmnopqrstuvwxyzéèàçùêôâîœ      ,.;:!?'\n",
+    "unicode": "abcdefghijklmnopqrstuvwxyzéèΩλж€“”      ,.;!?\n",
+}
+RUNS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ "
+
+
+def corpus(mix, size, seed=1972):
+    """Texte synthétique de `size` caractères ; « séries » enchaîne de longues séries."""
+    rng = random.Random(seed)
+    if mix == "séries":
+        runs = []
+        total = 0
+        while total < size:
+            runs.append(rng.choice(RUNS) * rng.randint(1, 500))
+            total += len(runs[-1])
+        return "".join(runs)[:size]
+    return "".join(rng.choices(MIXES[mix], k=size))
+
+
+# Transformation -> (fonction, préparation de l'entrée à partir du texte clair)
+TRANSFORMS = {
+    "cesar_cipher": (cesar_cipher, None),
+    "group_by_five": (group_by_five, cesar_cipher),
+    "reverse_text": (reverse_text, None),
+    "letter_to_music_with_octave": (letter_to_music_with_octave, None),
+    "group_words_by_four": (group_words_by_four, letter_to_music_with_octave),
+    "flash_order": (flash_order, None),
+}
+
+
+def best_time(function, data):
+    """Meilleure durée d'un appel, sur au moins trois répétitions et `TIME_BUDGET` secondes."""
+    best = float("inf")
+    spent, repetitions = 0.0, 0
+    while repetitions < 3 or spent < TIME_BUDGET:
+        start = time.perf_counter()
+        function(data)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        spent += elapsed
+        repetitions += 1
+    return best
+
+
+def peak_memory(function, data):
+    """Pic de mémoire allouée pendant un appel, en octets."""
+    tracemalloc.start()
+    try:
+        function(data)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def cases(sizes):
+    """(clé, fonction, entrée, taille du texte clair) de chaque cas mesuré."""
+    for name, (function, prepare) in TRANSFORMS.items():
+        mixes = list(MIXES) + (["séries"] if name == "flash_order" else [])
+        for mix in mixes:
+            for size in sizes:
+                text = corpus(mix, size)
+                yield f"{name}/{mix}/{size}", function, prepare(text) if prepare else text, size
+
+
+def compare(results, baseline, tolerance=TIME_TOLERANCE):
+    """Lignes des régressions par rapport à la référence."""
+    regressions = []
+    for key, result in results.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        limit = max(reference["ns_par_caractere"] * tolerance, reference["ns_par_caractere"] + TIME_MARGIN_NS)
+        if result["ns_par_caractere"] > limit:
+            regressions.append(f"{key} : {result['ns_par_caractere']:.1f} ns/car "
+                               f"(référence {reference['ns_par_caractere']:.1f})")
+        if result["pic_octets"] > max(reference["pic_octets"] * MEMORY_TOLERANCE, 4096):
+            regressions.append(f"{key} : pic de {result['pic_octets']} octets (référence {reference['pic_octets']})")
+    return regressions
+
+
+def profile(function, data, path):
+    """Passe `function` sous cProfile, enregistre les statistiques dans `path` et affiche les plus coûteuses."""
+    profiler = cProfile.Profile()
+    profiler.runcall(function, data)
+    profiler.dump_stats(path)
+    pstats.Stats(profiler).sort_stats("cumulative").print_stats(15)
+    print(f"Profil enregistré dans {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tailles", default=",".join(map(str, SIZES)), help="tailles des corpus, en caractères")
+    parser.add_argument("--save", action="store_true", help="enregistre les résultats comme nouvelle référence")
+    parser.add_argument("--tolerance", type=float, default=TIME_TOLERANCE,
+                        help="rapport de temps au-delà duquel un cas est en régression (défaut : 1.5)")
+    parser.add_argument("--profil", default=None, help="fichier .prof du profil du cas le plus lent")
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.tailles.split(",")]
+
+    results = {}
+    slowest = None
+    print(f"{'cas':48} {'ns/car':>9} {'pic (o/car)':>12}")
+    for key, function, data, size in cases(sizes):
+        elapsed = best_time(function, data)
+        peak = peak_memory(function, data)
+        results[key] = {"ns_par_caractere": round(elapsed / size * 1e9, 2), "pic_octets": peak}
+        print(f"{key:48} {elapsed / size * 1e9:9.1f} {peak / size:12.1f}")
+        if slowest is None or elapsed > slowest[0]:
+            slowest = (elapsed, key, function, data)
+
+    status = 0
+    if args.save:
+        with open(BASELINE_FILE, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=4, ensure_ascii=False)
+        print(f"Référence enregistrée dans {BASELINE_FILE}")
+    elif os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, "r", encoding="utf-8") as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+        for line in regressions:
+            print(f"Régression : {line}")
+        print(f"{len(regressions)} régression(s) par rapport à la référence")
+        status = 1 if regressions else 0
+
+    if args.profil and slowest is not None:
+        print(f"Cas le plus lent : {slowest[1]} ({slowest[0]:.3f} s)")
+        profile(slowest[2], slowest[3], args.profil)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
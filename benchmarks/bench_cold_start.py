@@ -0,0 +1,79 @@
+"""
+Benchmark : temps de démarrage à froid du chemin de conversion de dates.
+
+Chaque mesure lance un interpréteur neuf qui importe `robotans` et convertit une
+date ; on en retranche le démarrage d'un interpréteur vide. Le script vérifie
+aussi qu'aucune bibliothèque lourde (Tk, NumPy, pandas, rendu) n'est chargée.
+
+Usage : python benchmarks/bench_cold_start.py [--repetitions N] [--save]
+Sans --save, le résultat est comparé à benchmarks/cold_start_baseline.json.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cold_start_baseline.json")
+HEAVY_MODULES = ["tkinter", "numpy", "pandas", "plotly", "matplotlib", "PIL", "reportlab", "fpdf", "requests"]
+CONVERSION_SNIPPET = "import robotans; robotans.gregorian_to_rectitude(robotans.get_real_date(42, 7, 15))"
+REGRESSION_TOLERANCE = 1.5
+
+
+def run_python(code):
+    """Durée d'exécution d'un interpréteur neuf lancé sur `code`."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+    return time.perf_counter() - start
+
+
+def median_time(code, repetitions):
+    """Durée médiane sur `repetitions` lancements."""
+    return statistics.median(run_python(code) for _ in range(repetitions))
+
+
+def loaded_heavy_modules():
+    """Bibliothèques lourdes présentes dans sys.modules après la conversion."""
+    code = f"{CONVERSION_SNIPPET}; import sys; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True, text=True)
+    return [name for name in output.stdout.strip().split(",") if name]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repetitions", type=int, default=15)
+    parser.add_argument("--save", action="store_true", help="enregistre le résultat comme nouvelle référence")
+    args = parser.parse_args()
+
+    interpreter = median_time("pass", args.repetitions)
+    conversion = median_time(CONVERSION_SNIPPET, args.repetitions)
+    overhead_ms = (conversion - interpreter) * 1000
+    heavy = loaded_heavy_modules()
+
+    print(f"Interpréteur vide       : {interpreter * 1000:.1f} ms")
+    print(f"Import + conversion     : {conversion * 1000:.1f} ms")
+    print(f"Surcoût de robotans     : {overhead_ms:.1f} ms")
+    print(f"Modules lourds chargés  : {', '.join(heavy) or 'aucun'}")
+
+    if args.save:
+        with open(BASELINE_FILE, "w", encoding="utf-8") as file:
+            json.dump({"overhead_ms": round(overhead_ms, 1)}, file, indent=4)
+        print(f"Référence enregistrée dans {BASELINE_FILE}")
+        return 0
+
+    status = 1 if heavy else 0
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, "r", encoding="utf-8") as file:
+            baseline = json.load(file)["overhead_ms"]
+        print(f"Référence               : {baseline:.1f} ms")
+        if overhead_ms > max(baseline * REGRESSION_TOLERANCE, baseline + 5):
+            print("Régression du démarrage à froid !")
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""
+Benchmark : conversion Rectitude -> grégorien date par date (`get_real_date`)
+contre la conversion vectorisée (`rectitude_to_gregorian_array`).
+
+Usage : python benchmarks/bench_conversion.py [nombre_de_dates]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from robotans.rectitude import get_real_date  # noqa: E402
+from robotans.conversion import (  # noqa: E402
+    rectitude_to_gregorian_array, gregorian_to_rectitude_array
+)
+
+
+def random_dates(count, seed=1972):
+    """Génère `count` dates de la Rectitude valides (hors 5e Jour du Silence)."""
+    rng = np.random.default_rng(seed)
+    years = rng.integers(0, 8000, count)  # datetime est limité à l'an 9999
+    months = rng.integers(1, 14, count)
+    days = np.where(months < 13, rng.integers(1, 31, count), rng.integers(1, 5, count))
+    return years, months, days
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    years, months, days = random_dates(count)
+
+    start = time.perf_counter()
+    scalar = [get_real_date(int(a), int(m), int(j)) for a, m, j in zip(years, months, days)]
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vector = rectitude_to_gregorian_array(years, months, days)
+    vector_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    back = gregorian_to_rectitude_array(vector)
+    reverse_time = time.perf_counter() - start
+
+    assert np.array_equal(np.array(scalar, dtype="datetime64[D]"), vector)
+    assert all(np.array_equal(a, b) for a, b in zip(back, (years, months, days)))
+
+    print(f"{count} dates")
+    print(f"  get_real_date (boucle)        : {scalar_time:.3f} s")
+    print(f"  rectitude_to_gregorian_array  : {vector_time:.3f} s (x{scalar_time / vector_time:.0f})")
+    print(f"  gregorian_to_rectitude_array  : {reverse_time:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
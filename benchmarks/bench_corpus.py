@@ -0,0 +1,54 @@
+"""
+Benchmark : passage à l'échelle de l'encodage d'une arborescence
+(`robotans.corpus.encode_corpus`) avec 1, 2, 4... processus, jusqu'au nombre de cœurs.
+
+Usage : python benchmarks/bench_corpus.py [nombre_de_fichiers] [taille_en_Ko]
+"""
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from robotans.corpus import encode_corpus  # noqa: E402
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789     ,.;:!?'\néèàç"
+
+
+def write_corpus(root, count, size, seed=1972):
+    """`count` transcriptions d'environ `size` caractères, réparties en sous-dossiers."""
+    rng = random.Random(seed)
+    for index in range(count):
+        directory = os.path.join(root, f"unite_{index % 10}")
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"transcription_{index}.txt"), "w", encoding="utf-8") as file:
+            file.write("".join(rng.choices(ALPHABET, k=rng.randint(size // 2, size * 3 // 2))))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    size = int(sys.argv[2]) * 1000 if len(sys.argv) > 2 else 200_000
+    cores = os.cpu_count() or 1
+    workers = [1]
+    while workers[-1] * 2 <= cores:
+        workers.append(workers[-1] * 2)
+    if workers[-1] != cores:
+        workers.append(cores)
+
+    with tempfile.TemporaryDirectory() as root:
+        write_corpus(root, count, size)
+        print(f"{count} fichiers, {cores} cœurs")
+        reference = None
+        for worker_count in workers:
+            summary = encode_corpus(root, "v2", worker_count, force=True)
+            duration = summary["duree"]
+            reference = reference or duration
+            print(f"  {worker_count:>3} processus : {duration:6.2f} s, {summary['encodes'] / duration:7.1f} fichiers/s, "
+                  f"{summary['octets'] / 1_000_000 / duration:6.1f} Mo/s (x{reference / duration:.1f})")
+        summary = encode_corpus(root, "v2", cores)
+        print(f"  relance sans changement : {summary['ignores']} fichiers ignorés en {summary['duree']:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
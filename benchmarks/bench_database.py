@@ -0,0 +1,90 @@
+"""
+Benchmark : coût d'une modification de la liste des personnages, fichier JSON
+réécrit en entier (`save_json`, l'ancien enregistrement) contre la base SQLite
+(`robotans.database.LoreDatabase`), pour une base de taille croissante.
+
+Le script vérifie aussi le refus des doublons, le renommage en place,
+l'annulation d'un lot interrompu et la reprise des fichiers JSON du dépôt.
+
+Usage : python benchmarks/bench_database.py [nombre_de_personnages]
+"""
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from robotans.database import DuplicateNameError, LoreDatabase  # noqa: E402
+from robotans.stores import save_json  # noqa: E402
+
+EDITS = 200
+
+
+def json_edits(path, names):
+    """Ajouts à la manière de l'ancien éditeur : test de doublon linéaire, puis réécriture du fichier."""
+    names = list(names)
+    start = time.perf_counter()
+    for index in range(EDITS):
+        name = f"Nouveau-{index}"
+        if name in names:
+            raise AssertionError(name)
+        names.append(name)
+        save_json(path, names)
+    return (time.perf_counter() - start) / EDITS
+
+
+def database_edits(database):
+    start = time.perf_counter()
+    for index in range(EDITS):
+        database.persons.add(f"Nouveau-{index}")
+    return (time.perf_counter() - start) / EDITS
+
+
+def check(directory):
+    with LoreDatabase(os.path.join(directory, "verification.db")) as database:
+        database.persons.add_many(["Joy", "Mik-L", "Zoe"])
+        try:
+            database.persons.add("Zoe")
+        except DuplicateNameError:
+            pass
+        else:
+            raise AssertionError("doublon accepté")
+        assert database.persons.rename("Mik-L", "Mik-L2")
+        assert database.persons.names() == ["Joy", "Mik-L2", "Zoe"]
+        try:
+            with database.batch():
+                database.persons.add("Perdu")
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        assert "Perdu" not in database.persons, "lot interrompu validé"
+
+    files = [os.path.join(ROOT, name) for name in ("factions.json", "perso.json", "events.json")]
+    with LoreDatabase(os.path.join(directory, "reprise.db")) as database:
+        imported = database.import_json(*files)
+        assert database.import_json(*files) == (0, 0, 0), "reprise non idempotente"
+    print(f"Vérifications faites ; reprise du dépôt : {imported[0]} faction(s), {imported[1]} personnage(s), "
+          f"{imported[2]} événement(s)")
+
+
+def main():
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    sizes = [size for size in (1_000, 10_000, 50_000, 200_000) if size < largest] + [largest]
+    with tempfile.TemporaryDirectory() as directory:
+        check(directory)
+        print(f"{'personnages':>12} {'JSON (ms/ajout)':>16} {'SQLite (ms/ajout)':>18} {'import (s)':>11}")
+        for size in sizes:
+            names = [f"Robotan-{index}" for index in range(size)]
+            json_time = json_edits(os.path.join(directory, f"perso_{size}.json"), names)
+            with LoreDatabase(os.path.join(directory, f"lore_{size}.db")) as database:
+                start = time.perf_counter()
+                database.persons.add_many(names)
+                imported = time.perf_counter() - start
+                database_time = database_edits(database)
+            print(f"{size:12} {json_time * 1e3:16.3f} {database_time * 1e3:18.3f} {imported:11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark : attribution de désignations uniques `Nom-NNN` par le générateur
+de noms (`DesignationAllocator`), jusqu'à plusieurs millions.
+
+Le script vérifie l'unicité de toutes les désignations, l'épuisement signalé
+quand l'espace nom x 999 est plein, les réservations et la reprise de l'état
+enregistré, puis mesure le débit par tranche : il doit rester constant quand
+l'espace se remplit.
+
+Usage : python benchmarks/bench_designations.py [nombre_en_millions]
+"""
+import os
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(HERE, "..", "Robotans_Name_Generator")))
+
+from designations import NUMBERS, DesignationAllocator, DesignationsExhausted  # noqa: E402
+
+STEPS = 5
+
+
+def main():
+    millions = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    count = int(millions * 1_000_000)
+    # Juste assez de noms pour remplir l'espace : la dernière tranche tire dans un espace presque plein
+    names = [f"Robot{index}" for index in range(-(-count // NUMBERS))]
+    allocator = DesignationAllocator(seed=1972)
+    issued = set()
+    step = count // STEPS
+    print(f"{count} désignations sur {len(names)} noms ({len(names) * NUMBERS} possibles)")
+    for part in range(STEPS):
+        start = time.perf_counter()
+        batch = list(allocator.allocate_many(names, step))
+        elapsed = time.perf_counter() - start
+        issued.update(batch)
+        print(f"  tranche {part + 1} : {elapsed / step * 1e9:6.0f} ns par désignation")
+    assert len(issued) == allocator.issued() == step * STEPS
+
+    # Petit espace : épuisement explicite, sans doublon
+    small = DesignationAllocator(seed=1)
+    assert small.reserve("Zoe-042") and not small.reserve("Zoe-042")
+    everything = list(small.allocate_many(["Zoe", "Ada"], 2 * NUMBERS - 1))
+    assert len(set(everything)) == len(everything) and "Zoe-042" not in everything
+    try:
+        small.allocate(["Zoe", "Ada"])
+    except DesignationsExhausted as e:
+        print(f"Épuisement signalé : {e}")
+    else:
+        raise AssertionError("épuisement non signalé")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "designations.json")
+        start = time.perf_counter()
+        allocator.save(path)
+        restored = DesignationAllocator.load(path, seed=2)
+        print(f"Enregistrement et relecture : {time.perf_counter() - start:.2f} s, "
+              f"{os.path.getsize(path) / 1e6:.1f} Mo")
+        assert restored.issued() == allocator.issued()
+        more = list(restored.allocate_many(names, min(10_000, len(names) * NUMBERS - count)))
+        assert not issued.intersection(more)
+
+
+if __name__ == "__main__":
+    main()
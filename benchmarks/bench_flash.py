@@ -0,0 +1,65 @@
+"""
+Benchmark : codage par plages de l'Ordre Flash contre l'ancienne factorisation
+par `groupby` (reproduite ci-dessous, sans son défaut de longueur), sur du texte
+courant et sur des ordres générés à longues séries, en `str` et en `bytes`.
+
+Usage : python benchmarks/bench_flash.py [taille_en_Mo]
+"""
+import os
+import random
+import sys
+import time
+from itertools import groupby
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from robotans import flash  # noqa: E402
+
+
+def reference_flash_order(text):
+    """Factorisation d'origine par groupby, une liste par série."""
+    return "!" + "".join(
+        f"{char}{len(run) if len(run) > 1 else ''}"
+        for char, run in ((char, list(group)) for char, group in groupby(text.replace(" ", "")))
+    ) + "!"
+
+
+def corpora(size, seed=1972):
+    """Texte courant (séries courtes) et ordre généré (longues séries)."""
+    rng = random.Random(seed)
+    prose = "".join(rng.choices("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ,.;:!?'", k=size))
+    runs = []
+    while sum(map(len, runs)) < size:
+        runs.append(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") * rng.randint(1, 5000))
+    return {"texte courant": prose, "longues séries": "".join(runs)[:size]}
+
+
+def timed(function, data):
+    start = time.perf_counter()
+    result = function(data)
+    return result, time.perf_counter() - start
+
+
+def main():
+    size = int(float(sys.argv[1]) * 1_000_000) if len(sys.argv) > 1 else 2_000_000
+    print(f"{size} caractères")
+    for name, text in corpora(size).items():
+        data = text.encode("ascii")
+        expected, reference_time = timed(reference_flash_order, text)
+        encoded, encode_time = timed(flash.encode, text)
+        encoded_bytes, bytes_time = timed(flash.encode, memoryview(data))
+        decoded, decode_time = timed(flash.decode, encoded)
+        decoded_bytes, decode_bytes_time = timed(flash.decode, encoded_bytes)
+        # Sans chiffres dans le texte, le format est celui d'origine
+        assert encoded == expected and encoded_bytes == expected.encode("ascii")
+        assert decoded == text and decoded_bytes == data
+        print(f"  {name} :")
+        print(f"    groupby d'origine : {reference_time:.3f} s")
+        print(f"    codage str        : {encode_time:.3f} s (x{reference_time / encode_time:.0f})")
+        print(f"    codage memoryview : {bytes_time:.3f} s (x{reference_time / bytes_time:.0f})")
+        print(f"    décodage str      : {decode_time:.3f} s")
+        print(f"    décodage bytes    : {decode_bytes_time:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark : aperçu en direct du langage de bataille sur un long message, en
+simulant une frappe à la fin puis une correction au milieu, contre la
+conversion du texte entier à chaque frappe.
+
+Usage : python benchmarks/bench_live.py [taille_en_Ko]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from robotans.battle import (  # noqa: E402
+    VERSIONS, convert_to_robotan_language_v1, convert_to_robotan_language_v2,
+    convert_to_robotan_language_v3, flash_order
+)
+from robotans.live import LiveEncoder, patch_range  # noqa: E402
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz     ,.;:!?'éèàçùêô"
+KEYSTROKES = 200
+CONVERTERS = {
+    "v1": convert_to_robotan_language_v1,
+    "v2": convert_to_robotan_language_v2,
+    "v3": convert_to_robotan_language_v3,
+    "flash": flash_order,
+}
+
+
+def typed(text, rng, middle):
+    """Textes successifs d'une frappe caractère par caractère, à la fin ou au milieu."""
+    position = len(text) // 2 if middle else len(text)
+    for _ in range(KEYSTROKES):
+        text = text[:position] + rng.choice(ALPHABET) + text[position:]
+        position += 1
+        yield text
+
+
+def main():
+    size = int(float(sys.argv[1]) * 1000) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(1972)
+    message = "".join(rng.choices(ALPHABET, k=size))
+    print(f"{size} caractères, {KEYSTROKES} frappes (ms par frappe, correction du widget comprise)")
+    for version in VERSIONS:
+        for middle in (False, True):
+            texts = list(typed(message, rng, middle))
+            encoder = LiveEncoder(version)
+            shown = encoder.update(message)
+            start = time.perf_counter()
+            for text in texts:
+                output = encoder.update(text)
+                patch_range(shown, output)
+                shown = output
+            live_time = (time.perf_counter() - start) / KEYSTROKES
+            start = time.perf_counter()
+            for text in texts:
+                expected = CONVERTERS[version](text)
+            full_time = (time.perf_counter() - start) / KEYSTROKES
+            assert output == expected, version
+            where = "au milieu" if middle else "à la fin "
+            print(f"  {version:5} {where} : aperçu {live_time * 1e3:6.2f} | texte entier {full_time * 1e3:6.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Benchmark : rendu MIDI et WAV d'un long message V3, comparé à sa durée
+d'écoute (une noire par note à 120 à la noire).
+
+Usage : python benchmarks/bench_music.py [durée_en_heures]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from robotans.battle import convert_to_robotan_language_v3  # noqa: E402
+from robotans.music import TEMPO_BPM, render_file  # noqa: E402
+
+
+def main():
+    hours = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    notes = round(hours * 3600 * TEMPO_BPM / 60)
+    letters = "".join(random.Random(1972).choices("abcdefghijklmnopqrstuvwxyz", k=notes))
+    print(f"{notes} notes, {hours:g} h d'écoute")
+    with tempfile.TemporaryDirectory() as directory:
+        src = os.path.join(directory, "message.v3")
+        with open(src, "w", encoding="utf-8") as file:
+            file.write(convert_to_robotan_language_v3(letters))
+        for extension in (".mid", ".wav"):
+            dst = os.path.join(directory, "message" + extension)
+            start = time.perf_counter()
+            render_file(src, dst)
+            elapsed = time.perf_counter() - start
+            print(f"  {extension:4} : {elapsed:.3f} s ({hours * 3600 / elapsed:.0f} fois le temps réel,"
+                  f" {os.path.getsize(dst) / 1e6:.1f} Mo)")
+
+
+if __name__ == "__main__":
+    main()
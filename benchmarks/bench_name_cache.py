@@ -0,0 +1,84 @@
+"""
+Benchmark : cache local des prénoms du générateur de noms, contre un serveur
+local qui imite randomuser.me (benchmarks/name_api_stub.py).
+
+Le script vérifie qu'un corpus se remplit en une requête groupée, que la
+génération d'un équipage ne touche plus le réseau, qu'un corpus sur disque
+sert hors ligne (les listes statiques sinon), qu'un corpus périmé est rafraîchi en arrière-plan sans
+bloquer, et que les corpus les moins utilisés sont évincés. Il compare enfin
+le temps de génération à l'ancienne requête par nom.
+
+Usage : python benchmarks/bench_name_cache.py [nombre_de_noms]
+"""
+import os
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(HERE, "..", "Robotans_Name_Generator")))
+
+import requests  # noqa: E402
+
+from name_api_stub import NameApiStub  # noqa: E402
+from name_cache import NameCorpusCache, fallback_names  # noqa: E402
+import Robotan_Name_Generator as generator  # noqa: E402
+
+LATENCY = 0.02  # aller-retour simulé, en secondes
+
+
+def one_request_per_name(sources, country, gender, count):
+    """Comportement d'origine : une requête sans session par nom, seul `results[0]` est gardé."""
+    names = []
+    for _ in range(count):
+        data = requests.get(sources[country] + gender).json()
+        names.append(data["results"][0]["name"]["first"].capitalize())
+    return names
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    with NameApiStub(latency=LATENCY) as stub, tempfile.TemporaryDirectory() as directory:
+        sources = stub.sources(generator.name_sources)
+        generator.name_cache = NameCorpusCache(sources, cache_dir=directory, max_corpora=3)
+
+        start = time.perf_counter()
+        crew = [generator.generate_robotan_name("france", "female") for _ in range(count)]
+        cached_time = time.perf_counter() - start
+        assert all(crew) and stub.requests == 1, stub.requests
+        print(f"{count} noms depuis le cache : {cached_time:.3f} s, {stub.requests} requête")
+
+        # Hors ligne : un nouveau processus relit le corpus sur disque
+        stub.down = True
+        offline = NameCorpusCache(sources, cache_dir=directory)
+        assert offline.names("france", "female") == generator.name_cache.names("france", "female")
+        # Corpus jamais rempli : repli sur les listes statiques
+        assert offline.names("usa", "male") == fallback_names(sources)
+        stub.down = False
+
+        # Corpus périmé : servi immédiatement, rafraîchi en arrière-plan
+        stale = NameCorpusCache(sources, cache_dir=directory, ttl=0)
+        before = stub.requests
+        start = time.perf_counter()
+        assert stale.names("france", "female")
+        served = time.perf_counter() - start
+        stale.wait()
+        assert stub.requests == before + 1 and served < LATENCY, (stub.requests, served)
+        print(f"Corpus périmé servi en {served * 1e3:.2f} ms, rafraîchi en arrière-plan")
+
+        # Éviction : trois corpus au plus sur disque
+        for country, gender in [("usa", "male"), ("japan", "male"), ("india", "female")]:
+            generator.name_cache.names(country, gender)
+        files = sorted(os.listdir(directory))
+        assert len(files) == 3 and "france-female.txt.gz" not in files, files
+        print(f"Corpus sur disque après éviction : {', '.join(files)}")
+
+        start = time.perf_counter()
+        reference = one_request_per_name(sources, "france", "female", count)
+        reference_time = time.perf_counter() - start
+        assert len(reference) == count
+        print(f"{count} noms, une requête par nom : {reference_time:.3f} s (x{reference_time / cached_time:.0f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark : génération en flux de désignations par le générateur de noms
+(`name_stream`), en un seul processus puis réparti sur plusieurs.
+
+Les corpus sont synthétiques (pas de réseau). Le script vérifie que la sortie
+ne dépend que de la graine et du nombre de processus, que les désignations
+sont uniques, fragments compris, et que le mélange pays/genre respecte les
+poids ; il mesure le débit d'écriture dans un fichier.
+
+Usage : python benchmarks/bench_name_stream.py [nombre_en_millions] [processus]
+"""
+import collections
+import hashlib
+import os
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(HERE, "..", "Robotans_Name_Generator")))
+
+from name_stream import parse_mix, stream_names  # noqa: E402
+
+MIX = "japan:female=2,france:male,usa:female"
+NAMES_PER_PAIR = 2000
+
+
+def synthetic_names(mix):
+    # Préfixes distincts : chaque désignation révèle la paire qui l'a produite
+    return {
+        (country, gender): [f"{country[:2].capitalize()}{gender[0]}{index}" for index in range(NAMES_PER_PAIR)]
+        for (country, gender), _ in mix
+    }
+
+
+def run(mix, names, count, seed, processes, path):
+    start = time.perf_counter()
+    with open(path, "w", encoding="utf-8") as file:
+        stream_names(mix, count, seed, file, processes, names)
+    elapsed = time.perf_counter() - start
+    with open(path, "rb") as file:
+        data = file.read()
+    return elapsed, data
+
+
+def main():
+    millions = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    count = int(millions * 1_000_000)
+    mix = parse_mix(MIX)
+    names = synthetic_names(mix)
+    print(f"{count} désignations, mélange {MIX}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "noms.txt")
+        for shards in (1, processes):
+            elapsed, data = run(mix, names, count, "bench", shards, path)
+            lines = data.decode("utf-8").split("\n")[:-1]
+            assert len(lines) == count, len(lines)
+            assert len(set(lines)) == count, "désignation en double"
+            again = run(mix, names, count, "bench", shards, path)[1]
+            assert hashlib.sha256(again).digest() == hashlib.sha256(data).digest(), "sortie non reproductible"
+            other = run(mix, names, min(count, 1000), "autre graine", shards, path)[1]
+            assert not data.startswith(other), "la graine est sans effet"
+
+            shares = collections.Counter(line[:3] for line in lines)
+            print(f"  {shards} processus : {elapsed:6.2f} s, {elapsed / count * 1e9:5.0f} ns par nom, "
+                  f"{len(data) / elapsed / 1e6:5.1f} Mo/s, répartition "
+                  + ", ".join(f"{prefix} {share / count:.2f}" for prefix, share in sorted(shares.items())))
+    print("Sorties reproductibles, sans doublon")
+
+
+if __name__ == "__main__":
+    main()
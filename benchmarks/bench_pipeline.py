@@ -0,0 +1,71 @@
+"""
+Benchmark : versions du langage de bataille déclarées comme chaînes d'étapes
+(`robotans.pipeline`) contre les fonctions écrites à la main de
+`robotans.battle`, d'un bloc et en flux, plus une version composée
+(chiffrement, inversion, second chiffrement) sans équivalent écrit à la main.
+
+Usage : python benchmarks/bench_pipeline.py [taille_en_Mo]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from robotans.battle import (  # noqa: E402
+    convert_to_robotan_language_v1, convert_to_robotan_language_v2, convert_to_robotan_language_v3,
+    flash_order, cesar_cipher, group_by_five, encode_stream, version_pipeline
+)
+from robotans.pipeline import compile_pipeline  # noqa: E402
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789     ,.;:!?'\néèàçùêô"
+CHUNK = 1 << 20
+HANDWRITTEN = {
+    "v1": convert_to_robotan_language_v1,
+    "v2": convert_to_robotan_language_v2,
+    "v3": convert_to_robotan_language_v3,
+    "flash": flash_order,
+}
+CUSTOM_STAGES = (("cipher", 7), "reverse", ("cipher", 11), "group5")
+
+
+def custom_reference(text):
+    return group_by_five(cesar_cipher(cesar_cipher(text, 7)[::-1], 11))
+
+
+def timed(function, data):
+    start = time.perf_counter()
+    result = function(data)
+    return result, time.perf_counter() - start
+
+
+def main():
+    size = int(float(sys.argv[1]) * 1_000_000) if len(sys.argv) > 1 else 2_000_000
+    text = "".join(random.Random(1972).choices(ALPHABET, k=size))
+    chunks = [text[start:start + CHUNK] for start in range(0, len(text), CHUNK)]
+    print(f"{size} caractères (Mo/s rapportés au texte clair)")
+    cases = [(version, HANDWRITTEN[version], version_pipeline(version)) for version in HANDWRITTEN]
+    cases.append(("composée", custom_reference, compile_pipeline(*CUSTOM_STAGES)))
+    for name, handwritten, pipeline in cases:
+        expected, handwritten_time = timed(handwritten, text)
+        encoded, pipeline_time = timed(pipeline.encode, text)
+        streamed, stream_time = timed(
+            lambda chunks: "".join(encode_stream(chunks, name)) if name in HANDWRITTEN
+            else "".join(_stream(pipeline, chunks)), chunks
+        )
+        assert encoded == expected and streamed == expected, name
+        megabytes = size / 1e6
+        print(f"  {name:8} à la main {megabytes / handwritten_time:7.1f} | chaîne {megabytes / pipeline_time:7.1f}"
+              f" | chaîne en flux {megabytes / stream_time:7.1f}")
+
+
+def _stream(pipeline, chunks):
+    encoder = pipeline.encoder()
+    for chunk in chunks:
+        yield encoder.feed(chunk)
+    yield from encoder.finish()
+
+
+if __name__ == "__main__":
+    main()
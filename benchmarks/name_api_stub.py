@@ -0,0 +1,115 @@
+"""
+Serveur local qui imite l'API randomuser.me pour les benchmarks du générateur
+de noms : `?nat=..&gender=..&results=N` renvoie N prénoms tirés d'un vivier
+fixe, après une latence simulée. Le serveur compte les requêtes reçues et le
+maximum de requêtes traitées en même temps ; il peut faire échouer ou bloquer
+les premières requêtes, les retenir derrière une barrière, ou être mis hors
+service pour simuler une coupure du réseau.
+"""
+import json
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+POOL = [f"{syllable}{suffix}" for syllable in ("ka", "mi", "to", "ha", "ru", "se", "lo", "ve", "zi", "no")
+        for suffix in ("ra", "ko", "ne", "li", "to", "mi", "sa", "an", "el", "yo")]
+COUNTRIES = {"japan": "jp", "france": "fr", "usa": "us", "india": "in"}
+
+
+class NameApiStub:
+    """Serveur de test démarré dans un fil ; `sources` remplace les URL de `name_sources`."""
+
+    def __init__(self, latency=0.0, failures=0, failure_status=503, hangs=0, hang_seconds=5.0):
+        self.latency = latency
+        self.failures = failures  # nombre de requêtes à faire échouer avant de répondre
+        self.failure_status = failure_status
+        self.hangs = hangs  # nombre de requêtes bloquées `hang_seconds` avant de répondre
+        self.hang_seconds = hang_seconds
+        self.requests = 0
+        self.names_served = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.down = False
+        # Barrière : tant qu'elle est baissée (`gate.clear()`), les requêtes attendent avant d'être comptées
+        self.gate = threading.Event()
+        self.gate.set()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # En-têtes et corps partent en écritures séparées : sans Nagle, pas d'attente d'accusé
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                stub._serve(self)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def _serve(self, request):
+        self.gate.wait()
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            failing = self.down or self.failures > 0
+            if self.failures > 0:
+                self.failures -= 1
+            hanging = self.hangs > 0
+            if hanging:
+                self.hangs -= 1
+        try:
+            self._respond(request, failing, hanging)
+        except ConnectionError:
+            pass  # le client a abandonné la requête (délai dépassé)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def _respond(self, request, failing, hanging):
+        if self.latency or hanging:
+            threading.Event().wait(self.hang_seconds if hanging else self.latency)
+        if failing:
+            request.send_response(self.failure_status if not self.down else 503)
+            request.send_header("Content-Length", "0")
+            request.end_headers()
+            return
+        query = parse_qs(urlparse(request.path).query)
+        count = int(query.get("results", ["1"])[0])
+        rng = random.Random(hash((query.get("nat", [""])[0], query.get("gender", [""])[0], self.requests)))
+        body = json.dumps({"results": [{"name": {"first": rng.choice(POOL)}} for _ in range(count)]}).encode()
+        with self._lock:
+            self.names_served += count
+        request.send_response(200)
+        request.send_header("Content-Type", "application/json")
+        request.send_header("Content-Length", str(len(body)))
+        request.end_headers()
+        request.wfile.write(body)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}/api/"
+
+    def sources(self, static_sources):
+        """`name_sources` dont les URL pointent vers ce serveur."""
+        return {
+            country: f"{self.url}?nat={COUNTRIES[country]}&gender=" if isinstance(source, str) else source
+            for country, source in static_sources.items()
+        }
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
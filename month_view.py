@@ -0,0 +1,126 @@
+"""
+Vue mensuelle commune aux calendriers de la Rectitude (Cal_Recta.py et
+Cal_Rectitue2Gregorian.py) : grille des jours et panneau des cérémonies, créés
+une seule fois puis réutilisés à chaque changement de mois.
+"""
+import tkinter as tk
+from functools import lru_cache
+
+from robotans.rectitude import MONTHS
+
+# Grille du mois : 5 semaines de 7 jours, créée une seule fois
+GRID_ROWS = 5
+GRID_COLUMNS = 7
+
+
+def cached_month_ceremonies(ceremony_index, maxsize=64):
+    """Cérémonies de chaque jour d'un mois de `ceremony_index`, gardées en cache pour la navigation."""
+    @lru_cache(maxsize=maxsize)
+    def month_ceremonies(an, mois):
+        return tuple(ceremony_index.month(an, mois))
+
+    return month_ceremonies
+
+
+def shift_month(an, month_index, step):
+    """Retourne (an, indice du mois) décalé de `step` mois."""
+    an_shift, month_index = divmod(month_index + step, len(MONTHS))
+    return an + an_shift, month_index
+
+
+class MonthView:
+    """
+    Mixin de la vue mensuelle. La classe qui l'utilise définit `root`,
+    `calendar_frame`, `ceremony_frame`, `year_label`, `month_label`,
+    `current_year`, `current_month_index` et `month_ceremonies`.
+    """
+    ceremonies_title = "Cérémonies et événements :"
+
+    def get_month_events(self):
+        """Événements de chaque jour du mois actuel."""
+        return self.month_ceremonies(self.current_year, self.current_month_index + 1)
+
+    def bind_day(self, day_label, day):
+        """Liaisons propres à la cellule du jour `day`, posées une seule fois."""
+
+    def build_grid(self):
+        """Crée une fois pour toutes les cellules des jours et l'en-tête des cérémonies."""
+        self.day_labels = []
+        for index in range(GRID_ROWS * GRID_COLUMNS):
+            day_label = tk.Label(self.calendar_frame, text=f"{index + 1:02d}", width=4, font=("Helvetica", 14))
+            day_label.grid(row=index // GRID_COLUMNS, column=index % GRID_COLUMNS, padx=5, pady=5)
+            self.bind_day(day_label, index + 1)
+            self.day_labels.append(day_label)
+        self.default_bg = self.day_labels[0].cget("bg")
+        self.visible_days = len(self.day_labels)
+
+        tk.Label(self.ceremony_frame, text=self.ceremonies_title,
+                 font=("Helvetica", 14, "bold"), bg="lightgrey").pack(anchor="w", padx=10, pady=5)
+        self.ceremony_labels = []
+        self.visible_ceremonies = 0
+
+    def refresh_month(self):
+        """Affiche le mois actuel : ses événements ne sont calculés qu'une fois pour la grille et le panneau."""
+        month_events = self.get_month_events()
+        self.show_calendar(month_events)
+        self.show_ceremonies(month_events)
+
+    def show_calendar(self, month_events):
+        """Affiche les jours du mois en réutilisant les cellules."""
+        # Masquer ou réafficher les cellules au-delà du dernier jour du mois
+        for day_label in self.day_labels[len(month_events):self.visible_days]:
+            day_label.grid_remove()
+        for day_label in self.day_labels[self.visible_days:len(month_events)]:
+            day_label.grid()
+        self.visible_days = len(month_events)
+
+        for day_label, events in zip(self.day_labels, month_events):
+            if events:
+                day_label.config(bg="yellow", relief="solid")
+            else:
+                day_label.config(bg=self.default_bg, relief="flat")
+
+        # Préparer les mois voisins pendant que l'interface est inactive
+        self.root.after_idle(self.prefetch_neighbours)
+
+    def show_ceremonies(self, month_events):
+        """Affiche les événements du mois dans le panneau des cérémonies, en réutilisant les lignes."""
+        lines = [
+            f"{day:02d} : {event}"
+            for day, events in enumerate(month_events, start=1)
+            for event in events
+        ]
+
+        while len(self.ceremony_labels) < len(lines):
+            self.ceremony_labels.append(tk.Label(self.ceremony_frame, bg="lightgrey", font=("Helvetica", 12)))
+        for label, line in zip(self.ceremony_labels, lines):
+            label.config(text=line)
+
+        # Les lignes visibles forment toujours le début de la liste
+        for label in self.ceremony_labels[len(lines):self.visible_ceremonies]:
+            label.pack_forget()
+        for label in self.ceremony_labels[self.visible_ceremonies:len(lines)]:
+            label.pack(anchor="w", padx=10)
+        self.visible_ceremonies = len(lines)
+
+    def prefetch_neighbours(self):
+        """Met en cache les cérémonies des mois précédent et suivant."""
+        for step in (-1, 1):
+            an, month_index = shift_month(self.current_year, self.current_month_index, step)
+            self.month_ceremonies(an, month_index + 1)
+
+    def go_to(self, an, month_index):
+        """Affiche directement le mois `month_index` de l'An `an`."""
+        self.current_year = an
+        self.current_month_index = month_index
+        self.year_label.config(text=f"Année : {self.current_year}")
+        self.month_label.config(text=MONTHS[self.current_month_index])
+        self.refresh_month()
+
+    def prev_month(self):
+        """Passe au mois précédent."""
+        self.go_to(*shift_month(self.current_year, self.current_month_index, -1))
+
+    def next_month(self):
+        """Passe au mois suivant."""
+        self.go_to(*shift_month(self.current_year, self.current_month_index, 1))
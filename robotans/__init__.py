@@ -0,0 +1,62 @@
+"""
+Bibliothèque de l'univers des Robotans (calendrier de la Rectitude, langage de
+bataille, événements), sans interface graphique.
+
+Les fonctions courantes sont exposées ici, mais chaque sous-module n'est importé
+qu'au premier accès : `import robotans` ne charge ni Tk, ni NumPy, ni aucune
+bibliothèque de rendu.
+"""
+import importlib
+
+# Nom exporté -> sous-module qui le définit
+_EXPORTS = {
+    "RectitudeDate": "rectitude",
+    "is_leap_year": "rectitude",
+    "get_real_date": "rectitude",
+    "to_ordinal": "rectitude",
+    "from_ordinal": "rectitude",
+    "gregorian_to_rectitude": "rectitude",
+    "format_date": "rectitude",
+    "rectitude_to_gregorian_array": "conversion",
+    "gregorian_to_rectitude_array": "conversion",
+    "CeremonyIndex": "ceremonies",
+    "rectitude_ceremony_index": "ceremonies",
+    "expand_events": "recurrence",
+    "EventQuery": "query",
+    "export_calendar": "export",
+    "LoreDatabase": "database",
+    "cesar_cipher": "battle",
+    "flash_order": "battle",
+    "convert_to_robotan_language_v1": "battle",
+    "convert_to_robotan_language_v2": "battle",
+    "convert_to_robotan_language_v3": "battle",
+    "encode_file": "battle",
+    "encode_stream": "battle",
+    "StreamEncoder": "battle",
+    "compile_pipeline": "pipeline",
+    "register_stage": "pipeline",
+    "LiveEncoder": "live",
+    "decode_v1": "battle_decoder",
+    "decode_v2": "battle_decoder",
+    "decode_v3": "battle_decoder",
+    "decode_flash": "battle_decoder",
+    "decode_file": "battle_decoder",
+    "decode_stream": "battle_decoder",
+    "StreamDecoder": "battle_decoder",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    """Importe le sous-module d'un nom exporté au premier accès."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
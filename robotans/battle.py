@@ -0,0 +1,256 @@
+"""
+Langage de bataille des Robotans : chiffrement V1/V2, notes V3 et Ordre Flash.
+
+Le chiffrement César passe par des tables de translittération précalculées
+(`str.translate` / `bytes.translate`) et le groupement par cinq par des copies
+par pas sur un tampon d'octets : chaque étape est une seule passe en C.
+
+Les fonctions ci-dessous sont la référence de chaque version ; les versions
+sont aussi déclarées comme chaînes d'étapes (`VERSION_STAGES`, voir
+`robotans.pipeline`), compilées en une seule passe de translittération.
+`StreamEncoder` encode ainsi un flux bloc par bloc avec une mémoire bornée ;
+`encode_file` et la ligne de commande s'appuient dessus.
+
+Usage : python -m robotans.battle v2 < journal.txt > journal.v2
+"""
+import argparse
+import os
+import sys
+from functools import lru_cache, partial
+
+from . import flash
+from .pipeline import (
+    GroupWriter, NoteBlockWriter, PipelineEncoder, RunWriter,
+    compile_pipeline, group_text, register_stage, translate_text
+)
+
+SHIFT = 3
+GROUP_SIZE = 5
+NOTES_PER_BLOCK = 4
+CHUNK_SIZE = 1 << 22  # caractères (ou octets pour V2) lus par bloc en mode fichier
+VERSIONS = ("v1", "v2", "v3", "flash")
+
+# Dictionnaire pour associer une lettre à une note de musique avec octaves
+def letter_to_note_with_octave(letter):
+    """Convertit une lettre en note de musique avec octaves."""
+    notes = ['A', 'B', 'C', 'D', 'E', 'F', 'G']
+    letter = letter.upper()
+    if letter.isalpha():
+        index = ord(letter) - ord('A')  # Index de 0 à 25 pour A-Z
+        note = notes[index % 7]  # Sélectionne la note (A à G)
+        octave = (index // 7) + 1  # Calcule l'octave
+        return f"{note}{octave}"
+    return letter  # Conserve les autres caractères tels quels
+
+def _cipher_char(code, shift):
+    """Image d'un point de code par le chiffrement César (None : caractère supprimé)."""
+    char = chr(code)
+    if char.isalpha():
+        return chr(((code - ord('A') + shift) % 26) + ord('A'))
+    if char.isdigit():
+        return char  # Conserve les chiffres
+    return None
+
+class _CipherTable(dict):
+    """Table pour `str.translate` : Latin-1 précalculé, le reste calculé au premier usage."""
+
+    def __init__(self, shift):
+        super().__init__((code, _cipher_char(code, shift)) for code in range(256))
+        self.shift = shift
+
+    def __missing__(self, code):
+        value = self[code] = _cipher_char(code, self.shift)
+        return value
+
+@lru_cache(maxsize=None)
+def cipher_tables(shift=SHIFT):
+    """Tables du décalage `shift` : (table str, table bytes Latin-1, octets à supprimer)."""
+    table = _CipherTable(shift % 26)
+    byte_table = bytes(ord(table[code] or chr(code)) for code in range(256))
+    deleted = bytes(code for code in range(256) if table[code] is None)
+    return table, byte_table, deleted
+
+def cesar_cipher(text, shift=3):
+    """Applique un décalage César de `shift` sur le texte donné."""
+    return translate_text(text.upper(), *cipher_tables(shift))
+
+def group_by_five(text):
+    """Groupe les lettres du texte par blocs de 5."""
+    return group_text(text, GROUP_SIZE)
+
+def reverse_text(text):
+    """Inverse l'ordre des caractères dans le texte."""
+    return text[::-1]
+
+class _NoteTable(dict):
+    """Table pour `str.translate` : chaque lettre devient sa note suivie d'une espace."""
+
+    def __missing__(self, code):
+        char = chr(code)
+        value = self[code] = f"{letter_to_note_with_octave(char)} " if char.isalpha() else None
+        return value
+
+NOTE_TABLE = _NoteTable()
+
+def letter_to_music_with_octave(text):
+    """Convertit chaque lettre en note de musique avec octaves."""
+    return text.translate(NOTE_TABLE)[:-1]
+
+def group_words_by_four(text):
+    """Groupe les mots par blocs de 4 avec formatage."""
+    words = text.split()
+    grouped_blocks = [
+        " ".join(words[i:i+4]).capitalize()
+        for i in range(0, len(words), 4)
+    ]
+    return " / ".join(grouped_blocks)
+
+def flash_order(text):
+    """Convertit le texte en format 'Ordre Flash'."""
+    # Supprimer les espaces, factoriser les lettres consécutives et encadrer avec "!"
+    return flash.encode(text.replace(" ", ""))
+
+def convert_to_robotan_language_v1(text):
+    """Convertit le texte en langage de bataille Robotans V1."""
+    return group_by_five(cesar_cipher(text))
+
+def convert_to_robotan_language_v2(text):
+    """Convertit le texte en langage de bataille Robotans V2 (cryptage renforcé)."""
+    return group_by_five(reverse_text(cesar_cipher(text)))
+
+def convert_to_robotan_language_v3(text):
+    """Convertit le texte en langage de bataille Robotans V3 (notes de musique avec octaves)."""
+    music_text = letter_to_music_with_octave(text)
+    grouped_text = group_words_by_four(music_text)
+    return grouped_text
+
+def _note_image(char):
+    """Image d'un caractère en V3 : sa note suivie d'une espace, rien pour un non-lettre."""
+    return f"{letter_to_note_with_octave(char)} " if char.isalpha() else ""
+
+def _strip_space(char):
+    return "" if char == " " else char
+
+register_stage("cipher", "map", lambda shift=SHIFT: partial(cesar_cipher, shift=shift))
+register_stage("music", "map", lambda: _note_image)
+register_stage("strip_spaces", "map", lambda: _strip_space)
+register_stage("reverse", "reverse")
+register_stage("group5", "writer", partial(GroupWriter, GROUP_SIZE))
+register_stage("group4", "writer", partial(NoteBlockWriter, NOTES_PER_BLOCK))
+register_stage("flash", "writer", RunWriter)
+
+# Chaque version comme chaîne d'étapes enregistrées
+VERSION_STAGES = {
+    "v1": ("cipher", "group5"),
+    "v2": ("cipher", "reverse", "group5"),
+    "v3": ("music", "group4"),
+    "flash": ("strip_spaces", "flash"),
+}
+
+def version_pipeline(version, shift=SHIFT):
+    """Chaîne compilée de la version `version`, avec le décalage `shift`."""
+    if version not in VERSIONS:
+        raise ValueError(f"Version inconnue : {version} (attendu : {', '.join(VERSIONS)})")
+    stages = VERSION_STAGES[version]
+    if shift != SHIFT:
+        stages = tuple(("cipher", shift) if stage == "cipher" else stage for stage in stages)
+    return compile_pipeline(*stages)
+
+class StreamEncoder(PipelineEncoder):
+    """
+    Encodeur incrémental du langage de bataille.
+
+    `feed(chunk)` renvoie la partie de la sortie déjà déterminée et `finish()` un
+    itérateur sur le reste : leur concaténation est identique à la conversion du
+    texte entier, quel que soit le découpage en blocs. Seul l'état de bord est
+    conservé entre deux blocs (reste d'un groupe de cinq, nombre de notes du bloc
+    en cours, dernière série de l'Ordre Flash).
+
+    V2 ne peut rien écrire avant la fin du texte : ses blocs chiffrés sont
+    déversés dans un fichier temporaire dès que `spill_size` caractères sont en
+    attente, puis relus à l'envers par `finish()`.
+    """
+
+    def __init__(self, version="v1", shift=SHIFT, spill_size=CHUNK_SIZE, spill_dir=None):
+        super().__init__(version_pipeline(version, shift), spill_size, spill_dir)
+        self.version = version
+        self.shift = shift
+
+def encode_stream(chunks, version="v1", **options):
+    """Encode un itérable de blocs de texte et produit la sortie morceau par morceau."""
+    encoder = StreamEncoder(version, **options)
+    for chunk in chunks:
+        output = encoder.feed(chunk)
+        if output:
+            yield output
+    yield from encoder.finish()
+
+def _read_chunks(file, chunk_size):
+    """Blocs de texte du fichier ouvert `file`, du début à la fin."""
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+def _read_chunks_reversed(src, chunk_size):
+    """Blocs de texte du fichier `src`, de la fin au début, coupés entre deux caractères UTF-8."""
+    with open(src, "rb") as file:
+        end = file.seek(0, os.SEEK_END)
+        while end > 0:
+            start = max(0, end - max(chunk_size, 4))
+            file.seek(start)
+            block = file.read(end - start)
+            # Les octets de continuation en tête appartiennent au bloc précédent
+            skip = 0
+            while start > 0 and skip < len(block) - 1 and block[skip] & 0xC0 == 0x80:
+                skip += 1
+            yield block[skip:].decode("utf-8")
+            end = start + skip
+
+def _encode_reversed_file(src, chunk_size, pipeline):
+    """Chaîne avec inversion sur un fichier : lu à l'envers, il se passe de fichier temporaire."""
+    encoder = pipeline.encoder()
+    for chunk in _read_chunks_reversed(src, chunk_size):
+        yield encoder.write_reversed(chunk)
+    yield from encoder.finish()
+
+def encode_file(src, dst, version="v1", chunk_size=CHUNK_SIZE, shift=SHIFT):
+    """
+    Encode le fichier `src` en langage de bataille `version` dans `dst`, par blocs
+    de `chunk_size` : la mémoire utilisée ne dépend pas de la taille du fichier.
+    V2 lit `src` de la fin vers le début.
+    """
+    pipeline = version_pipeline(version, shift)
+    if pipeline.reverse:
+        encoded = _encode_reversed_file(src, chunk_size, pipeline)
+        with open(dst, "w", encoding="utf-8", buffering=chunk_size) as output:
+            output.writelines(encoded)
+        return
+    with open(src, encoding="utf-8") as file, \
+            open(dst, "w", encoding="utf-8", buffering=chunk_size) as output:
+        output.writelines(encode_stream(_read_chunks(file, chunk_size), version, shift=shift))
+
+def main():
+    parser = argparse.ArgumentParser(description="Encode un texte en langage de bataille Robotans.")
+    parser.add_argument("version", choices=VERSIONS)
+    parser.add_argument("source", nargs="?", default="-", help="fichier à encoder (défaut : entrée standard)")
+    parser.add_argument("sortie", nargs="?", default="-", help="fichier de sortie (défaut : sortie standard)")
+    parser.add_argument("--bloc", type=int, default=CHUNK_SIZE, help="taille des blocs lus, en caractères")
+    parser.add_argument("--temp", default=None, help="dossier des fichiers temporaires de V2")
+    args = parser.parse_args()
+
+    if args.source != "-" and args.sortie != "-":
+        encode_file(args.source, args.sortie, args.version, args.bloc)
+        return
+    source = sys.stdin if args.source == "-" else open(args.source, encoding="utf-8")
+    output = sys.stdout if args.sortie == "-" else open(args.sortie, "w", encoding="utf-8")
+    try:
+        output.writelines(encode_stream(_read_chunks(source, args.bloc), args.version, spill_dir=args.temp))
+    finally:
+        for file in (source, output):
+            if file not in (sys.stdin, sys.stdout):
+                file.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Décodeurs du langage de bataille des Robotans : retour au texte clair depuis
+V1/V2, les notes de V3 (« G2 f2 a2 c1 / D1 ») et l'Ordre Flash.
+
+L'encodage perd la casse, les espaces et la ponctuation : le décodage rend le
+texte normalisé, soit `cesar_cipher(texte, 0)` pour V1/V2 (lettres en
+majuscules et chiffres) et les lettres en majuscules pour V3. Comme pour les
+encodeurs, chaque version s'utilise d'un bloc (`decode_v1`...), en flux
+(`StreamDecoder`, `decode_stream`) ou sur un fichier (`decode_file`).
+
+Usage : python -m robotans.battle_decoder v2 < journal.v2 > journal.txt
+"""
+import argparse
+import re
+import sys
+from functools import lru_cache
+
+from . import flash
+from .battle import (
+    SHIFT, CHUNK_SIZE, VERSIONS, letter_to_note_with_octave, _read_chunks, _read_chunks_reversed
+)
+from .pipeline import ReverseSpill, translate_text
+
+NOTE_NAMES = "ABCDEFG"
+NOTE_PATTERN = re.compile(r"([A-G])([1-9][0-9]*)")
+# Séparateurs des groupes de cinq et des blocs de notes
+SEPARATORS = " \t\r\n"
+NOTE_SEPARATORS = str.maketrans({"/": " ", "\t": " ", "\r": " ", "\n": " "})
+
+
+@lru_cache(maxsize=None)
+def decipher_tables(shift=SHIFT):
+    """Tables inverses du décalage `shift` : (table str, table bytes Latin-1, octets à supprimer)."""
+    table = {ord(char): None for char in SEPARATORS}
+    for code in range(26):
+        plain = chr((code - shift) % 26 + ord("A"))
+        table[ord("A") + code] = table[ord("a") + code] = plain
+    byte_table = bytes(ord(table.get(code) or chr(code)) for code in range(256))
+    deleted = SEPARATORS.encode("latin-1")
+    return table, byte_table, deleted
+
+
+class _LetterTable(dict):
+    """Note avec octave (« G2 ») -> lettre ; les notes hors A-Z sont calculées au premier usage."""
+
+    def __missing__(self, note):
+        match = NOTE_PATTERN.fullmatch(note)
+        if not match:
+            raise ValueError(f"Note invalide : {note}")
+        index = (int(match.group(2)) - 1) * len(NOTE_NAMES) + NOTE_NAMES.index(match.group(1))
+        value = self[note] = chr(ord("A") + index)
+        return value
+
+
+LETTER_TABLE = _LetterTable(
+    (letter_to_note_with_octave(letter), letter) for letter in map(chr, range(ord("A"), ord("Z") + 1))
+)
+
+
+def decode_v1(text, shift=SHIFT):
+    """Décode un message V1 (groupes de cinq chiffrés par César)."""
+    return translate_text(text, *decipher_tables(shift))
+
+
+def decode_v2(text, shift=SHIFT):
+    """Décode un message V2 (V1 inversé)."""
+    return decode_v1(text, shift)[::-1]
+
+
+def _notes_to_letters(notes):
+    return "".join(map(LETTER_TABLE.__getitem__, notes))
+
+
+def decode_v3(text):
+    """Décode un message V3 : chaque note avec octave redevient sa lettre, en majuscule."""
+    return _notes_to_letters(text.upper().translate(NOTE_SEPARATORS).split())
+
+
+def decode_flash(text):
+    """Décode un Ordre Flash « !A3B! » : chaque caractère suivi d'un nombre est répété."""
+    return flash.decode(text)
+
+
+DECODERS = {"v1": decode_v1, "v2": decode_v2, "v3": decode_v3, "flash": decode_flash}
+
+
+class StreamDecoder:
+    """
+    Décodeur incrémental, symétrique de `StreamEncoder` : `feed(chunk)` renvoie
+    le texte clair déjà déterminé, `finish()` un itérateur sur le reste.
+
+    Seul l'état de bord est conservé : la note coupée en fin de bloc pour V3, la
+    dernière série de l'Ordre Flash (dont la longueur peut se poursuivre). V2 passe
+    par un `ReverseSpill`, comme à l'encodage.
+    """
+
+    def __init__(self, version="v1", shift=SHIFT, spill_size=CHUNK_SIZE, spill_dir=None):
+        if version not in VERSIONS:
+            raise ValueError(f"Version inconnue : {version} (attendu : {', '.join(VERSIONS)})")
+        self.version = version
+        self.shift = shift
+        self._feed = getattr(self, f"_feed_{version}")
+        self._finish = getattr(self, f"_finish_{version}")
+        self._pending = ""     # V3 : note incomplète ; Flash : dernière série
+        self._started = False  # Flash : délimiteur d'ouverture lu
+        self._spill = ReverseSpill(spill_size, spill_dir) if version == "v2" else None
+
+    def feed(self, chunk):
+        """Décode le bloc `chunk` et renvoie le texte clair désormais déterminé."""
+        return self._feed(chunk)
+
+    def finish(self):
+        """Itérateur sur la fin du texte clair (tout le texte pour V2)."""
+        return self._finish()
+
+    def _feed_v1(self, chunk):
+        return decode_v1(chunk, self.shift)
+
+    def _finish_v1(self):
+        return iter(())
+
+    def _feed_v2(self, chunk):
+        self._spill.append(decode_v1(chunk, self.shift))
+        return ""
+
+    def _finish_v2(self):
+        return self._spill.reversed_chunks()
+
+    def _feed_v3(self, chunk):
+        # La dernière note peut se poursuivre dans le bloc suivant
+        complete, _, self._pending = (self._pending + chunk.upper().translate(NOTE_SEPARATORS)).rpartition(" ")
+        return _notes_to_letters(complete.split())
+
+    def _finish_v3(self):
+        pending, self._pending = self._pending, ""
+        yield _notes_to_letters(pending.split())
+
+    def _feed_flash(self, chunk):
+        text = self._pending + chunk
+        if not self._started and text:
+            if text[0] != flash.DELIMITER:
+                raise ValueError("Un Ordre Flash commence et se termine par « ! ».")
+            text = text[1:]
+            self._started = True
+        # La dernière série et sa longueur peuvent se poursuivre dans le bloc suivant
+        last = flash.last_token_start(text)
+        self._pending = text[last:]
+        return flash.decode_runs(text[:last])
+
+    def _finish_flash(self):
+        # Il ne reste que le délimiteur de fin
+        if not self._started or self._pending != flash.DELIMITER:
+            raise ValueError("Un Ordre Flash commence et se termine par « ! ».")
+        self._pending = ""
+        return iter(())
+
+
+def decode_stream(chunks, version="v1", **options):
+    """Décode un itérable de blocs et produit le texte clair morceau par morceau."""
+    decoder = StreamDecoder(version, **options)
+    for chunk in chunks:
+        plain = decoder.feed(chunk)
+        if plain:
+            yield plain
+    yield from decoder.finish()
+
+
+def decode_file(src, dst, version="v1", chunk_size=CHUNK_SIZE, shift=SHIFT):
+    """
+    Décode le fichier `src` dans `dst` par blocs de `chunk_size`. Comme à
+    l'encodage, V2 lit `src` de la fin vers le début.
+    """
+    with open(dst, "w", encoding="utf-8", buffering=chunk_size) as output:
+        if version == "v2":
+            output.writelines(decode_v1(chunk, shift)[::-1] for chunk in _read_chunks_reversed(src, chunk_size))
+            return
+        with open(src, encoding="utf-8") as file:
+            output.writelines(decode_stream(_read_chunks(file, chunk_size), version, shift=shift))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Décode un message en langage de bataille Robotans.")
+    parser.add_argument("version", choices=VERSIONS)
+    parser.add_argument("source", nargs="?", default="-", help="fichier à décoder (défaut : entrée standard)")
+    parser.add_argument("sortie", nargs="?", default="-", help="fichier de sortie (défaut : sortie standard)")
+    parser.add_argument("--bloc", type=int, default=CHUNK_SIZE, help="taille des blocs lus, en caractères")
+    parser.add_argument("--temp", default=None, help="dossier des fichiers temporaires de V2")
+    args = parser.parse_args()
+
+    if args.source != "-" and args.sortie != "-":
+        decode_file(args.source, args.sortie, args.version, args.bloc)
+        return
+    source = sys.stdin if args.source == "-" else open(args.source, encoding="utf-8")
+    output = sys.stdout if args.sortie == "-" else open(args.sortie, "w", encoding="utf-8")
+    try:
+        output.writelines(decode_stream(_read_chunks(source, args.bloc), args.version, spill_dir=args.temp))
+    finally:
+        for file in (source, output):
+            if file not in (sys.stdin, sys.stdout):
+                file.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+Noyau NumPy du langage de bataille, pour le trafic en masse.
+
+Les textes ASCII ou Latin-1 sont lus comme des vues `np.frombuffer` d'octets.
+Le chiffrement César ne passe pas par NumPy : un `bytes.translate` sur une
+table de 256 octets, qui supprime au passage les caractères ignorés, chiffre
+et filtre en une seule passe C, là où indexation avancée et masque booléen en
+font deux et perdent face à `str.translate`. NumPy sert là où il gagne : les
+notes de V3 par une table de jetons, et les séparateurs de groupes, insérés en
+remodelant le tableau de sortie. Les résultats sont identiques à ceux de
+`robotans.battle`.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from .battle import (
+    SHIFT, GROUP_SIZE, NOTES_PER_BLOCK, cesar_cipher, letter_to_note_with_octave,
+    convert_to_robotan_language_v3
+)
+
+SPACE = ord(" ")
+SLASH = ord("/")
+SHARP_S = 0xDF  # « ß », le seul caractère Latin-1 qui se double en majuscule (« SS »)
+LATIN1 = [chr(code) for code in range(256)]
+
+
+def as_array(data):
+    """Vue uint8 de `data` (bytes, bytearray, memoryview ; str Latin-1 encodé d'abord)."""
+    if isinstance(data, str):
+        data = data.encode("latin-1")
+    return np.frombuffer(data, dtype=np.uint8)
+
+
+@lru_cache(maxsize=None)
+def cipher_tables(shift=SHIFT):
+    """
+    Tables du décalage `shift` : (octet chiffré, octet conservé) pour chaque valeur
+    Latin-1, en tableaux, puis la table et les octets supprimés pour `bytes.translate`.
+    """
+    ciphered = [cesar_cipher(char, shift) for char in LATIN1]
+    table = np.array([ord(text[0]) if text else 0 for text in ciphered], dtype=np.uint8)
+    kept = np.array([bool(text) for text in ciphered])
+    deleted = bytes(code for code in range(256) if not kept[code])
+    return table, kept, table.tobytes(), deleted
+
+
+@lru_cache(maxsize=None)
+def note_tables():
+    """
+    Jetons de V3 pour chaque valeur Latin-1 : (jetons complétés par des zéros,
+    longueurs, lettres conservées). Les lettres que `letter_to_note_with_octave`
+    refuse (« ß ») ont une longueur de -1.
+    """
+    notes = []
+    for char in LATIN1:
+        if not char.isalpha():
+            notes.append("")
+            continue
+        try:
+            notes.append(letter_to_note_with_octave(char))
+        except TypeError:
+            notes.append(None)
+    width = max(len(note) for note in notes if note)
+    tokens = np.zeros((256, width), dtype=np.uint8)
+    lengths = np.zeros(256, dtype=np.int64)
+    for code, note in enumerate(notes):
+        if note is None:
+            lengths[code] = -1
+        elif note:
+            tokens[code, :len(note)] = np.frombuffer(note.encode("ascii"), dtype=np.uint8)
+            lengths[code] = len(note)
+    return tokens, lengths, lengths != 0
+
+
+@lru_cache(maxsize=None)
+def ascii_note_rows():
+    """Note suivie d'une espace (« G2 », « g2 ») pour chaque lettre ASCII : (majuscules, minuscules)."""
+    tokens = note_tables()[0]
+    upper = np.full((256, 3), SPACE, dtype=np.uint8)
+    upper[:, :2] = tokens[:, :2]
+    lower = upper.copy()
+    lower[:, 0] |= 0x20
+    return upper, lower
+
+
+def cipher_array(data, shift=SHIFT):
+    """Version octets de `cesar_cipher` : tableau uint8 du texte chiffré."""
+    if isinstance(data, str):
+        data = data.encode("latin-1")
+    table, kept, translation, deleted = cipher_tables(shift)
+    if SHARP_S in data:
+        # « ß » devient « SS » : deux octets chiffrés identiques
+        array = as_array(data)
+        return np.repeat(table[array], kept[array].astype(np.intp) + (array == SHARP_S))
+    return np.frombuffer(bytes(data).translate(translation, deleted), dtype=np.uint8)
+
+
+def group_array(array, size=GROUP_SIZE, separator=SPACE):
+    """Version NumPy de `group_by_five` : insère `separator` tous les `size` octets."""
+    count = len(array)
+    if count <= size:
+        return array.copy()
+    full, rest = divmod(count, size)
+    grouped = np.full(full * (size + 1) + rest, separator, dtype=np.uint8)
+    # Les groupes complets, vus comme une matrice dont la dernière colonne est le séparateur
+    grouped[:full * (size + 1)].reshape(full, size + 1)[:, :size] = array[:full * size].reshape(full, size)
+    grouped[full * (size + 1):] = array[full * size:]
+    return grouped if rest else grouped[:-1]
+
+
+def _letters(array):
+    """Lettres de `array` ; refuse celles qui n'ont pas de note, comme `letter_to_note_with_octave`."""
+    is_letter = note_tables()[2]
+    letters = array[is_letter[array]]
+    if np.any(letters == SHARP_S):
+        letter_to_note_with_octave(LATIN1[SHARP_S])
+    return letters
+
+
+def music_array(data):
+    """Version NumPy de `letter_to_music_with_octave` : notes séparées par une espace."""
+    letters = _letters(as_array(data))
+    if not letters.size:
+        return np.zeros(0, dtype=np.uint8)
+    if letters.max() < 0x80:
+        # Lettres ASCII : chaque note fait deux caractères, une ligne de table par lettre
+        return np.take(ascii_note_rows()[0], letters, axis=0).reshape(-1)[:-1]
+    # Jetons de longueur variable : masque des octets utiles de chaque ligne
+    tokens, lengths, _ = note_tables()
+    width = tokens.shape[1]
+    rows = np.full((letters.size, width + 1), SPACE, dtype=np.uint8)
+    rows[:, :width] = np.take(tokens, letters, axis=0)
+    useful = np.arange(width + 1) < lengths[letters][:, None]
+    useful[:, width] = True
+    return rows[useful][:-1]
+
+
+def _note_blocks(letters):
+    """Blocs « G2 f2 a2 c1 / » de lettres ASCII, la dernière note suivie de son séparateur."""
+    upper, lower = ascii_note_rows()
+    notes = np.take(lower, letters, axis=0)
+    notes[::NOTES_PER_BLOCK] = np.take(upper, letters[::NOTES_PER_BLOCK], axis=0)
+    full = len(letters) // NOTES_PER_BLOCK
+    block_width = NOTES_PER_BLOCK * 3 + 2
+    blocks = np.full((full, block_width), SPACE, dtype=np.uint8)
+    blocks[:, :-2] = notes[:full * NOTES_PER_BLOCK].reshape(full, block_width - 2)
+    blocks[:, -2] = SLASH
+    return np.concatenate([blocks.reshape(-1), notes[full * NOTES_PER_BLOCK:].reshape(-1)])
+
+
+def v3_array(data):
+    """
+    Version NumPy de `convert_to_robotan_language_v3` : blocs de quatre notes
+    « G2 f2 a2 c1 », séparés par « / ». Les lettres accentuées, aux notes de
+    longueur variable, passent par `convert_to_robotan_language_v3`.
+    """
+    array = as_array(data)
+    letters = _letters(array)
+    if not letters.size:
+        return np.zeros(0, dtype=np.uint8)
+    if letters.max() >= 0x80:
+        return as_array(convert_to_robotan_language_v3(array.tobytes().decode("latin-1")).encode("latin-1"))
+    # Sans le séparateur qui suit la dernière note
+    return _note_blocks(letters)[:-(3 if len(letters) % NOTES_PER_BLOCK == 0 else 1)]
+
+
+def encode_v1(data, shift=SHIFT):
+    """V1 d'un texte ASCII ou Latin-1, en octets."""
+    return group_array(cipher_array(data, shift)).tobytes()
+
+
+def encode_v2(data, shift=SHIFT):
+    """V2 d'un texte ASCII ou Latin-1, en octets."""
+    return group_array(cipher_array(data, shift)[::-1]).tobytes()
+
+
+def encode_v3(data):
+    """V3 d'un texte ASCII ou Latin-1, en octets."""
+    return v3_array(data).tobytes()
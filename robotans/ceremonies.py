@@ -0,0 +1,199 @@
+"""
+Index compilé des cérémonies de la Rectitude.
+
+Les clés des cérémonies sont soit récurrentes (« 15 Septium »), soit propres à
+une année (« 15 Septium, An 42 »). Les premières sont rangées dans un tableau
+indexé par le jour de l'année, les secondes dans une surcouche indexée par
+ordinal : un mois ou une année d'annotations s'obtient en une tranche.
+
+Plusieurs événements peuvent tomber le même jour : chaque case contient la liste
+de ses événements, et les collisions détectées au chargement sont conservées
+dans `conflicts`.
+"""
+import re
+from bisect import bisect_left
+
+from .rectitude import (
+    MONTHS, DAYS_PER_MONTH, SILENCE_MONTH, EXTRA_DAYS_LEAP,
+    days_in_month, days_in_year, days_before_year, to_ordinal, from_ordinal, format_date
+)
+
+CEREMONY_KEY_PATTERN = re.compile(r"(\d{1,2})\s+(.+?)(?:,\s*An\s+(-?\d+))?$")
+DAYS_IN_LONGEST_YEAR = (SILENCE_MONTH - 1) * DAYS_PER_MONTH + EXTRA_DAYS_LEAP
+
+# Liste de paires (jour, cérémonie) : un même jour peut porter plusieurs événements
+CEREMONIES = [
+    # Cérémonies et événements récurrents
+    ("1 Ordium", "Cérémonie de la Réinitialisation"),
+    ("15 Ordium", "Cérémonie de la Fondation"),
+    ("25 Fervor", "Rite de la Fraternité"),
+    ("5 Laboris", "Cérémonie des Mains du Travail"),
+    ("10 Laboris", "Rituel de la Diligence"),
+    ("15 Prudium", "Rituel de la Vigilance"),
+    ("18 Valoris", "Honneur aux Méritants"),
+    ("28 Constium", "Serment de l’Éternelle Fidélité"),
+    ("5 Septium", "Marche de la Dévotion"),
+    ("14 Septium", "Jour de la Perfection"),
+    ("15 Septium", "Anniversaire du Premier Prototype Homo Mecanicus"),
+    ("18 Servium", "Fête du Service"),
+    ("20 Fortium", "Fête de la Résilience"),
+    ("12 Fortium", "Épreuves de Résilience"),
+    ("10 Decorum", "Semaine de la Rectitude"),
+    ("15 Decorum", "Rites de la Perfection Esthétique"),
+    ("30 Decorum", "Cérémonie du Serment de Pureté"),
+    ("10 Rectium", "Cérémonie des Légataires"),
+    ("15 Rectium", "Apparition des enfants hybrides"),
+    ("20 Finalis", "Rite de la Purification"),
+    ("25 Finalis", "Veillée de la Pureté"),
+    ("30 Finalis", "La Veillée du Recueillement"),
+
+    # Jours du Silence
+    ("1 Jours du Silence", "L'Apurement"),
+    ("2 Jours du Silence", "Les Jours de la Conformité"),
+    ("3 Jours du Silence", "La Récitation de la Rectitude"),
+    ("4 Jours du Silence", "Le Jour du Réveil"),
+    ("5 Jours du Silence", "Le Grand Appurement (année bissextile uniquement)"),
+
+    # Dates spéciales (100e, 200e, 300e jours)
+    ("10 Laboris", "100e jour de l'année"),
+    ("20 Fortium", "200e jour de l'année"),
+    ("30 Decorum", "300e jour de l'année"),
+
+    # Dates historiques
+    ("1 Ordium, An 0", "Création officielle de la Rectitude (1er janvier 1972)"),
+    ("8 Fervor, An 20", "Commémoration de la Première Rébellion Contrôlée (8 février 1992)"),
+    ("15 Septium, An 42", "Premier prototype Homo Mecanicus (15 juillet 2014)"),
+    ("15 Rectium, An 45", "Naissance des enfants hybrides (15 novembre 2017)")
+]
+
+SPECIAL_DATES = {
+    "10 Laboris": "100e jour de l'année",
+    "20 Fortium": "200e jour de l'année",
+    "30 Decorum": "300e jour de l'année",
+}
+
+
+def parse_ceremony_key(key):
+    """Décompose « 15 Septium » ou « 15 Septium, An 42 » en (an ou None, mois, jour)."""
+    match = CEREMONY_KEY_PATTERN.match(key.strip())
+    if not match or match.group(2) not in MONTHS:
+        raise ValueError(f"Clé de cérémonie invalide : {key}")
+    day, month, year = match.groups()
+    month, day = MONTHS.index(month) + 1, int(day)
+    if year is not None:
+        return int(year), month, day
+    longest = DAYS_PER_MONTH if month < SILENCE_MONTH else EXTRA_DAYS_LEAP
+    if not 1 <= day <= longest:
+        raise ValueError(f"Jour {day} invalide pour {MONTHS[month - 1]}.")
+    return None, month, day
+
+
+class CeremonyIndex:
+    def __init__(self, ceremonies=()):
+        # Cérémonies récurrentes, indexées par jour de l'année (0 à 364)
+        self.recurring = [[] for _ in range(DAYS_IN_LONGEST_YEAR)]
+        # Dates propres à une année, indexées par ordinal
+        self.overlay = {}
+        self._overlay_ordinals = []
+        self._overlay_dirty = False
+        # Collisions rencontrées : (clé, événements du jour)
+        self.conflicts = []
+
+        if isinstance(ceremonies, dict):
+            ceremonies = ceremonies.items()
+        for key, name in ceremonies:
+            self.add(key, name)
+
+    def _slots(self, key, create=False):
+        """
+        Liste des événements correspondant à la clé `key`, et liste des
+        cérémonies récurrentes du même jour (vide pour une clé récurrente).
+        Renvoie None pour une date de la surcouche sans événement, sauf avec `create`.
+        """
+        year, month, day = parse_ceremony_key(key)
+        recurring = self.recurring[(month - 1) * DAYS_PER_MONTH + day - 1]
+        if year is None:
+            return recurring, []
+        ordinal = to_ordinal(year, month, day)
+        if ordinal not in self.overlay:
+            if not create:
+                return None
+            self.overlay[ordinal] = []
+            self._overlay_dirty = True
+        return self.overlay[ordinal], recurring
+
+    def add(self, key, name):
+        """Ajoute l'événement `name` au jour `key` ; signale une collision éventuelle."""
+        slot, recurring = self._slots(key, create=True)
+        if name in slot:
+            return
+        # Une date propre à une année tombe aussi sur les cérémonies récurrentes du jour
+        if slot or recurring:
+            self.conflicts.append((key, recurring + slot + [name]))
+        slot.append(name)
+
+    def remove(self, key, name):
+        """Retire l'événement `name` du jour `key` ; lève KeyError s'il n'y figure pas."""
+        slots = self._slots(key)
+        if slots is None or name not in slots[0]:
+            raise KeyError(f"Aucun événement « {name} » le {key}")
+        slots[0].remove(name)
+
+    def items(self):
+        """Parcourt tous les événements sous forme de paires (clé, événement)."""
+        for day_of_year, names in enumerate(self.recurring):
+            month, day = divmod(day_of_year, DAYS_PER_MONTH)
+            for name in names:
+                yield f"{day + 1} {MONTHS[month]}", name
+        for ordinal in self.overlay_ordinals:
+            for name in self.overlay[ordinal]:
+                yield format_date(from_ordinal(ordinal)), name
+
+    @property
+    def overlay_ordinals(self):
+        """Ordinaux triés de la surcouche, retriés seulement après un ajout."""
+        if self._overlay_dirty:
+            self._overlay_ordinals = sorted(self.overlay)
+            self._overlay_dirty = False
+        return self._overlay_ordinals
+
+    def _annotate(self, first_ordinal, start, length):
+        """Tranche du tableau récurrent, complétée par la surcouche annuelle."""
+        annotations = [tuple(names) for names in self.recurring[start:start + length]]
+        ordinals = self.overlay_ordinals
+        low = bisect_left(ordinals, first_ordinal)
+        high = bisect_left(ordinals, first_ordinal + length, low)
+        for ordinal in ordinals[low:high]:
+            annotations[ordinal - first_ordinal] += tuple(self.overlay[ordinal])
+        return annotations
+
+    def month(self, an, mois):
+        """Événements de chaque jour du mois `mois` de l'An `an` (un tuple par jour)."""
+        start = (mois - 1) * DAYS_PER_MONTH
+        return self._annotate(days_before_year(an) + start, start, days_in_month(an, mois))
+
+    def year(self, an):
+        """Événements de chaque jour de l'An `an`, indexés par jour de l'année."""
+        return self._annotate(days_before_year(an), 0, days_in_year(an))
+
+    def get(self, an, mois, jour):
+        """Tuple des événements du jour (an, mois, jour)."""
+        ordinal = to_ordinal(an, mois, jour)
+        return tuple(self.recurring[(mois - 1) * DAYS_PER_MONTH + jour - 1]) + tuple(self.overlay.get(ordinal, ()))
+
+    def conflict_report(self, expected=None):
+        """
+        Lignes décrivant les collisions détectées au chargement, sauf celles
+        voulues : `expected` associe une clé à l'événement qui peut s'y ajouter.
+        """
+        expected = expected or {}
+        return [
+            f"Plusieurs événements le {key} : {' / '.join(names)}"
+            for key, names in self.conflicts
+            if expected.get(key) != names[-1]
+        ]
+
+
+def rectitude_ceremony_index():
+    """Index des cérémonies officielles de la Rectitude et des dates spéciales."""
+    return CeremonyIndex(CEREMONIES + list(SPECIAL_DATES.items()))
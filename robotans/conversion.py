@@ -0,0 +1,73 @@
+"""Conversions vectorisées Rectitude <-> grégorien sur des tableaux NumPy."""
+import numpy as np
+
+from .rectitude import (
+    START_DATE, START_YEAR, DAYS_PER_MONTH, SILENCE_MONTH, EXTRA_DAYS_NORMAL,
+    CYCLE_YEARS, DAYS_PER_CYCLE, YEAR_OFFSETS
+)
+
+EPOCH = np.datetime64(START_DATE.date(), "D")
+_YEAR_OFFSETS = np.array(YEAR_OFFSETS, dtype=np.int64)
+
+
+def days_before_years(years):
+    """Version vectorisée de `days_before_year`."""
+    cycles, years_in_cycle = np.divmod(years, CYCLE_YEARS)
+    return cycles * DAYS_PER_CYCLE + _YEAR_OFFSETS[years_in_cycle]
+
+
+def is_leap_years(years):
+    """Version vectorisée de `is_leap_year`."""
+    year = years + START_YEAR
+    return (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+
+
+def to_ordinals(years, months, days):
+    """Version vectorisée de `to_ordinal` : tableaux (an, mois, jour) -> ordinaux."""
+    years, months, days = np.broadcast_arrays(
+        np.asarray(years, dtype=np.int64),
+        np.asarray(months, dtype=np.int64),
+        np.asarray(days, dtype=np.int64),
+    )
+
+    if np.any((months < 1) | (months > SILENCE_MONTH)):
+        raise ValueError(f"Mois invalide : les mois vont de 1 à {SILENCE_MONTH}.")
+    month_lengths = np.where(
+        months < SILENCE_MONTH, DAYS_PER_MONTH, EXTRA_DAYS_NORMAL + is_leap_years(years)
+    )
+    if np.any((days < 1) | (days > month_lengths)):
+        raise ValueError("Jour invalide pour le mois indiqué.")
+
+    return days_before_years(years) + (months - 1) * DAYS_PER_MONTH + days - 1
+
+
+def from_ordinals(ordinals):
+    """Version vectorisée de `from_ordinal` : ordinaux -> tableaux (an, mois, jour)."""
+    ordinals = np.asarray(ordinals, dtype=np.int64)
+    cycles, rest = np.divmod(ordinals, DAYS_PER_CYCLE)
+
+    # Estimation par l'année moyenne du cycle, puis correction d'au plus un an
+    years = rest * CYCLE_YEARS // DAYS_PER_CYCLE
+    years -= _YEAR_OFFSETS[years] > rest
+    years += _YEAR_OFFSETS[years + 1] <= rest
+
+    day_of_year = rest - _YEAR_OFFSETS[years]
+    months = np.minimum(day_of_year // DAYS_PER_MONTH, SILENCE_MONTH - 1) + 1
+    days = day_of_year - (months - 1) * DAYS_PER_MONTH + 1
+    return cycles * CYCLE_YEARS + years, months, days
+
+
+def rectitude_to_gregorian_array(years, months, days):
+    """
+    Convertit des tableaux (an, mois, jour) de la Rectitude en tableau `datetime64[D]`.
+    Les mois vont de 1 (Ordium) à 13 (Jours du Silence).
+    """
+    return EPOCH + to_ordinals(years, months, days).astype("timedelta64[D]")
+
+
+def gregorian_to_rectitude_array(dates):
+    """
+    Convertit un tableau de dates grégoriennes en trois tableaux (an, mois, jour)
+    du calendrier de la Rectitude.
+    """
+    return from_ordinals((np.asarray(dates, dtype="datetime64[D]") - EPOCH).astype(np.int64))
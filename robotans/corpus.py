@@ -0,0 +1,126 @@
+"""
+Encodage d'une arborescence de transcriptions en langage de bataille.
+
+Les fichiers sont répartis entre les processus d'un `ProcessPoolExecutor` ;
+chaque sortie est écrite à côté de son entrée (« rapport.txt » -> « rapport.txt.v2 »).
+Une empreinte SHA-256 du contenu de chaque entrée est conservée dans un
+manifeste à la racine du dossier : un fichier inchangé dont la sortie existe
+n'est pas réencodé.
+
+Usage : python -m robotans.corpus transcriptions/ --version v2 --processus 8
+"""
+import argparse
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .battle import VERSIONS, encode_file
+from .stores import load_json, save_json
+
+MANIFEST_NAME = ".robotans_corpus.json"
+DEFAULT_EXTENSIONS = (".txt", ".md")
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def output_path(src, version):
+    """Fichier de sortie de `src` pour `version`, à côté de l'entrée."""
+    return f"{src}.{version}"
+
+
+def file_digest(path):
+    """Empreinte SHA-256 du contenu de `path`, lue par blocs."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def find_sources(root, extensions=DEFAULT_EXTENSIONS):
+    """Fichiers de `root` (récursivement) dont l'extension figure dans `extensions`."""
+    for directory, subdirectories, filenames in os.walk(root):
+        subdirectories.sort()
+        for filename in sorted(filenames):
+            if os.path.splitext(filename)[1].lower() in extensions:
+                yield os.path.join(directory, filename)
+
+
+def encode_source(task):
+    """
+    Travail d'un processus : encode un fichier s'il a changé. Renvoie
+    (chemin, empreinte, taille, encodé ou non, erreur éventuelle).
+    """
+    src, version, known_digest = task
+    try:
+        digest = file_digest(src)
+        size = os.path.getsize(src)
+        if digest == known_digest and os.path.exists(output_path(src, version)):
+            return src, digest, size, False, None
+        encode_file(src, output_path(src, version), version)
+        return src, digest, size, True, None
+    except (OSError, ValueError, TypeError) as error:
+        return src, None, 0, False, f"{type(error).__name__} : {error}"
+
+
+def encode_corpus(root, version="v1", workers=None, extensions=DEFAULT_EXTENSIONS, force=False):
+    """
+    Encode tous les fichiers de `root` en `version` sur `workers` processus.
+    Renvoie un résumé : fichiers encodés, ignorés (inchangés), en erreur,
+    octets encodés et durée.
+    """
+    manifest_path = os.path.join(root, MANIFEST_NAME)
+    manifest = load_json(manifest_path, {})
+    digests = manifest.setdefault(version, {})
+
+    sources = list(find_sources(root, extensions))
+    # Les plus gros fichiers d'abord, pour que les processus finissent ensemble
+    sources.sort(key=os.path.getsize, reverse=True)
+    tasks = [
+        (src, version, None if force else digests.get(os.path.relpath(src, root)))
+        for src in sources
+    ]
+
+    workers = workers or os.cpu_count() or 1
+    summary = {"encodes": 0, "ignores": 0, "erreurs": [], "octets": 0}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Les petits fichiers sont envoyés par lots pour limiter les échanges entre processus
+        chunksize = max(1, len(tasks) // (workers * 8))
+        for src, digest, size, encoded, error in executor.map(encode_source, tasks, chunksize=chunksize):
+            if error:
+                summary["erreurs"].append((src, error))
+                continue
+            digests[os.path.relpath(src, root)] = digest
+            if encoded:
+                summary["encodes"] += 1
+                summary["octets"] += size
+            else:
+                summary["ignores"] += 1
+    summary["duree"] = time.perf_counter() - start
+    save_json(manifest_path, manifest)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Encode une arborescence de transcriptions en langage de bataille.")
+    parser.add_argument("dossier", help="racine des transcriptions")
+    parser.add_argument("--version", choices=VERSIONS, default="v1")
+    parser.add_argument("--processus", type=int, default=None, help="nombre de processus (défaut : un par cœur)")
+    parser.add_argument("--extensions", nargs="+", default=list(DEFAULT_EXTENSIONS),
+                        help="extensions des fichiers à encoder (défaut : .txt .md)")
+    parser.add_argument("--forcer", action="store_true", help="réencode même les fichiers inchangés")
+    args = parser.parse_args()
+
+    extensions = tuple(extension.lower() for extension in args.extensions)
+    summary = encode_corpus(args.dossier, args.version, args.processus, extensions, args.forcer)
+    duration = max(summary["duree"], 1e-9)
+    print(f"{summary['encodes']} fichiers encodés, {summary['ignores']} inchangés, "
+          f"{len(summary['erreurs'])} en erreur en {summary['duree']:.2f} s")
+    print(f"{summary['encodes'] / duration:.1f} fichiers/s, {summary['octets'] / 1_000_000 / duration:.1f} Mo/s")
+    for src, error in summary["erreurs"]:
+        print(f"  {src} : {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""
+Base SQLite des factions, personnages et événements.
+
+Chaque ajout, modification ou suppression est une requête sur une table
+indexée, en O(log n), au lieu de réécrire tout un fichier JSON ; les doublons
+de noms sont refusés par un index unique. Les écritures groupées passent par
+`batch()`, en une seule transaction. `import_json` et `fill_once` reprennent
+une fois pour toutes le contenu de factions.json, perso.json et events.json ;
+la table `imports` en garde trace.
+
+Usage : python -m robotans.database import [--factions factions.json] [--persons perso.json] [--events events.json]
+"""
+import argparse
+import os
+import sqlite3
+from collections import Counter
+from contextlib import contextmanager
+
+from .rectitude import MONTHS
+from .recurrence import day_events
+from .stores import load_json
+
+DATABASE_FILE = "robotans.db"
+FACTIONS_FILE = "factions.json"
+PERSONS_FILE = "perso.json"
+EVENTS_FILE = "events.json"
+EVENT_FIELDS = ("name", "recurrence", "faction", "person", "year")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS factions (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS persons (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    month TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    recurrence TEXT,
+    faction TEXT,
+    person TEXT,
+    year INTEGER
+);
+CREATE INDEX IF NOT EXISTS events_date ON events (month, day);
+CREATE INDEX IF NOT EXISTS events_faction ON events (faction);
+CREATE INDEX IF NOT EXISTS events_person ON events (person);
+CREATE TABLE IF NOT EXISTS imports (name TEXT PRIMARY KEY);
+"""
+
+
+class DuplicateNameError(ValueError):
+    """Le nom existe déjà dans la table."""
+
+
+class NameTable:
+    """Noms uniques d'une table (factions ou personnages), dans l'ordre d'ajout."""
+
+    def __init__(self, database, table):
+        self.database = database
+        self.table = table
+
+    def __contains__(self, name):
+        return self.database.execute(f"SELECT 1 FROM {self.table} WHERE name = ?", (name,)).fetchone() is not None
+
+    def __len__(self):
+        return self.database.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def __iter__(self):
+        return (name for name, in self.database.execute(f"SELECT name FROM {self.table} ORDER BY id"))
+
+    def names(self):
+        """Liste des noms, dans l'ordre d'ajout."""
+        return list(self)
+
+    def add(self, name):
+        """Ajoute `name` ; lève `DuplicateNameError` s'il existe déjà."""
+        try:
+            self.database.write(f"INSERT INTO {self.table} (name) VALUES (?)", (name,))
+        except sqlite3.IntegrityError:
+            raise DuplicateNameError(f"{name} existe déjà") from None
+
+    def add_many(self, names):
+        """Ajoute les noms absents en une transaction ; renvoie le nombre de noms ajoutés."""
+        with self.database.batch():
+            before = self.database.connection.total_changes
+            self.database.connection.executemany(
+                f"INSERT OR IGNORE INTO {self.table} (name) VALUES (?)", ((name,) for name in names)
+            )
+            return self.database.connection.total_changes - before
+
+    def rename(self, old, new):
+        """Renomme `old` en `new`, à la même place ; renvoie False si `old` n'existe pas."""
+        try:
+            cursor = self.database.write(f"UPDATE {self.table} SET name = ? WHERE name = ?", (new, old))
+        except sqlite3.IntegrityError:
+            raise DuplicateNameError(f"{new} existe déjà") from None
+        return cursor.rowcount > 0
+
+    def remove(self, name):
+        """Supprime `name` ; renvoie False s'il n'existe pas."""
+        return self.database.write(f"DELETE FROM {self.table} WHERE name = ?", (name,)).rowcount > 0
+
+    def fill_once(self, filename, default_names):
+        """
+        Remplit la table au premier usage de la base, depuis le fichier JSON
+        `filename` ou avec `default_names` ; une table vidée ensuite le reste.
+        """
+        with self.database.batch():
+            if self.database.first_import(self.table) and not len(self):
+                self.add_many(_read_json(filename, default_names))
+        return self
+
+
+class EventTable:
+    """Événements {nom, récurrence, faction, personnage, année} rangés par mois et jour."""
+
+    def __init__(self, database):
+        self.database = database
+
+    def __len__(self):
+        return self.database.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    def add(self, month, day, event):
+        """Ajoute un événement ; renvoie son identifiant."""
+        return self.database.write(
+            "INSERT INTO events (month, day, name, recurrence, faction, person, year) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            _event_row(month, day, event),
+        ).lastrowid
+
+    def add_many(self, events):
+        """Ajoute des triplets (mois, jour, événement) en une transaction."""
+        with self.database.batch():
+            self.database.connection.executemany(
+                "INSERT INTO events (month, day, name, recurrence, faction, person, year) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (_event_row(month, day, event) for month, day, event in events),
+            )
+
+    def update(self, event_id, **fields):
+        """Modifie les champs donnés d'un événement ; renvoie False s'il n'existe pas."""
+        unknown = set(fields) - set(EVENT_FIELDS)
+        if unknown:
+            raise ValueError(f"Champs d'événement inconnus : {', '.join(sorted(unknown))}")
+        if not fields:
+            return True
+        assignments = ", ".join(f"{field} = ?" for field in fields)
+        cursor = self.database.write(f"UPDATE events SET {assignments} WHERE id = ?", (*fields.values(), event_id))
+        return cursor.rowcount > 0
+
+    def remove(self, event_id):
+        """Supprime un événement ; renvoie False s'il n'existe pas."""
+        return self.database.write("DELETE FROM events WHERE id = ?", (event_id,)).rowcount > 0
+
+    def fill_once(self, filename, default_events):
+        """
+        Remplit la table au premier usage de la base, depuis le fichier JSON
+        `filename` ou avec `default_events` ; une table vidée ensuite le reste.
+        """
+        with self.database.batch():
+            if self.database.first_import("events") and not len(self):
+                self.add_many(iter_json_events(_read_json(filename, default_events)))
+        return self
+
+    def sync_names(self, entries):
+        """
+        Aligne la base sur les triplets (mois, jour, nom) `entries`, en une
+        transaction : les événements absents sont supprimés, les nouveaux
+        ajoutés ; les autres, inchangés, gardent récurrence, faction et personnage.
+        """
+        wanted = Counter(entries)
+        with self.database.batch():
+            for event_id, month, day, event in list(self.find()):
+                key = (month, day, event["name"])
+                if wanted[key]:
+                    wanted[key] -= 1
+                else:
+                    self.remove(event_id)
+            self.add_many(
+                (month, day, {"name": name}) for (month, day, name), count in wanted.items() for _ in range(count)
+            )
+
+    def find(self, month=None, day=None, faction=None, person=None):
+        """(identifiant, mois, jour, événement) des événements correspondant aux critères donnés."""
+        criteria = {"month": month, "day": day, "faction": faction, "person": person}
+        criteria = {column: value for column, value in criteria.items() if value is not None}
+        where = " AND ".join(f"{column} = ?" for column in criteria) or "1"
+        rows = self.database.execute(
+            f"SELECT id, month, day, {', '.join(EVENT_FIELDS)} FROM events WHERE {where} ORDER BY day, id",
+            tuple(criteria.values()),
+        )
+        for event_id, month, day, *values in rows:
+            yield event_id, month, day, _event(values)
+
+    def as_dict(self):
+        """
+        Événements {mois: {jour: [événements]}}, dans l'ordre des mois : contrairement
+        à events.json, la base peut avoir plusieurs événements le même jour.
+        """
+        events = {}
+        for _, month, day, event in self.find():
+            events.setdefault(month, {}).setdefault(day, []).append(event)
+        return {month: events[month] for month in sorted(events, key=_month_order)}
+
+
+def _event_row(month, day, event):
+    return (month, int(day), *(event.get(field) for field in EVENT_FIELDS))
+
+
+def _event(values):
+    # Les champs vides sont omis, comme dans events.json
+    return {field: value for field, value in zip(EVENT_FIELDS, values) if value is not None}
+
+
+def _month_order(month):
+    return MONTHS.index(month) if month in MONTHS else len(MONTHS)
+
+
+def iter_json_events(data):
+    """
+    Triplets (mois, jour, événement) d'un contenu JSON d'événements : le format de
+    events.json {mois: {jour: événement}} ou celui de l'éditeur {mois: [{"day", "description"}]}.
+    """
+    for month, days in data.items():
+        if isinstance(days, list):
+            for item in days:
+                yield month, int(item["day"]), {"name": item["description"]}
+        else:
+            for day, value in days.items():
+                for event in day_events(value):
+                    yield month, int(day), event
+
+
+class LoreDatabase:
+    """
+    Base SQLite des factions, personnages et événements. Hors de `batch()`,
+    chaque écriture est validée aussitôt.
+    """
+
+    def __init__(self, path=DATABASE_FILE):
+        self.path = path
+        # Transactions gérées à la main par `batch()`
+        self.connection = sqlite3.connect(path, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.executescript(SCHEMA)
+        self._depth = 0
+        self.factions = NameTable(self, "factions")
+        self.persons = NameTable(self, "persons")
+        self.events = EventTable(self)
+
+    def execute(self, sql, parameters=()):
+        return self.connection.execute(sql, parameters)
+
+    def write(self, sql, parameters=()):
+        """Exécute une écriture, dans la transaction en cours ou dans la sienne."""
+        with self.batch():
+            return self.connection.execute(sql, parameters)
+
+    @contextmanager
+    def batch(self):
+        """Regroupe les écritures du bloc en une transaction, annulée en cas d'exception."""
+        if self._depth:
+            self._depth += 1
+            try:
+                yield self
+            finally:
+                self._depth -= 1
+            return
+        self.connection.execute("BEGIN")
+        self._depth = 1
+        try:
+            yield self
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        else:
+            self.connection.execute("COMMIT")
+        finally:
+            self._depth = 0
+
+    def import_json(self, factions_file=FACTIONS_FILE, persons_file=PERSONS_FILE, events_file=EVENTS_FILE):
+        """
+        Reprend les fichiers JSON existants, en une transaction. Les fichiers
+        absents sont ignorés, les noms déjà présents aussi ; les événements ne
+        sont repris qu'une fois, dans une base qui n'en a pas encore. Renvoie
+        le nombre de factions, de personnages et d'événements ajoutés.
+        """
+        with self.batch():
+            factions = self.factions.add_many(_read_json(factions_file, []))
+            persons = self.persons.add_many(_read_json(persons_file, []))
+            self.first_import("factions")
+            self.first_import("persons")
+            events = []
+            if self.first_import("events") and not len(self.events):
+                events = list(iter_json_events(_read_json(events_file, {})))
+            self.events.add_many(events)
+        return factions, persons, len(events)
+
+    def first_import(self, table):
+        """
+        Note dans la base que `table` a été remplie depuis son fichier JSON ;
+        renvoie False si c'était déjà fait, pour ne jamais la remplir deux fois.
+        """
+        return self.write("INSERT OR IGNORE INTO imports (name) VALUES (?)", (table,)).rowcount > 0
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _read_json(filename, default_content):
+    # Lecture seule : un fichier absent n'est pas créé
+    return load_json(filename, default_content) if os.path.exists(filename) else default_content
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Base SQLite des factions, personnages et événements.")
+    parser.add_argument("commande", choices=["import"], help="import : reprend les fichiers JSON dans la base")
+    parser.add_argument("--base", default=DATABASE_FILE, help=f"fichier SQLite (défaut : {DATABASE_FILE})")
+    parser.add_argument("--factions", default=FACTIONS_FILE)
+    parser.add_argument("--persons", default=PERSONS_FILE)
+    parser.add_argument("--events", default=EVENTS_FILE)
+    args = parser.parse_args()
+    with LoreDatabase(args.base) as database:
+        factions, persons, events = database.import_json(args.factions, args.persons, args.events)
+    print(f"{factions} faction(s), {persons} personnage(s) et {events} événement(s) importés dans {args.base}")
+
+
+if __name__ == "__main__":
+    main()
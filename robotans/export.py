@@ -0,0 +1,125 @@
+"""
+Export en continu du calendrier de la Rectitude au format iCalendar ou CSV.
+
+Chaque jour de la plage d'années est produit, converti et écrit un par un :
+la mémoire utilisée ne dépend pas du nombre d'années exportées.
+
+Usage : python -m robotans.export sortie.ics --debut 0 --fin 1000
+"""
+import argparse
+import csv
+import os
+from datetime import datetime, timedelta, timezone
+
+from .rectitude import MONTHS, days_before_year, from_day_of_year, get_real_date, format_date
+from .ceremonies import rectitude_ceremony_index
+
+WRITE_BUFFER_SIZE = 1 << 20
+ONE_DAY = timedelta(days=1)
+CSV_HEADER = ["an", "mois", "jour", "nom_du_mois", "date_gregorienne", "ceremonies"]
+
+
+def iter_days(ceremony_index, first_year, last_year):
+    """
+    Génère, pour chaque jour des Ans `first_year` à `last_year` inclus, un quadruplet
+    (ordinal, RectitudeDate, date grégorienne, cérémonies du jour).
+    """
+    for an in range(first_year, last_year + 1):
+        first_ordinal = days_before_year(an)
+        real_date = get_real_date(an, 1, 1)
+        for day_of_year, events in enumerate(ceremony_index.year(an)):
+            yield first_ordinal + day_of_year, from_day_of_year(an, day_of_year + 1), real_date, events
+            real_date += ONE_DAY
+
+
+def csv_rows(days):
+    """Transforme le flux de jours en lignes CSV."""
+    for _, date, real_date, events in days:
+        yield [
+            date.year, date.month, date.day, MONTHS[date.month - 1],
+            f"{real_date.year:04d}-{real_date.month:02d}-{real_date.day:02d}", " / ".join(events)
+        ]
+
+
+def _ics_escape(text):
+    """Échappe un texte selon la RFC 5545."""
+    return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _ics_fold(line):
+    """Replie une ligne iCalendar à 75 octets."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    parts = []
+    while len(encoded) > 75:
+        cut = 75 if not parts else 74
+        # Ne pas couper au milieu d'un caractère UTF-8
+        while encoded[cut] & 0xC0 == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode("utf-8"))
+        encoded = encoded[cut:]
+    parts.append(encoded.decode("utf-8"))
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def ics_lines(days):
+    """Transforme le flux de jours en lignes iCalendar (un événement par jour)."""
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    yield "BEGIN:VCALENDAR\r\n"
+    yield "VERSION:2.0\r\n"
+    yield "PRODID:-//Robotans//Calendrier de la Rectitude//FR\r\n"
+    yield "CALSCALE:GREGORIAN\r\n"
+    for ordinal, date, real_date, events in days:
+        summary = format_date(date)
+        if events:
+            summary += " - " + " / ".join(events)
+        end_date = real_date + ONE_DAY
+        # Un seul bloc de texte par événement
+        yield (
+            f"BEGIN:VEVENT\r\nUID:rectitude-{ordinal}@robotans\r\nDTSTAMP:{stamp}\r\n"
+            f"DTSTART;VALUE=DATE:{real_date.year:04d}{real_date.month:02d}{real_date.day:02d}\r\n"
+            f"DTEND;VALUE=DATE:{end_date.year:04d}{end_date.month:02d}{end_date.day:02d}\r\n"
+            f"{_ics_fold(f'SUMMARY:{_ics_escape(summary)}')}TRANSP:TRANSPARENT\r\nEND:VEVENT\r\n"
+        )
+    yield "END:VCALENDAR\r\n"
+
+
+def export_csv(path, first_year, last_year, ceremony_index=None):
+    """Exporte chaque jour de la plage d'années dans un fichier CSV."""
+    ceremony_index = ceremony_index or rectitude_ceremony_index()
+    with open(path, "w", encoding="utf-8", newline="", buffering=WRITE_BUFFER_SIZE) as file:
+        writer = csv.writer(file)
+        writer.writerow(CSV_HEADER)
+        writer.writerows(csv_rows(iter_days(ceremony_index, first_year, last_year)))
+
+
+def export_ics(path, first_year, last_year, ceremony_index=None):
+    """Exporte chaque jour de la plage d'années dans un fichier iCalendar."""
+    ceremony_index = ceremony_index or rectitude_ceremony_index()
+    with open(path, "w", encoding="utf-8", newline="", buffering=WRITE_BUFFER_SIZE) as file:
+        file.writelines(ics_lines(iter_days(ceremony_index, first_year, last_year)))
+
+
+def export_calendar(path, first_year, last_year, ceremony_index=None):
+    """Exporte au format CSV ou iCalendar selon l'extension de `path`."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        export_csv(path, first_year, last_year, ceremony_index)
+    elif extension in (".ics", ".ical"):
+        export_ics(path, first_year, last_year, ceremony_index)
+    else:
+        raise ValueError(f"Format d'export inconnu : {extension} (attendu : .csv ou .ics)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exporte le calendrier de la Rectitude en CSV ou iCalendar.")
+    parser.add_argument("fichier", help="fichier de sortie (.csv ou .ics)")
+    parser.add_argument("--debut", type=int, default=0, help="premier An exporté (défaut : 0)")
+    parser.add_argument("--fin", type=int, default=100, help="dernier An exporté, inclus (défaut : 100)")
+    args = parser.parse_args()
+    export_calendar(args.fichier, args.debut, args.fin)
+
+
+if __name__ == "__main__":
+    main()
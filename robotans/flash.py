@@ -0,0 +1,138 @@
+"""
+Codage par plages de l'Ordre Flash : chaque série de caractères identiques
+s'écrit une fois, suivie de sa longueur si elle dépasse 1 (« AAAB » -> « A3B »),
+et le message est encadré par « ! ».
+
+Pour que les longueurs restent lisibles, les chiffres et la barre oblique
+inverse du texte sont échappés par « \\ » (« R2D2 » -> « R\\2D\\2 »).
+
+Le codage et le décodage s'appliquent à `str` comme à `bytes`, `bytearray` ou
+`memoryview` (le résultat est alors en `bytes`). Au codage, une expression
+régulière cherche le début de la prochaine série ; sa longueur est mesurée par
+un motif propre au caractère (« A+ »), qui avance en C sans comparer de groupe.
+Les caractères isolés sont recopiés par tranches : une série de plusieurs
+milliers de caractères ne coûte qu'une itération.
+"""
+import re
+
+DELIMITER = "!"
+ESCAPE = "\\"
+DIGITS = "0123456789"
+
+# Début d'une série d'au moins deux caractères, ou caractère à échapper (chiffre ou « \ »)
+_RUN_START = r"(.)(?=\1)|([0-9\\])"
+# Caractère échappé ou suivi d'une longueur ; sinon chiffre ou « \ » orphelin (invalide)
+_TOKEN = r"\\(.)([0-9]*)|([^0-9\\])([0-9]+)|([0-9]|\\)"
+
+
+class _Codec:
+    """Expressions et fonctions de remplacement pour un type de texte (str ou octets)."""
+
+    def __init__(self, convert):
+        self.convert = convert
+        self.delimiter = convert(DELIMITER)
+        self.escape = convert(ESCAPE)
+        self.empty = convert("")
+        self.escaped = {convert(char) for char in DIGITS + ESCAPE}
+        self.run_start_pattern = re.compile(convert(_RUN_START), re.S)
+        self.token_pattern = re.compile(convert(_TOKEN), re.S)
+        self._run_patterns = {}
+
+    def run_pattern(self, char):
+        """Motif « char+ », compilé au premier usage de chaque caractère."""
+        pattern = self._run_patterns.get(char)
+        if pattern is None:
+            pattern = self._run_patterns[char] = re.compile(re.escape(char) + self.convert("+"))
+        return pattern
+
+    def encode_run(self, char, count):
+        """Écriture d'une série de `count` caractères `char`."""
+        if char in self.escaped:
+            char = self.escape + char
+        return char + self.convert(str(count)) if count > 1 else char
+
+    def decode_match(self, match):
+        if match.group(5) is not None:
+            raise ValueError(f"Ordre Flash invalide : {match.group(5)!r} sans caractère à répéter.")
+        if match.group(1) is not None:
+            char, count = match.group(1), match.group(2)
+        else:
+            char, count = match.group(3), match.group(4)
+        if not count:
+            return char
+        if not int(count):
+            raise ValueError(f"Ordre Flash invalide : série de longueur nulle ({match.group()!r}).")
+        return char * int(count)
+
+
+_STR_CODEC = _Codec(str)
+_BYTES_CODEC = _Codec(lambda text: text.encode("ascii"))
+
+
+def _codec(data):
+    return _STR_CODEC if isinstance(data, str) else _BYTES_CODEC
+
+
+def encode_run(char, count):
+    """Écriture d'une série de `count` caractères (ou octets) `char`."""
+    return _codec(char).encode_run(char, count)
+
+
+def encode_runs(data):
+    """Code par plages `data`, sans délimiteurs."""
+    codec = _codec(data)
+    search = codec.run_start_pattern.search
+    parts = []
+    position = 0
+    while True:
+        match = search(data, position)
+        if match is None:
+            break
+        start = match.start()
+        char = match.group(match.lastindex)
+        end = codec.run_pattern(char).match(data, start).end()
+        # Caractères isolés recopiés tels quels, puis la série
+        parts.append(data[position:start])
+        parts.append(codec.encode_run(char, end - start))
+        position = end
+    parts.append(data[position:])
+    return codec.empty.join(parts)
+
+
+def decode_runs(data):
+    """Décode un corps d'Ordre Flash (sans délimiteurs)."""
+    codec = _codec(data)
+    return codec.token_pattern.sub(codec.decode_match, data)
+
+
+def encode(data):
+    """Ordre Flash de `data` : séries codées par plages, encadrées par « ! »."""
+    codec = _codec(data)
+    return codec.delimiter + encode_runs(data) + codec.delimiter
+
+
+def decode(data):
+    """Texte (ou octets) d'un Ordre Flash « !A3B! »."""
+    codec = _codec(data)
+    if len(data) < 2 or data[:1] != codec.delimiter or data[-1:] != codec.delimiter:
+        raise ValueError("Un Ordre Flash commence et se termine par « ! ».")
+    return decode_runs(data[1:-1])
+
+
+def last_token_start(text):
+    """
+    Position du dernier élément (caractère, éventuellement échappé, et sa longueur)
+    d'un corps d'Ordre Flash qui commence en début d'élément. En flux, cet élément
+    peut se poursuivre dans le bloc suivant et doit être gardé.
+    """
+    head = text.rstrip(DIGITS)
+    if not head:
+        return 0
+    backslashes = len(head) - len(head.rstrip(ESCAPE))
+    if backslashes:
+        # Une suite de « \ » commence toujours un élément : les paires sont des « \ »
+        # échappés, un « \ » restant échappe le chiffre qui le suit
+        return len(head) - (2 if backslashes % 2 == 0 else 1)
+    before = head[:-1]
+    escaped = (len(before) - len(before.rstrip(ESCAPE))) % 2
+    return len(head) - 1 - escaped
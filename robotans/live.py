@@ -0,0 +1,94 @@
+"""
+Encodage incrémental pour l'aperçu en direct du langage de bataille.
+
+`LiveEncoder` garde, tous les `step` caractères, un point de reprise de
+l'encodeur (position dans le texte, longueur de la sortie, état de
+l'écrivain). Quand le texte change, seul ce qui suit le dernier point de
+reprise commun avec le texte précédent est réencodé : taper à la fin d'un
+long message ne coûte que quelques milliers de caractères. Les versions qui
+inversent le texte (V2) gardent le texte transformé par tranches et ne
+refont que l'inversion et le groupement, deux passes en C.
+
+`patch_range` donne la plus petite portion à remplacer pour passer d'une
+sortie à la suivante, pour corriger un widget sur place.
+"""
+import copy
+
+from .battle import SHIFT, version_pipeline
+
+CHECKPOINT_STEP = 4096  # caractères entre deux points de reprise
+
+
+def common_prefix_length(a, b):
+    """Longueur du plus long préfixe commun, par dichotomie sur des comparaisons de tranches."""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[low:middle] == b[low:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def patch_range(old, new):
+    """
+    (début, fin, remplacement) tels que `old[:début] + remplacement + old[fin:]`
+    soit `new`, en ne remplaçant que la portion qui diffère.
+    """
+    start = common_prefix_length(old, new)
+    # Suffixe commun, sans chevaucher le préfixe
+    end = common_prefix_length(old[start:][::-1], new[start:][::-1])
+    return start, len(old) - end, new[start:len(new) - end]
+
+
+class LiveEncoder:
+    """Encodeur d'une version qui réencode seulement la fin modifiée du texte."""
+
+    def __init__(self, version="v1", shift=SHIFT, step=CHECKPOINT_STEP):
+        self.version = version
+        self.pipeline = version_pipeline(version, shift)
+        self.step = step
+        self.text = ""
+        self.output = ""
+        self._body = ""  # sortie déjà déterminée, avant la fermeture de l'écrivain
+        # Points de reprise (position dans le texte, longueur de `_body`, état de l'écrivain)
+        self._checkpoints = [(0, 0, self.pipeline.writer())]
+        self._pieces = []  # V2 : texte transformé, une tranche de `step` caractères par élément
+
+    def update(self, text):
+        """Encode `text` à partir du dernier point de reprise commun et renvoie la sortie."""
+        kept = common_prefix_length(self.text, text) // self.step
+        if self.pipeline.reverse:
+            output = self._update_reversed(text, kept)
+        else:
+            output = self._update_forward(text, kept)
+        self.text, self.output = text, output
+        return output
+
+    def _update_forward(self, text, kept):
+        checkpoints = self._checkpoints[:min(kept, len(self._checkpoints) - 1) + 1]
+        position, length, writer = checkpoints[-1]
+        writer = copy.copy(writer)
+        parts = [self._body[:length]]
+        for start in range(position, len(text), self.step):
+            block = text[start:start + self.step]
+            parts.append(writer.write(self.pipeline.transform(block)))
+            if len(block) == self.step:
+                length += len(parts[-1])
+                checkpoints.append((start + self.step, length, copy.copy(writer)))
+        # Les états sont conservés seulement une fois tout le texte encodé sans erreur
+        body = "".join(parts)
+        self._checkpoints, self._body = checkpoints, body
+        return body + writer.close()
+
+    def _update_reversed(self, text, kept):
+        before, after = self.pipeline.before, self.pipeline.after
+        pieces = self._pieces[:kept]
+        for start in range(len(pieces) * self.step, len(text), self.step):
+            block = text[start:start + self.step]
+            pieces.append(before.translate(block) if before is not None else block)
+        self._pieces = pieces
+        transformed = "".join(pieces)[::-1]
+        writer = self.pipeline.writer()
+        return writer.write(after.translate(transformed) if after is not None else transformed) + writer.close()
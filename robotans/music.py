@@ -0,0 +1,206 @@
+"""
+Rendu sonore des messages V3 du langage de bataille : fichier MIDI standard
+ou WAV synthétisé.
+
+Chaque note « G2 » devient une hauteur : la lettre donne le degré, l'octave
+Robotans 1 correspond à l'octave 3 du piano. Les lettres accentuées donnent
+des octaves au-delà de 4 ; elles sont ramenées dans les quatre octaves du
+clavier. Les notes durent toutes une noire à `TEMPO_BPM`.
+
+Le WAV est synthétisé à partir d'une table d'échantillons précalculée par
+note (attaque, corps puis chute qui déborde sur la note suivante) : un lot de
+notes se rend par indexation de la table, et les chutes sont mixées en une
+addition NumPy. Le message est lu, rendu et écrit lot par lot : la mémoire
+ne dépend pas de la durée de la transmission.
+
+Usage : python -m robotans.music journal.v3 journal.wav
+"""
+import argparse
+import os
+import struct
+import wave
+from functools import lru_cache
+
+import numpy as np
+
+from .battle import CHUNK_SIZE, encode_stream, _read_chunks
+from .battle_decoder import NOTE_PATTERN, NOTE_SEPARATORS
+
+NOTE_NAMES = "ABCDEFG"
+SEMITONES = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
+KEYBOARD_OCTAVES = 4
+FIRST_OCTAVE = 3  # octave du piano de l'octave Robotans 1
+TEMPO_BPM = 120
+TICKS_PER_BEAT = 480
+VELOCITY = 96
+SAMPLE_RATE = 22050
+RELEASE_SECONDS = 0.08  # chute d'une note, mixée avec le début de la suivante
+BATCH_NOTES = 512  # notes rendues à la fois en WAV
+MIDI_EXTENSIONS = (".mid", ".midi")
+
+
+@lru_cache(maxsize=None)
+def note_index(token):
+    """Indice dans le clavier (0 à 27) de la note « G2 », en majuscules."""
+    match = NOTE_PATTERN.fullmatch(token)
+    if match is None:
+        raise ValueError(f"Note V3 invalide : {token!r}")
+    name, octave = match.groups()
+    return (int(octave) - 1) % KEYBOARD_OCTAVES * len(NOTE_NAMES) + NOTE_NAMES.index(name)
+
+
+def midi_pitch(index):
+    """Numéro de note MIDI d'un indice du clavier."""
+    octave, degree = divmod(index, len(NOTE_NAMES))
+    return 12 * (FIRST_OCTAVE + octave + 1) + SEMITONES[NOTE_NAMES[degree]]
+
+
+def iter_note_batches(chunks, size=BATCH_NOTES):
+    """Indices des notes d'un texte V3 lu par blocs, par lots d'au plus `size` notes."""
+    pending = ""
+    tokens = []
+    for chunk in chunks:
+        # La dernière note peut se poursuivre dans le bloc suivant
+        complete, _, pending = (pending + chunk.upper().translate(NOTE_SEPARATORS)).rpartition(" ")
+        tokens += complete.split()
+        # Lots pris par un indice qui avance : seul le reste, moins d'un lot, est recopié
+        start = 0
+        while len(tokens) - start >= size:
+            yield np.fromiter(map(note_index, tokens[start:start + size]), dtype=np.uint8, count=size)
+            start += size
+        tokens = tokens[start:]
+    tokens += pending.split()
+    for start in range(0, len(tokens), size):
+        batch = tokens[start:start + size]
+        yield np.fromiter(map(note_index, batch), dtype=np.uint8, count=len(batch))
+
+
+@lru_cache(maxsize=None)
+def note_tables(sample_rate=SAMPLE_RATE, tempo=TEMPO_BPM):
+    """
+    Échantillons float32 de chaque note du clavier, de forme (notes, durée + chute) :
+    fondamentale et deux harmoniques, attaque de 5 ms et décroissance exponentielle.
+    """
+    step = round(60 / tempo * sample_rate)
+    tail = min(round(RELEASE_SECONDS * sample_rate), step)
+    time = np.arange(step + tail) / sample_rate
+    pitches = np.array([midi_pitch(index) for index in range(KEYBOARD_OCTAVES * len(NOTE_NAMES))])
+    frequencies = 440.0 * 2.0 ** ((pitches - 69) / 12)
+    phase = 2 * np.pi * frequencies[:, None] * time
+    waves = np.sin(phase) + 0.3 * np.sin(2 * phase) + 0.15 * np.sin(3 * phase)
+    envelope = np.minimum(time / 0.005, 1.0) * np.exp(-3.0 * time)
+    envelope[step:] *= np.linspace(1.0, 0.0, tail)
+    # Une note et la chute de la précédente ne dépassent pas la pleine échelle
+    tables = waves * envelope / (2 * np.abs(waves).max())
+    return tables.astype(np.float32), step, tail
+
+
+class WaveRenderer:
+    """Synthèse des lots de notes ; la chute de la dernière note est reportée au lot suivant."""
+
+    def __init__(self, sample_rate=SAMPLE_RATE, tempo=TEMPO_BPM):
+        self.tables, self.step, self.tail = note_tables(sample_rate, tempo)
+        self._carry = np.zeros(self.tail, dtype=np.float32)
+
+    def render(self, notes):
+        """Échantillons int16 des notes `notes`, hors chute de la dernière."""
+        if not len(notes):
+            return b""
+        samples = self.tables[notes]
+        bodies = samples[:, :self.step].copy()
+        # Chaque chute se mixe au début de la note suivante
+        bodies[1:, :self.tail] += samples[:-1, self.step:]
+        bodies[0, :self.tail] += self._carry
+        self._carry = samples[-1, self.step:]
+        return _to_pcm(bodies)
+
+    def finish(self):
+        """Échantillons int16 de la dernière chute."""
+        carry, self._carry = self._carry, np.zeros(self.tail, dtype=np.float32)
+        return _to_pcm(carry)
+
+
+def _to_pcm(samples):
+    return (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+
+
+def write_wav(batches, dst, sample_rate=SAMPLE_RATE, tempo=TEMPO_BPM):
+    """Écrit dans `dst` le WAV mono 16 bits des lots de notes, lot par lot."""
+    renderer = WaveRenderer(sample_rate, tempo)
+    with wave.open(dst, "wb") as output:
+        output.setnchannels(1)
+        output.setsampwidth(2)
+        output.setframerate(sample_rate)
+        for notes in batches:
+            output.writeframes(renderer.render(notes))
+        output.writeframes(renderer.finish())
+
+
+@lru_cache(maxsize=None)
+def _midi_events_table(velocity=VELOCITY):
+    """Événements MIDI de chaque note : note enclenchée, puis relâchée une noire plus tard."""
+    delay = bytes([0x80 | TICKS_PER_BEAT >> 7, TICKS_PER_BEAT & 0x7F])
+    rows = [
+        bytes([0, 0x90, midi_pitch(index), velocity]) + delay + bytes([0x80, midi_pitch(index), 0])
+        for index in range(KEYBOARD_OCTAVES * len(NOTE_NAMES))
+    ]
+    return np.frombuffer(b"".join(rows), dtype=np.uint8).reshape(len(rows), -1)
+
+
+def write_midi(batches, dst, tempo=TEMPO_BPM, velocity=VELOCITY):
+    """
+    Écrit dans `dst` un fichier MIDI standard (format 0, une piste) des lots de
+    notes. La longueur de la piste est inscrite une fois toutes les notes écrites.
+    """
+    events = _midi_events_table(velocity)
+    with open(dst, "wb") as output:
+        output.write(b"MThd" + struct.pack(">IHHH", 6, 0, 1, TICKS_PER_BEAT))
+        output.write(b"MTrk\0\0\0\0")
+        start = output.tell()
+        # Tempo en microsecondes par noire
+        output.write(b"\0\xff\x51\x03" + round(60_000_000 / tempo).to_bytes(3, "big"))
+        for notes in batches:
+            output.write(events[notes].tobytes())
+        output.write(b"\0\xff\x2f\0")
+        end = output.tell()
+        output.seek(start - 4)
+        output.write(struct.pack(">I", end - start))
+
+
+def render(chunks, dst, tempo=TEMPO_BPM, sample_rate=SAMPLE_RATE):
+    """Rend un message V3 lu par blocs en MIDI ou en WAV, selon l'extension de `dst`."""
+    extension = os.path.splitext(dst)[1].lower()
+    if extension in MIDI_EXTENSIONS:
+        write_midi(iter_note_batches(chunks), dst, tempo)
+    elif extension == ".wav":
+        write_wav(iter_note_batches(chunks), dst, sample_rate, tempo)
+    else:
+        raise ValueError(f"Format de rendu inconnu : {extension} (attendu : .mid ou .wav)")
+
+
+def render_file(src, dst, chunk_size=CHUNK_SIZE, plain=False, **options):
+    """
+    Rend le message V3 du fichier `src` dans `dst` ; avec `plain`, `src` est un
+    texte clair encodé en V3 à la volée.
+    """
+    with open(src, encoding="utf-8") as file:
+        chunks = _read_chunks(file, chunk_size)
+        if plain:
+            chunks = encode_stream(chunks, "v3")
+        render(chunks, dst, **options)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rend un message V3 du langage de bataille en MIDI ou en WAV.")
+    parser.add_argument("source", help="message V3 (ou texte clair avec --clair)")
+    parser.add_argument("sortie", help="fichier de sortie (.mid ou .wav)")
+    parser.add_argument("--clair", action="store_true", help="la source est un texte clair, encodé en V3 d'abord")
+    parser.add_argument("--tempo", type=int, default=TEMPO_BPM, help="noires par minute (défaut : 120)")
+    parser.add_argument("--frequence", type=int, default=SAMPLE_RATE, help="échantillons par seconde du WAV")
+    parser.add_argument("--bloc", type=int, default=CHUNK_SIZE, help="taille des blocs lus, en caractères")
+    args = parser.parse_args()
+    render_file(args.source, args.sortie, args.bloc, args.clair, tempo=args.tempo, sample_rate=args.frequence)
+
+
+if __name__ == "__main__":
+    main()
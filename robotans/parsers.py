@@ -0,0 +1,66 @@
+"""Lecture et écriture des fichiers d'événements (Markdown, CSV, JSON), sans interface."""
+import re
+
+from .rectitude import MONTHS
+
+TIMELINE_LINE_PATTERN = re.compile(r"AN (.+) - (.+) \| (.+) \| (.+)")
+MONTH_EVENT_PATTERN = re.compile(r"(\d{1,2})\s+(\w+):\s+(.+)")
+
+
+def parse_timeline_events(lines):
+    """Extrait les événements « AN date - événement | catégorie | lieu » d'un fichier Markdown."""
+    for line in lines:
+        match = TIMELINE_LINE_PATTERN.match(line.strip())
+        if match:
+            date, event_name, category, location = match.groups()
+            yield {
+                "Date": date,
+                "Event": event_name,
+                "Category": category,
+                "Location": location
+            }
+
+
+def format_timeline_event(event):
+    """Formate un événement de la timeline en ligne Markdown."""
+    return f"AN {event['Date']} - {event['Event']} | {event['Category']} | {event['Location']}"
+
+
+def empty_month_events():
+    """Dictionnaire {mois: []} pour tous les mois de la Rectitude."""
+    return {month: [] for month in MONTHS}
+
+
+def parse_markdown_events(lines):
+    """Parse les lignes « jour mois: description » d'un fichier Markdown."""
+    events = empty_month_events()
+    for line in lines:
+        match = MONTH_EVENT_PATTERN.match(line.strip())
+        if match:
+            day, month, description = match.groups()
+            day = int(day)
+            if month in MONTHS:
+                events[month].append(f"{day}: {description}")
+    return events
+
+
+def parse_csv_events(rows):
+    """Parse les lignes « jour, mois, description » d'un fichier CSV."""
+    events = empty_month_events()
+    for row in rows:
+        if len(row) >= 3:
+            day, month, description = row[0], row[1], row[2]
+            if month in MONTHS:
+                events[month].append(f"{day}: {description}")
+    return events
+
+
+def parse_json_events(data):
+    """Parse un dictionnaire JSON {mois: [{"day": ..., "description": ...}]}."""
+    events = empty_month_events()
+    for month, month_events in data.items():
+        if month in MONTHS:
+            for event in month_events:
+                day, description = event["day"], event["description"]
+                events[month].append(f"{day}: {description}")
+    return events
@@ -0,0 +1,432 @@
+"""
+Chaînes d'étapes composables pour les codages du langage de bataille.
+
+Une version se déclare comme une liste d'étapes nommées, enregistrées dans
+`STAGES` par `register_stage` :
+
+- « map » : transformation caractère par caractère (une fonction caractère ->
+  texte, le texte vide supprimant le caractère) ;
+- « reverse » : inversion du texte entier ;
+- « writer » : mise en forme de la sortie (groupes, blocs, séries), en dernier.
+
+`compile_pipeline` fusionne les transformations voisines en une seule table de
+translittération, appliquée en une passe `bytes.translate` sur les portions
+Latin-1 ; l'inversion est faite sur le résultat de cette même passe, et le
+groupement par l'écrivain. Une étape se désigne par son nom ou par un tuple
+(nom, arguments...) :
+
+    compile_pipeline(("cipher", 5), "reverse", "group5").encode("Attaque")
+"""
+import importlib
+import re
+import tempfile
+from collections import namedtuple
+from functools import lru_cache
+
+from . import flash
+
+SPILL_SIZE = 1 << 22  # caractères en attente avant déversement sur disque
+STAGE_KINDS = ("map", "reverse", "writer")
+NON_LATIN1_PATTERN = re.compile(r"([^\x00-\xff]+)")
+MAX_SPECIAL = 16  # au-delà, une table passe entièrement par `str.translate`
+
+Stage = namedtuple("Stage", ["name", "kind", "factory"])
+
+# Nom -> Stage
+STAGES = {}
+
+
+def register_stage(name, kind, factory=None):
+    """
+    Enregistre l'étape `name`. `factory(*arguments)` renvoie la fonction
+    caractère -> texte d'une étape « map », ou un nouvel écrivain pour une étape
+    « writer » ; une étape « reverse » n'en a pas.
+    """
+    if kind not in STAGE_KINDS:
+        raise ValueError(f"Type d'étape inconnu : {kind} (attendu : {', '.join(STAGE_KINDS)})")
+    if factory is None and kind != "reverse":
+        raise ValueError(f"L'étape {name} doit fournir une fabrique.")
+    STAGES[name] = Stage(name, kind, factory)
+    compile_pipeline.cache_clear()
+
+
+def translate_text(text, table, byte_table, deleted):
+    """
+    Traduit `text` par `bytes.translate` sur ses portions Latin-1 (français
+    compris) et par `str.translate` sur les rares caractères au-delà.
+    """
+    try:
+        return text.encode("latin-1").translate(byte_table, deleted).decode("latin-1")
+    except UnicodeEncodeError:
+        pass
+    parts = NON_LATIN1_PATTERN.split(text)
+    parts[0::2] = [part.encode("latin-1").translate(byte_table, deleted).decode("latin-1") for part in parts[0::2]]
+    parts[1::2] = [part.translate(table) for part in parts[1::2]]
+    return "".join(parts)
+
+
+def _group_bytes(data, size):
+    """Insère une espace tous les `size` octets, par `size` copies avec pas."""
+    if len(data) <= size:
+        return bytes(data)
+    stride = size + 1
+    grouped = bytearray(b" " * (len(data) + (len(data) - 1) // size))
+    for offset in range(size):
+        grouped[offset::stride] = data[offset::size]
+    return bytes(grouped)
+
+
+def group_text(text, size):
+    """Groupe les caractères du texte par blocs de `size` séparés par une espace."""
+    try:
+        return _group_bytes(text.encode("latin-1"), size).decode("latin-1")
+    except UnicodeEncodeError:
+        return " ".join(text[i:i + size] for i in range(0, len(text), size))
+
+
+def _latin1_class(excluded):
+    """Intervalles d'une classe d'expression régulière : le Latin-1 sauf `excluded`."""
+    kept = [code for code in range(256) if chr(code) not in excluded]
+    ranges = []
+    for code in kept:
+        if ranges and ranges[-1][1] == code - 1:
+            ranges[-1][1] = code
+        else:
+            ranges.append([code, code])
+    return "".join(f"\\x{low:02x}-\\x{high:02x}" for low, high in ranges)
+
+
+class CharMap(dict):
+    """
+    Table `str.translate` d'une suite de transformations caractère -> texte.
+    Le Latin-1 est précalculé, avec sa table `bytes.translate` ; le reste est
+    calculé au premier usage.
+    """
+
+    def __init__(self, functions):
+        super().__init__()
+        self.functions = functions
+        images = []
+        for code in range(256):
+            try:
+                images.append(self[code] or "")
+            except Exception:
+                # L'erreur n'est levée que si le caractère apparaît dans un texte
+                images.append(None)
+        self.byte_table = bytes(
+            ord(image) if image is not None and len(image) == 1 and ord(image) < 256 else code
+            for code, image in enumerate(images)
+        )
+        self.deleted = bytes(code for code, image in enumerate(images) if image == "")
+        # Caractères Latin-1 que la table d'octets ne sait pas traduire
+        special = "".join(
+            chr(code) for code, image in enumerate(images)
+            if image is None or len(image) > 1 or (image and ord(image) > 255)
+        )
+        self.bytes_path = len(special) <= MAX_SPECIAL
+        self._special_codes = special.encode("latin-1")
+        self._slow_pattern = re.compile(f"([^{_latin1_class(special)}]+)") if special else None
+
+    def _image(self, char):
+        text = char
+        for function in self.functions:
+            text = "".join(map(function, text))
+        return text
+
+    def __missing__(self, code):
+        value = self[code] = self._image(chr(code)) or None
+        return value
+
+    def translate(self, text):
+        """Traduit `text` en une passe, par octets sauf autour des caractères particuliers."""
+        if not self.bytes_path:
+            return text.translate(self)
+        if self._slow_pattern is None:
+            return translate_text(text, self, self.byte_table, self.deleted)
+        try:
+            data = text.encode("latin-1")
+        except UnicodeEncodeError:
+            data = None
+        # Recherche d'un octet par `memchr` : bien plus rapide que l'expression régulière
+        if data is not None and not any(code in data for code in self._special_codes):
+            return data.translate(self.byte_table, self.deleted).decode("latin-1")
+        parts = self._slow_pattern.split(text)
+        parts[0::2] = [
+            part.encode("latin-1").translate(self.byte_table, self.deleted).decode("latin-1") for part in parts[0::2]
+        ]
+        parts[1::2] = [part.translate(self) for part in parts[1::2]]
+        return "".join(parts)
+
+
+class ReverseSpill:
+    """
+    Texte accumulé pour être relu de la fin vers le début. Au-delà de `spill_size`
+    caractères en attente, il est déversé dans un fichier temporaire par segments,
+    relus ensuite du dernier au premier : la mémoire reste bornée.
+    """
+
+    def __init__(self, spill_size=SPILL_SIZE, spill_dir=None):
+        self.spill_size = spill_size
+        self.spill_dir = spill_dir
+        self._buffer = []
+        self._buffered = 0
+        self._file = None
+        self._segments = []  # (position, taille en octets)
+
+    def append(self, text):
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self.spill_size:
+            self._spill()
+
+    def _spill(self):
+        """Écrit les blocs en attente à la fin du fichier temporaire."""
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(dir=self.spill_dir)
+        data = "".join(self._buffer).encode("utf-8")
+        self._segments.append((self._file.tell(), len(data)))
+        self._file.write(data)
+        self._buffer, self._buffered = [], 0
+
+    def reversed_chunks(self):
+        """Blocs du texte inversé, de la fin du texte à son début ; libère le fichier temporaire."""
+        try:
+            # Le texte encore en mémoire est la fin : il sort en premier
+            yield "".join(self._buffer)[::-1]
+            self._buffer, self._buffered = [], 0
+            for position, size in reversed(self._segments):
+                self._file.seek(position)
+                yield self._file.read(size).decode("utf-8")[::-1]
+        finally:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._segments = []
+
+
+class PassThroughWriter:
+    """Écrivain qui recopie le texte tel quel."""
+
+    slice_size = None  # taille maximale des morceaux passés à `write` (None : sans limite)
+
+    def write(self, text):
+        return text
+
+    def close(self):
+        return ""
+
+
+class GroupWriter:
+    """Groupes de `size` caractères séparés par une espace ; le groupe incomplet est reporté."""
+
+    slice_size = None
+
+    def __init__(self, size):
+        self.size = size
+        self._started = False
+        self._pending = ""
+
+    def write(self, text):
+        pending = self._pending + text
+        complete = len(pending) - len(pending) % self.size
+        self._pending = pending[complete:]
+        if not complete:
+            return ""
+        grouped = group_text(pending[:complete], self.size)
+        if self._started:
+            grouped = " " + grouped
+        self._started = True
+        return grouped
+
+    def close(self):
+        if not self._pending:
+            return ""
+        return (" " if self._started else "") + self._pending
+
+
+class NoteBlockWriter:
+    """
+    Blocs de `size` mots séparés par « / », chaque bloc capitalisé comme par
+    `str.capitalize`. Le texte est découpé en tranches de `slice_size`
+    caractères pour ne pas garder en mémoire une liste de mots par bloc lu.
+    """
+
+    slice_size = 1 << 16
+
+    def __init__(self, size):
+        self.size = size
+        self._words = 0  # mots déjà écrits
+
+    def write(self, text):
+        words = text.split()
+        if not words:
+            return ""
+        # Fin du bloc commencé au morceau précédent, puis blocs complets
+        first = -self._words % self.size
+        head, rest = words[:first], words[first:]
+        full = len(rest) - len(rest) % self.size
+        blocks = list(map(str.capitalize, map(" ".join, zip(*[iter(rest[:full])] * self.size))))
+        if full < len(rest):
+            blocks.append(" ".join(rest[full:]).capitalize())
+        output = " / ".join(blocks)
+        if head:
+            output = " " + " ".join(head).lower() + (" / " + output if output else "")
+        elif self._words:
+            output = " / " + output
+        self._words += len(words)
+        return output
+
+    def close(self):
+        return ""
+
+
+class RunWriter:
+    """Codage par plages de l'Ordre Flash ; la dernière série est reportée au morceau suivant."""
+
+    slice_size = None
+
+    def __init__(self):
+        self._started = False
+        self._run = ("", 0)  # dernière série (caractère, longueur)
+
+    def write(self, text):
+        if not text:
+            return ""
+        output = "" if self._started else flash.DELIMITER
+        self._started = True
+        char, count = self._run
+        if text[0] == char:
+            # La dernière série du morceau précédent continue
+            rest = text.lstrip(char)
+            count += len(text) - len(rest)
+            text = rest
+            if not text:
+                self._run = (char, count)
+                return output
+        if count:
+            output += flash.encode_run(char, count)
+        # La dernière série peut se poursuivre dans le morceau suivant : elle est gardée
+        body = text.rstrip(text[-1])
+        self._run = (text[-1], len(text) - len(body))
+        return output + flash.encode_runs(body)
+
+    def close(self):
+        char, count = self._run
+        output = "" if self._started else flash.DELIMITER
+        return output + (flash.encode_run(char, count) if count else "") + flash.DELIMITER
+
+
+def _resolve(spec):
+    """Étape enregistrée et arguments d'une désignation « nom » ou (nom, arguments...)."""
+    name, *arguments = (spec,) if isinstance(spec, str) else spec
+    if name not in STAGES:
+        # Les étapes du langage de bataille sont enregistrées par `robotans.battle`
+        importlib.import_module(".battle", __package__)
+    stage = STAGES.get(name)
+    if stage is None:
+        raise ValueError(f"Étape inconnue : {name} (connues : {', '.join(sorted(STAGES))})")
+    return stage, tuple(arguments)
+
+
+class Pipeline:
+    """
+    Chaîne d'étapes compilée : transformations avant l'inversion, inversion
+    éventuelle, transformations après, puis écrivain.
+    """
+
+    def __init__(self, specs):
+        self.specs = specs
+        self.reverse = False
+        self.writer = PassThroughWriter
+        before, after = [], []
+        for position, spec in enumerate(specs):
+            stage, arguments = _resolve(spec)
+            if stage.kind == "map":
+                (after if self.reverse else before).append(stage.factory(*arguments))
+            elif stage.kind == "reverse":
+                if self.reverse:
+                    raise ValueError("Une chaîne ne peut inverser le texte qu'une fois.")
+                self.reverse = True
+            else:
+                if position != len(specs) - 1:
+                    raise ValueError(f"L'écrivain {stage.name} doit être la dernière étape.")
+                self.writer = _writer_factory(stage.factory, arguments)
+        self.before = CharMap(tuple(before)) if before else None
+        self.after = CharMap(tuple(after)) if after else None
+
+    def __repr__(self):
+        return f"Pipeline({self.specs!r})"
+
+    def transform(self, text, reverse=None):
+        """Texte transformé et inversé, avant l'écrivain."""
+        reverse = self.reverse if reverse is None else reverse
+        if self.before is not None:
+            text = self.before.translate(text)
+        if reverse:
+            text = text[::-1]
+        if self.after is not None:
+            text = self.after.translate(text)
+        return text
+
+    def encode(self, text):
+        """Encode un texte entier."""
+        writer = self.writer()
+        return writer.write(self.transform(text)) + writer.close()
+
+    def encoder(self, spill_size=SPILL_SIZE, spill_dir=None):
+        """Encodeur incrémental de la chaîne."""
+        return PipelineEncoder(self, spill_size, spill_dir)
+
+
+def _writer_factory(factory, arguments):
+    return lambda: factory(*arguments)
+
+
+@lru_cache(maxsize=None)
+def compile_pipeline(*specs):
+    """Chaîne compilée des étapes `specs`, mise en cache."""
+    return Pipeline(specs)
+
+
+class PipelineEncoder:
+    """
+    Encodeur incrémental d'une chaîne : `feed(chunk)` renvoie la partie de la
+    sortie déjà déterminée et `finish()` un itérateur sur le reste. Avec une
+    inversion, rien ne sort avant la fin : le texte transformé est déversé dans
+    un fichier temporaire dès que `spill_size` caractères sont en attente.
+    """
+
+    def __init__(self, pipeline, spill_size=SPILL_SIZE, spill_dir=None):
+        self.pipeline = pipeline
+        self._writer = pipeline.writer()
+        self._spill = ReverseSpill(spill_size, spill_dir) if pipeline.reverse else None
+
+    def feed(self, chunk):
+        """Encode le bloc `chunk` et renvoie la sortie désormais déterminée."""
+        size = self._writer.slice_size
+        if size is None or len(chunk) <= size:
+            return self._feed(chunk)
+        return "".join(self._feed(chunk[start:start + size]) for start in range(0, len(chunk), size))
+
+    def _feed(self, chunk):
+        if self._spill is None:
+            return self._writer.write(self.pipeline.transform(chunk))
+        before = self.pipeline.before
+        self._spill.append(before.translate(chunk) if before is not None else chunk)
+        return ""
+
+    def write_reversed(self, chunk):
+        """Encode `chunk`, déjà lu de la fin vers le début du texte."""
+        return self._writer.write(self.pipeline.transform(chunk, reverse=True))
+
+    def finish(self):
+        """Itérateur sur la fin de la sortie."""
+        if self._spill is not None:
+            after = self.pipeline.after
+            for chunk in self._spill.reversed_chunks():
+                output = self._writer.write(after.translate(chunk) if after is not None else chunk)
+                if output:
+                    yield output
+        output = self._writer.close()
+        if output:
+            yield output
@@ -0,0 +1,123 @@
+"""
+Requêtes par plage de dates sur l'ensemble des sources d'événements.
+
+Les événements datés sont rangés dans un tableau trié d'ordinaux : une plage
+« 3 Fervor An 12 -> 20 Decorum An 40 » se résout par bisection en O(log n + k).
+Les événements récurrents restent des règles, développées paresseusement sur la
+seule fenêtre demandée. Les résultats sont produits au fil de l'eau.
+"""
+import heapq
+from bisect import bisect_left, bisect_right
+
+from .rectitude import days_in_month, to_ordinal, from_ordinal, year_of_ordinal
+from .recurrence import RECURRENCE_PERIODS, Occurrence, occurrences, iter_rules
+from .ceremonies import parse_ceremony_key
+
+
+def _to_ordinal(date):
+    """Accepte un tuple (an, mois, jour) ou une chaîne « 3 Fervor, An 12 »."""
+    if isinstance(date, str):
+        year, month, day = parse_ceremony_key(date)
+        if year is None:
+            raise ValueError(f"Année manquante dans la date : {date}")
+        return to_ordinal(year, month, day)
+    return to_ordinal(*date)
+
+
+def _matcher(factions, persons):
+    """Construit le filtre faction/personnage (None si aucun filtre)."""
+    if not factions and not persons:
+        return None
+    factions = set(factions) if factions else None
+    persons = set(persons) if persons else None
+
+    def matches(event):
+        if factions is not None and event.get("faction") not in factions:
+            return False
+        if persons is not None and event.get("person") not in persons:
+            return False
+        return True
+    return matches
+
+
+class EventQuery:
+    def __init__(self):
+        # Événements datés : ordinaux triés et événements associés
+        self.ordinals = []
+        self.entries = []
+        # Événements récurrents : triplets (mois, jour, événement)
+        self.rules = []
+
+    @classmethod
+    def from_events(cls, events):
+        """Indexe un dictionnaire {mois: {jour: événement}} (format de events.json)."""
+        query = cls()
+        dated = []
+        for month, day, event in iter_rules(events):
+            if event.get("recurrence") in RECURRENCE_PERIODS:
+                query.rules.append((month, day, event))
+            else:
+                dated.append((to_ordinal(event.get("year") or 0, month, day), event))
+        query._extend(dated)
+        return query
+
+    def _extend(self, dated):
+        """Ajoute un lot de paires (ordinal, événement) avec un seul tri."""
+        merged = sorted(
+            list(zip(self.ordinals, self.entries)) + list(dated), key=lambda item: item[0]
+        )
+        self.ordinals = [ordinal for ordinal, _ in merged]
+        self.entries = [event for _, event in merged]
+
+    def add(self, date, event):
+        """Ajoute un événement daté (tuple (an, mois, jour) ou chaîne « 3 Fervor, An 12 »)."""
+        ordinal = _to_ordinal(date)
+        position = bisect_right(self.ordinals, ordinal)
+        self.ordinals.insert(position, ordinal)
+        self.entries.insert(position, event)
+
+    def add_rule(self, month, day, event):
+        """Ajoute un événement récurrent (mois 1 à 13, jour)."""
+        if not 1 <= day <= days_in_month(0, month):
+            raise ValueError(f"Jour {day} invalide pour le mois {month}.")
+        self.rules.append((month, day, event))
+
+    def add_ceremonies(self, ceremony_index):
+        """Ajoute les cérémonies d'un CeremonyIndex (récurrentes et historiques)."""
+        dated = []
+        for key, name in ceremony_index.items():
+            year, month, day = parse_ceremony_key(key)
+            if year is None:
+                self.rules.append((month, day, {"name": name, "recurrence": "annuel"}))
+            else:
+                dated.append((to_ordinal(year, month, day), {"name": name, "recurrence": None, "year": year}))
+        self._extend(dated)
+
+    def between(self, start, end, factions=None, persons=None):
+        """
+        Parcourt, dans l'ordre chronologique, les occurrences comprises entre
+        `start` et `end` inclus, filtrées par faction et par personnage.
+        """
+        first, last = _to_ordinal(start), _to_ordinal(end)
+        matches = _matcher(factions, persons)
+
+        low = bisect_left(self.ordinals, first)
+        high = bisect_right(self.ordinals, last)
+        dated = (
+            Occurrence(self.ordinals[i], from_ordinal(self.ordinals[i]), self.entries[i])
+            for i in range(low, high)
+            if matches is None or matches(self.entries[i])
+        )
+
+        first_year, last_year = year_of_ordinal(first), year_of_ordinal(last)
+        recurring = (
+            occurrence
+            for occurrence in heapq.merge(
+                *(occurrences(month, day, event, first_year, last_year)
+                  for month, day, event in self.rules
+                  if matches is None or matches(event)),
+                key=lambda occurrence: occurrence.ordinal
+            )
+            if first <= occurrence.ordinal <= last
+        )
+        return heapq.merge(dated, recurring, key=lambda occurrence: occurrence.ordinal)
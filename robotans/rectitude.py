@@ -0,0 +1,140 @@
+"""
+Noyau du Calendrier de la Rectitude, sans interface graphique.
+
+Toutes les dates sont ramenées à un ordinal : le nombre de jours écoulés depuis
+le 1er Ordium An 0 (1er janvier 1972). Les conversions ordinal <-> (an, mois, jour)
+se font en temps constant grâce aux décalages cumulés précalculés sur un cycle
+de 400 ans.
+"""
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+# Données de base
+START_YEAR = 1972
+START_DATE = datetime(START_YEAR, 1, 1)  # 1er Ordium, An 0 de la Rectitude
+MONTHS = [
+    "Ordium", "Fervor", "Laboris", "Prudium", "Valoris",
+    "Constium", "Septium", "Servium", "Fortium", "Decorum",
+    "Rectium", "Finalis", "Jours du Silence"
+]
+
+DAYS_PER_MONTH = 30
+SILENCE_MONTH = 13  # Jours du Silence, mois épagomène
+EXTRA_DAYS_NORMAL = 4
+EXTRA_DAYS_LEAP = 5
+DAYS_PER_YEAR = 12 * DAYS_PER_MONTH + EXTRA_DAYS_NORMAL
+CYCLE_YEARS = 400  # période de la règle bissextile grégorienne
+
+RectitudeDate = namedtuple("RectitudeDate", ["year", "month", "day"])
+
+
+def _leap_years_through(year):
+    """Nombre d'années bissextiles grégoriennes de l'an 1 à `year` inclus."""
+    return year // 4 - year // 100 + year // 400
+
+
+LEAP_YEARS_BEFORE_START = _leap_years_through(START_YEAR - 1)
+
+
+def is_leap_year(an):
+    """Déterminer si l'An `an` de la Rectitude est bissextile (règle grégorienne sur an + 1972)."""
+    year = an + START_YEAR
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _offset_in_cycle(an):
+    """Jours écoulés entre le 1er Ordium An 0 et celui de l'An `an` (0 <= an <= 400)."""
+    return DAYS_PER_YEAR * an + _leap_years_through(START_YEAR - 1 + an) - LEAP_YEARS_BEFORE_START
+
+
+# Décalages cumulés des 401 débuts d'année d'un cycle (le dernier ouvre le cycle suivant)
+YEAR_OFFSETS = tuple(_offset_in_cycle(an) for an in range(CYCLE_YEARS + 1))
+DAYS_PER_CYCLE = YEAR_OFFSETS[CYCLE_YEARS]
+
+
+def days_in_year(an):
+    """Nombre de jours de l'An `an` (364, ou 365 avec le 5e Jour du Silence)."""
+    return 12 * DAYS_PER_MONTH + days_in_month(an, SILENCE_MONTH)
+
+
+def days_in_month(an, mois):
+    """Nombre de jours du mois `mois` (1 à 13) de l'An `an`."""
+    if mois < SILENCE_MONTH:
+        return DAYS_PER_MONTH
+    return EXTRA_DAYS_LEAP if is_leap_year(an) else EXTRA_DAYS_NORMAL
+
+
+def days_before_year(an):
+    """Nombre de jours écoulés entre le 1er Ordium An 0 et le 1er Ordium de l'An `an`."""
+    cycles, an_in_cycle = divmod(an, CYCLE_YEARS)
+    return cycles * DAYS_PER_CYCLE + YEAR_OFFSETS[an_in_cycle]
+
+
+def year_of_ordinal(ordinal):
+    """Retourne l'An contenant l'ordinal `ordinal`."""
+    cycles, rest = divmod(ordinal, DAYS_PER_CYCLE)
+    # Estimation par l'année moyenne du cycle, juste à un an près
+    an = rest * CYCLE_YEARS // DAYS_PER_CYCLE
+    if YEAR_OFFSETS[an] > rest:
+        an -= 1
+    elif YEAR_OFFSETS[an + 1] <= rest:
+        an += 1
+    return cycles * CYCLE_YEARS + an
+
+
+def validate_date(an, mois, jour):
+    """Lève une ValueError si (an, mois, jour) n'est pas une date de la Rectitude."""
+    if not 1 <= mois <= SILENCE_MONTH:
+        raise ValueError(f"Mois {mois} invalide : les mois vont de 1 à {SILENCE_MONTH}.")
+    if not 1 <= jour <= days_in_month(an, mois):
+        raise ValueError(f"Jour {jour} invalide pour {MONTHS[mois - 1]}, An {an}.")
+
+
+def to_ordinal(an, mois, jour):
+    """Convertit une date (an, mois, jour) de la Rectitude en ordinal."""
+    validate_date(an, mois, jour)
+    return days_before_year(an) + (mois - 1) * DAYS_PER_MONTH + jour - 1
+
+
+def from_day_of_year(an, day_of_year):
+    """Convertit le jour `day_of_year` (1 à 365) de l'An `an` en RectitudeDate."""
+    if not 1 <= day_of_year <= days_in_year(an):
+        raise ValueError(f"Jour {day_of_year} hors de l'année {an}.")
+    mois, jour = divmod(day_of_year - 1, DAYS_PER_MONTH)
+    if mois >= SILENCE_MONTH:
+        mois, jour = SILENCE_MONTH - 1, jour + DAYS_PER_MONTH
+    return RectitudeDate(an, mois + 1, jour + 1)
+
+
+def from_ordinal(ordinal):
+    """Convertit un ordinal en RectitudeDate(year, month, day)."""
+    an = year_of_ordinal(ordinal)
+    return from_day_of_year(an, ordinal - days_before_year(an) + 1)
+
+
+def gregorian_to_ordinal(real_date):
+    """Convertit une date grégorienne (`date` ou `datetime`) en ordinal."""
+    if isinstance(real_date, datetime):
+        real_date = real_date.date()
+    return (real_date - START_DATE.date()).days
+
+
+def ordinal_to_gregorian(ordinal):
+    """Convertit un ordinal en `datetime` grégorien."""
+    return START_DATE + timedelta(days=ordinal)
+
+
+def gregorian_to_rectitude(real_date):
+    """Convertit une date grégorienne en RectitudeDate."""
+    return from_ordinal(gregorian_to_ordinal(real_date))
+
+
+def format_date(rectitude_date):
+    """Formate une RectitudeDate, par exemple « 15 Septium, An 42 »."""
+    an, mois, jour = rectitude_date
+    return f"{jour} {MONTHS[mois - 1]}, An {an}"
+
+
+def get_real_date(an, mois, jour):
+    """Convertir une date de la Rectitude en date réelle."""
+    return ordinal_to_gregorian(days_before_year(an) + (mois - 1) * DAYS_PER_MONTH + jour - 1)
@@ -0,0 +1,65 @@
+"""
+Expansion paresseuse des événements récurrents (champ « recurrence »).
+
+Chaque règle est un générateur : les occurrences sont produites une à une sur
+une plage d'années quelconque, sans jamais être stockées, et la première
+occurrence de la fenêtre est calculée directement au lieu de partir de l'An 0.
+"""
+import heapq
+from collections import namedtuple
+
+from .rectitude import MONTHS, RectitudeDate, days_in_month, to_ordinal
+
+# Période en années de chaque type de récurrence ; les autres événements sont uniques
+RECURRENCE_PERIODS = {
+    "annuel": 1,
+}
+
+Occurrence = namedtuple("Occurrence", ["ordinal", "date", "event"])
+
+
+def occurrences(month, day, event, first_year, last_year):
+    """
+    Génère les occurrences de l'événement `event` (mois 1 à 13, jour) entre
+    l'An `first_year` et l'An `last_year` inclus. L'événement commence à l'An
+    indiqué par sa clé « year » (An 0 par défaut).
+    """
+    start = event.get("year") or 0
+    period = RECURRENCE_PERIODS.get(event.get("recurrence"))
+    if period is None:
+        years = (start,) if first_year <= start <= last_year else ()
+    else:
+        # Première année de la fenêtre alignée sur la période de la règle
+        first = max(start, first_year)
+        first += (start - first) % period
+        years = range(first, last_year + 1, period)
+
+    for an in years:
+        # Le 5e Jour du Silence n'existe que les années bissextiles
+        if day <= days_in_month(an, month):
+            yield Occurrence(to_ordinal(an, month, day), RectitudeDate(an, month, day), event)
+
+
+def day_events(value):
+    """Événements d'un jour : un seul (format de events.json) ou une liste (base SQLite)."""
+    return value if isinstance(value, list) else (value,)
+
+
+def iter_rules(events):
+    """
+    Parcourt un dictionnaire {mois: {jour: événement}}, ou {mois: {jour: [événements]}},
+    en triplets (mois, jour, événement).
+    """
+    for month_name, days in events.items():
+        month = MONTHS.index(month_name) + 1
+        for day, value in days.items():
+            for event in day_events(value):
+                yield month, int(day), event
+
+
+def expand_events(events, first_year, last_year):
+    """Fusionne, dans l'ordre chronologique, les occurrences de tous les événements."""
+    return heapq.merge(
+        *(occurrences(month, day, event, first_year, last_year) for month, day, event in iter_rules(events)),
+        key=lambda occurrence: occurrence.ordinal
+    )
@@ -0,0 +1,18 @@
+"""Stockage JSON des factions, personnages et événements."""
+import json
+import os
+
+
+def load_json(filename, default_content):
+    """Charge un fichier JSON ou crée un fichier par défaut si nécessaire."""
+    if not os.path.exists(filename):
+        save_json(filename, default_content)
+        return default_content
+    with open(filename, "r") as file:
+        return json.load(file)
+
+
+def save_json(filename, content):
+    """Enregistre `content` dans le fichier JSON `filename`."""
+    with open(filename, "w") as file:
+        json.dump(content, file, indent=4)
@@ -0,0 +1,30 @@
+"""
+Chemins d'import des tests : la bibliothèque, le générateur de noms et le serveur de test des benchmarks ;
+fixtures communes du serveur `NameApiStub`.
+"""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+for path in (ROOT, os.path.join(ROOT, "Robotans_Name_Generator"), os.path.join(ROOT, "benchmarks")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+@pytest.fixture
+def stub():
+    """Serveur local qui imite l'API de prénoms, démarré pour le test."""
+    from name_api_stub import NameApiStub
+
+    with NameApiStub() as server:
+        yield server
+
+
+@pytest.fixture
+def sources(stub):
+    """`name_sources` dont les URL pointent vers `stub`."""
+    from Robotan_Name_Generator import name_sources
+
+    return stub.sources(name_sources)
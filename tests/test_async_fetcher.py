@@ -0,0 +1,83 @@
+"""Tests de la récupération asynchrone des prénoms (`AsyncNameFetcher`) contre le serveur local `NameApiStub`."""
+import pytest
+
+import async_fetcher
+from async_fetcher import AsyncNameFetcher
+from name_api_stub import NameApiStub
+from name_cache import fallback_names
+from Robotan_Name_Generator import name_sources
+
+PAIRS = [(country, gender) for country in ("japan", "france", "usa", "india") for gender in ("male", "female")]
+
+
+@pytest.fixture
+def backoffs(monkeypatch):
+    """Bornes de l'attente tirée avant chaque nouvelle tentative ; l'attente elle-même est nulle."""
+    bounds = []
+
+    def uniform(low, high):
+        bounds.append(high)
+        return 0.0
+
+    monkeypatch.setattr(async_fetcher.random, "uniform", uniform)
+    return bounds
+
+
+def test_fetches_every_batch_of_every_pair(stub, sources):
+    results = AsyncNameFetcher(sources, batch_size=50).fetch(PAIRS, batches=3)
+    assert set(results) == set(PAIRS)
+    assert not any(result.fallback for result in results.values())
+    assert stub.requests == len(PAIRS) * 3 and stub.names_served == len(PAIRS) * 3 * 50
+
+
+@pytest.mark.parametrize("per_host", [1, 3])
+def test_requests_in_flight_are_bounded_per_host(stub, sources, per_host):
+    stub.latency = 0.05
+    AsyncNameFetcher(sources, batch_size=10, per_host=per_host).fetch(PAIRS, batches=2)
+    assert stub.max_in_flight == per_host
+
+
+def test_static_lists_need_no_request(stub, sources):
+    results = AsyncNameFetcher(sources).fetch([("arab", "male")])
+    assert results[("arab", "male")] == (name_sources["arab"], False)
+    assert stub.requests == 0
+
+
+@pytest.mark.parametrize("status", [500, 503, 429])
+def test_retries_with_exponential_backoff(stub, sources, backoffs, status):
+    stub.failures, stub.failure_status = 3, status
+    result = AsyncNameFetcher(sources, retries=4, backoff=0.1).fetch([("france", "female")])[("france", "female")]
+    assert not result.fallback and result.names
+    assert stub.requests == 4
+    assert backoffs == pytest.approx([0.1, 0.2, 0.4])
+
+
+def test_retries_after_a_timeout(stub, sources, backoffs):
+    stub.hangs, stub.hang_seconds = 1, 1.0
+    fetcher = AsyncNameFetcher(sources, retries=2, backoff=0.1, timeout=0.2)
+    result = fetcher.fetch([("usa", "male")])[("usa", "male")]
+    assert not result.fallback
+    assert stub.requests == 2 and backoffs == pytest.approx([0.1])
+
+
+@pytest.mark.parametrize("status", [400, 404])
+def test_client_errors_are_not_retried(stub, sources, backoffs, status):
+    stub.failures, stub.failure_status = 1, status
+    result = AsyncNameFetcher(sources, retries=4).fetch([("japan", "male")])[("japan", "male")]
+    assert stub.requests == 1 and backoffs == []
+    assert result.fallback and result.names == fallback_names(sources)
+
+
+def test_falls_back_to_the_static_lists_when_the_server_is_down(stub, sources, backoffs):
+    stub.down = True
+    results = AsyncNameFetcher(sources, retries=2, backoff=0.1).fetch(PAIRS[:2], batches=2)
+    assert all(result.fallback and result.names == fallback_names(sources) for result in results.values())
+    # Chaque lot a fait sa tentative et ses deux nouvelles tentatives
+    assert stub.requests == 2 * 2 * 3
+
+
+def test_falls_back_when_nothing_listens(sources, backoffs):
+    with NameApiStub() as stopped:
+        unreachable = stopped.sources(name_sources)
+    result = AsyncNameFetcher(unreachable, retries=1).fetch([("india", "female")])[("india", "female")]
+    assert result.fallback and result.names == fallback_names(unreachable)
@@ -0,0 +1,92 @@
+"""
+Propriétés d'aller-retour des décodeurs du langage de bataille :
+  V1/V2 : decode(encode(texte)) == cesar_cipher(texte, 0)
+  V3    : decode(encode(texte)) == lettres du texte en majuscules
+  Flash : decode(encode(texte)) == texte sans ses espaces
+sur des textes aléatoires (ASCII, accents, au-delà du Latin-1), vides, en un
+bloc, en flux découpé au hasard et fichier à fichier.
+"""
+import random
+
+import pytest
+
+from robotans.battle import (
+    cesar_cipher, convert_to_robotan_language_v1, convert_to_robotan_language_v2,
+    convert_to_robotan_language_v3, flash_order
+)
+from robotans.battle_decoder import (
+    StreamDecoder, decode_file, decode_flash, decode_stream, decode_v1, decode_v2, decode_v3
+)
+
+ALPHABETS = {
+    "ascii": "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789     ,.;:!?'\n",
+    "français": "abcdefghijklmnopqrstuvwxyzéèàçùêôâîœ      ,.;:!?'\n",
+    "unicode": "abcdefghijklmnopqrstuvwxyzéèΩλж€“”      ,.;!?\n",
+}
+CODECS = {
+    "v1": (convert_to_robotan_language_v1, decode_v1, lambda text: cesar_cipher(text, 0)),
+    "v2": (convert_to_robotan_language_v2, decode_v2, lambda text: cesar_cipher(text, 0)),
+    "v3": (convert_to_robotan_language_v3, decode_v3, lambda text: "".join(c.upper() for c in text if c.isalpha())),
+    "flash": (flash_order, decode_flash, lambda text: text.replace(" ", "")),
+}
+TRIALS = 50
+
+
+def random_texts(alphabet, seed):
+    """Textes aléatoires de `alphabet`, dont le texte vide et de longues séries."""
+    rng = random.Random(seed)
+    yield ""
+    for _ in range(TRIALS):
+        text = "".join(rng.choices(alphabet, k=rng.randint(0, 200)))
+        yield text + rng.choice(alphabet) * rng.randint(0, 30)
+
+
+def random_chunks(text, rng, pieces=8):
+    """Découpe `text` en au plus `pieces` + 1 blocs de tailles aléatoires, blocs vides compris."""
+    cuts = sorted(rng.choices(range(len(text) + 1), k=rng.randint(0, pieces)))
+    return [text[start:end] for start, end in zip([0] + cuts, cuts + [len(text)])]
+
+
+@pytest.mark.parametrize("version", CODECS)
+@pytest.mark.parametrize("mix", ALPHABETS)
+def test_round_trip(version, mix):
+    encode, decode, normalize = CODECS[version]
+    for text in random_texts(ALPHABETS[mix], seed=f"{version}/{mix}"):
+        assert decode(encode(text)) == normalize(text), text
+
+
+@pytest.mark.parametrize("version", CODECS)
+@pytest.mark.parametrize("mix", ALPHABETS)
+def test_round_trip_streamed(version, mix):
+    encode, _, normalize = CODECS[version]
+    rng = random.Random(f"flux/{version}/{mix}")
+    for text in random_texts(ALPHABETS[mix], seed=f"{version}/{mix}"):
+        encoded = encode(text)
+        # Petits débordements sur disque pour V2, à chaque taille de bloc
+        decoder = StreamDecoder(version, spill_size=rng.randint(1, 16))
+        pieces = [decoder.feed(chunk) for chunk in random_chunks(encoded, rng)]
+        pieces.extend(decoder.finish())
+        assert "".join(pieces) == normalize(text), text
+        assert "".join(decode_stream(random_chunks(encoded, rng), version)) == normalize(text), text
+
+
+@pytest.mark.parametrize("version", CODECS)
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_round_trip_file(tmp_path, version, chunk_size):
+    encode, _, normalize = CODECS[version]
+    src, dst = tmp_path / "message.txt", tmp_path / "clair.txt"
+    for text in random_texts(ALPHABETS["unicode"], seed=f"fichier/{version}/{chunk_size}"):
+        src.write_text(encode(text), encoding="utf-8")
+        decode_file(str(src), str(dst), version, chunk_size=chunk_size)
+        assert dst.read_text(encoding="utf-8") == normalize(text), text
+
+
+def test_flash_escapes_and_runs():
+    assert decode_flash("!A3BC2!") == "AAABCC"
+    assert decode_flash(flash_order("R2D2")) == "R2D2"
+    assert "".join(decode_stream(["!A1", "2B\\", "74!"], "flash")) == "A" * 12 + "B" + "7" * 4
+
+
+def test_flash_requires_delimiters():
+    with pytest.raises(ValueError):
+        "".join(decode_stream(["!A3"], "flash"))
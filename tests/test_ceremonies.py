@@ -0,0 +1,27 @@
+"""Tests de l'index compilé des cérémonies (`robotans.ceremonies`)."""
+import pytest
+
+from robotans.ceremonies import SPECIAL_DATES, CeremonyIndex, rectitude_ceremony_index
+
+
+def test_dated_event_collides_with_the_recurring_ceremony():
+    index = CeremonyIndex([("15 Septium", "Anniversaire"), ("15 Septium, An 42", "Premier prototype")])
+    assert index.conflicts == [("15 Septium, An 42", ["Anniversaire", "Premier prototype"])]
+    assert index.get(42, 7, 15) == ("Anniversaire", "Premier prototype")
+    assert index.get(43, 7, 15) == ("Anniversaire",)
+
+
+def test_removing_a_missing_event_raises_key_error():
+    index = CeremonyIndex([("1 Ordium", "Réinitialisation"), ("1 Ordium, An 0", "Création")])
+    index.remove("1 Ordium, An 0", "Création")
+    assert index.get(0, 1, 1) == ("Réinitialisation",)
+    for key in ("1 Ordium, An 0", "1 Ordium, An 3", "2 Ordium"):
+        with pytest.raises(KeyError):
+            index.remove(key, "Création")
+
+
+def test_expected_collisions_are_left_out_of_the_report():
+    index = rectitude_ceremony_index()
+    report = index.conflict_report(expected=SPECIAL_DATES)
+    assert len(report) == len(index.conflicts) - len(SPECIAL_DATES)
+    assert not any("100e jour" in line for line in report)
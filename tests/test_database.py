@@ -0,0 +1,45 @@
+"""Tests de la base SQLite des factions, personnages et événements (`robotans.database`)."""
+import pytest
+
+from robotans.database import DuplicateNameError, LoreDatabase
+from robotans.query import EventQuery
+from robotans.recurrence import expand_events
+
+
+@pytest.fixture
+def database(tmp_path):
+    with LoreDatabase(str(tmp_path / "robotans.db")) as opened:
+        yield opened
+
+
+def test_duplicate_names_are_refused(database):
+    database.factions.add("Rectitude")
+    with pytest.raises(DuplicateNameError):
+        database.factions.add("Rectitude")
+    assert database.factions.names() == ["Rectitude"]
+
+
+def test_several_events_on_the_same_day(database):
+    database.events.add_many([
+        ("Fervor", 3, {"name": "A", "recurrence": "annuel"}),
+        ("Fervor", 3, {"name": "B", "year": 12}),
+    ])
+    events = database.events.as_dict()
+    assert events == {"Fervor": {3: [{"name": "A", "recurrence": "annuel"}, {"name": "B", "year": 12}]}}
+    # Les consommateurs du format de events.json acceptent une liste par jour
+    assert [occurrence.event["name"] for occurrence in expand_events(events, 12, 12)] == ["A", "B"]
+    assert len(list(EventQuery.from_events(events).between((0, 1, 1), (12, 12, 28)))) == 14
+
+
+def test_json_files_are_imported_only_once(database, tmp_path):
+    factions_file = tmp_path / "factions.json"
+    factions_file.write_text('["Rectitude", "Fervor"]', encoding="utf-8")
+    assert database.factions.fill_once(str(factions_file), []).names() == ["Rectitude", "Fervor"]
+    assert database.events.fill_once(str(tmp_path / "absent.json"), {"Ordium": {"1": {"name": "Nouvel An"}}})
+    for name in database.factions.names():
+        database.factions.remove(name)
+    database.events.remove(next(database.events.find())[0])
+    # Les données supprimées ne reviennent pas du fichier JSON
+    assert not len(database.factions.fill_once(str(factions_file), []))
+    assert not len(database.events.fill_once(str(tmp_path / "absent.json"), {"Ordium": {"1": {"name": "Nouvel An"}}}))
+    assert database.import_json(str(factions_file), str(tmp_path / "absent.json"), str(tmp_path / "absent.json")) == (2, 0, 0)
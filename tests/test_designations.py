@@ -0,0 +1,35 @@
+"""Tests de l'attribution des désignations Nom-NNN (`designations`)."""
+import pytest
+
+from designations import NUMBERS, DesignationAllocator, DesignationsExhausted
+
+NAMES = [f"Nom{i}" for i in range(10000)]
+
+
+def test_only_drawn_names_have_a_state():
+    allocator = DesignationAllocator(seed="robotans")
+    designations = {allocator.allocate(NAMES) for _ in range(100)}
+    designations.update(allocator.allocate_many(NAMES, 100))
+    assert len(designations) == 200
+    assert len(allocator._names) <= 200 and allocator.issued() == 200
+
+
+def test_exhausted_names_are_skipped():
+    allocator = DesignationAllocator(seed=1)
+    designations = set(allocator.allocate_many(["A", "B"], 2 * NUMBERS - 1))
+    assert allocator.allocate(["A", "B"]) not in designations
+    with pytest.raises(DesignationsExhausted):
+        allocator.allocate(["A", "B"])
+
+
+def test_the_seed_is_saved_with_the_state(tmp_path):
+    path = str(tmp_path / "designations.json")
+    allocator = DesignationAllocator(seed="robotans")
+    designations = list(allocator.allocate_many(NAMES, 10))
+    allocator.save(path)
+    loaded = DesignationAllocator.load(path)
+    assert loaded.seed == "robotans" and all(loaded.is_taken(designation) for designation in designations)
+    # Un nom jamais tiré suit la même permutation qu'avec la graine d'origine
+    assert next(loaded.allocate_many(["Zoe"], 1)) == next(DesignationAllocator(seed="robotans").allocate_many(["Zoe"], 1))
+    with pytest.raises(ValueError):
+        DesignationAllocator.load(path, seed="autre")
@@ -0,0 +1,85 @@
+"""Tests du cache de corpus de noms (`name_cache`) contre le serveur local `NameApiStub`."""
+import os
+
+from name_cache import NameCorpusCache, fallback_names
+from Robotan_Name_Generator import name_sources
+
+
+def test_bulk_fill_uses_one_request(stub, sources, tmp_path):
+    cache = NameCorpusCache(sources, cache_dir=str(tmp_path), batch_size=200)
+    names = cache.names("france", "female")
+    assert stub.requests == 1 and stub.names_served == 200
+    assert names and len(names) == len(set(names))
+    # Les appels suivants sont servis depuis la mémoire
+    for _ in range(50):
+        assert cache.names("france", "female") == names
+    assert stub.requests == 1
+    assert os.listdir(tmp_path) == ["france-female.txt.gz"]
+
+
+def test_static_lists_are_served_as_they_are(stub, sources, tmp_path):
+    cache = NameCorpusCache(sources, cache_dir=str(tmp_path))
+    assert cache.names("kabyle", "male") == name_sources["kabyle"]
+    assert stub.requests == 0
+
+
+def test_stale_corpus_is_served_then_refreshed(stub, sources, tmp_path):
+    NameCorpusCache(sources, cache_dir=str(tmp_path)).names("usa", "male")
+    path = tmp_path / "usa-male.txt.gz"
+
+    fresh = NameCorpusCache(sources, cache_dir=str(tmp_path))
+    assert fresh.names("usa", "male")
+    fresh.wait()
+    assert stub.requests == 1, "un corpus récent ne doit pas être rafraîchi"
+
+    os.utime(path, (0, 0))
+    stale = NameCorpusCache(sources, cache_dir=str(tmp_path), ttl=3600)
+    stub.gate.clear()
+    names = stale.names("usa", "male")
+    # Servi tout de suite depuis le disque, le rafraîchissement attend derrière la barrière
+    assert names and stub.requests == 1
+    stub.gate.set()
+    stale.wait()
+    assert stub.requests == 2
+    assert os.path.getmtime(path) > 0
+
+
+def test_refresh_merges_new_names_into_the_corpus(stub, sources, tmp_path):
+    cache = NameCorpusCache(sources, cache_dir=str(tmp_path), batch_size=20)
+    first = set(cache.names("japan", "male"))
+    merged = cache.refresh("japan", "male")
+    assert first <= set(merged) and len(merged) == len(set(merged))
+
+
+def test_least_recently_used_corpora_are_evicted(stub, sources, tmp_path):
+    cache = NameCorpusCache(sources, cache_dir=str(tmp_path), max_corpora=3)
+    for pair in [("france", "female"), ("usa", "male"), ("japan", "male"), ("india", "female")]:
+        cache.names(*pair)
+    assert sorted(os.listdir(tmp_path)) == ["india-female.txt.gz", "japan-male.txt.gz", "usa-male.txt.gz"]
+    assert len(cache._corpora) == 3 and ("france", "female") not in cache._corpora
+    # Le corpus évincé est redemandé à l'API
+    cache.names("france", "female")
+    assert stub.requests == 5
+
+
+def test_offline_serves_the_corpus_on_disk(stub, sources, tmp_path):
+    names = NameCorpusCache(sources, cache_dir=str(tmp_path)).names("france", "male")
+    stub.down = True
+    offline = NameCorpusCache(sources, cache_dir=str(tmp_path), ttl=0)
+    assert offline.names("france", "male") == names
+    offline.wait()
+    requests = stub.requests
+    # Le rafraîchissement a échoué : le corpus en place reste servi, sans nouvel essai avant `retry_after`
+    for _ in range(5):
+        assert offline.names("france", "male") == names
+    offline.wait()
+    assert stub.requests == requests
+    # Un corpus jamais rempli retombe sur les listes statiques
+    assert offline.names("usa", "female") == fallback_names(sources)
+    requests = stub.requests
+    # Passé ce délai, un nouvel essai part en arrière-plan
+    offline.retry_after = 0
+    stub.down = False
+    offline.names("france", "male")
+    offline.wait()
+    assert stub.requests == requests + 1 and not offline._failed